@@ -0,0 +1,121 @@
+"""
+Compares time and peak memory for handling response and request bodies
+as raw bytes, against the old path that decoded them to str first.
+
+Responses: ``etree.fromstring(body)`` straight on the bytes, against
+decoding the body (``requests``' ``r.text``), then handing lxml the str.
+lxml refuses str input with an encoding declaration, so the old path
+has to strip it, just like a caller working around it would.
+
+Requests: ``etree.tostring()`` against writing to a BytesIO and decoding
+the result, which requests then had to encode again.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_bytes_parsing
+"""
+
+import argparse
+import re
+import time
+import tracemalloc
+from io import BytesIO
+
+from lxml import etree
+
+RECORD_TEMPLATE = (
+    '<ResourceRecordSet><Name>host-%(i)d.example.com.</Name>'
+    '<Type>A</Type><TTL>300</TTL><ResourceRecords>'
+    '<ResourceRecord><Value>10.0.%(hi)d.%(lo)d</Value></ResourceRecord>'
+    '</ResourceRecords></ResourceRecordSet>'
+)
+
+DECLARATION_RE = re.compile(r'^<\?xml[^>]*\?>')
+
+
+def build_page(records):
+    """
+    :param int records: The number of record sets on the page.
+    :rtype: bytes
+    :returns: A ListResourceRecordSets response body.
+    """
+
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<ListResourceRecordSetsResponse '
+             'xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+             '<ResourceRecordSets>']
+    for i in range(records):
+        parts.append(RECORD_TEMPLATE % {'i': i, 'hi': i // 256 % 256, 'lo': i % 256})
+    parts.append('</ResourceRecordSets><IsTruncated>false</IsTruncated>'
+                 '<MaxItems>%d</MaxItems></ListResourceRecordSetsResponse>' % records)
+    return ''.join(parts).encode('utf-8')
+
+
+def parse_str(body):
+    text = body.decode('utf-8')
+    return etree.fromstring(DECLARATION_RE.sub('', text))
+
+
+def parse_bytes(body):
+    return etree.fromstring(body)
+
+
+def write_str(root):
+    fobj = BytesIO()
+    etree.ElementTree(element=root).write(
+        fobj, xml_declaration=True, encoding='utf-8', method="xml"
+    )
+    # ...and requests encodes it right back before sending.
+    return fobj.getvalue().decode('utf-8').encode('utf-8')
+
+
+def write_bytes(root):
+    return etree.tostring(
+        root, xml_declaration=True, encoding='utf-8', method="xml"
+    )
+
+
+def measure(func, arg, rounds):
+    """
+    :rtype: tuple
+    :returns: A tuple in the form of ``(seconds_per_call, peak_bytes)``.
+    """
+
+    # Warm up, so one-off allocations don't count.
+    func(arg)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(arg)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    func(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    body = build_page(args.records)
+    root = etree.fromstring(body)
+    print('page: %d record sets, %d bytes' % (args.records, len(body)))
+
+    for label, func, arg in (
+            ('parse str  ', parse_str, body),
+            ('parse bytes', parse_bytes, body),
+            ('write str  ', write_str, root),
+            ('write bytes', write_bytes, root)):
+        elapsed, peak = measure(func, arg, args.rounds)
+        print('%s: %8.2f ms/call, peak %8.1f KiB traced' % (
+            label, elapsed * 1000, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
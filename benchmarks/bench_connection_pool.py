@@ -0,0 +1,66 @@
+"""
+Compares requests per second with the pooled keep-alive transport against
+one that opens a fresh connection for every request (the old module-level
+``requests.get`` behavior).
+
+Run from the repository root::
+
+    python -m benchmarks.bench_connection_pool
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from route53.transport import RequestsTransport
+from benchmarks.stub_server import StubRoute53Server, load_response
+
+
+class UnpooledRequestsTransport(RequestsTransport):
+    """
+    Sends every request through the module-level requests functions, so no
+    connection is ever re-used.
+    """
+
+    def _send_get_request(self, path, params, headers):
+        r = requests.get(self.endpoint + path, params=params, headers=headers)
+        r.raise_for_status()
+        return r.text
+
+
+def run(conn, total_requests, threads):
+    def _work(_):
+        # Straight to the transport, we're only measuring HTTP overhead here.
+        conn._transport.send_request('hostedzone/Z1', {}, 'GET')
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(_work, range(total_requests)))
+    return total_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    body = load_response('GetHostedZoneResponse.xml')
+    server = StubRoute53Server().start()
+    server.add_route('GET', r'hostedzone/[^/]+$', lambda m, q, b: (200, body))
+
+    try:
+        unpooled = server.connect(transport_class=UnpooledRequestsTransport)
+        pooled = server.connect(pool_size=args.threads)
+        pooled._transport.prewarm(args.threads)
+
+        print('unpooled: %8.1f req/s' % run(unpooled, args.requests, args.threads))
+        print('pooled:   %8.1f req/s' % run(pooled, args.requests, args.threads))
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
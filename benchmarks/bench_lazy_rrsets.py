@@ -0,0 +1,65 @@
+"""
+Times a scan that only looks at each record set's name and type, with the
+record sets fully parsed up front against lazily parsed ones. Also times
+a scan that touches every field, to show what laziness costs when it
+doesn't pay off.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_lazy_rrsets
+"""
+
+import argparse
+import gc
+import time
+
+from benchmarks.bench_tag_dispatch import RRSET_TEMPLATES, build_root
+from route53.xml_parsers.list_resource_record_sets_by_zone_id import (
+    list_resource_record_sets_by_zone_id_parser,
+)
+
+
+def scan_names(rrsets):
+    for rrset in rrsets:
+        rrset.name, rrset.rrset_type
+
+
+def scan_everything(rrsets):
+    for rrset in rrsets:
+        rrset.name, rrset.rrset_type, rrset.ttl, rrset.records
+
+
+def measure(root, lazy, scan, rounds):
+    best = None
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            scan(list_resource_record_sets_by_zone_id_parser(
+                root, connection=None, zone_id='Z1', lazy=lazy
+            ))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    root = build_root(RRSET_TEMPLATES, 'ResourceRecordSets', args.records)
+
+    for label, scan in (('name/type only', scan_names),
+                        ('every field', scan_everything)):
+        eager = measure(root, False, scan, args.rounds)
+        lazy = measure(root, True, scan, args.rounds)
+        print('%-15s eager %7.1f ms, lazy %7.1f ms (%.2fx)' % (
+            label + ':', eager * 1000, lazy * 1000, eager / lazy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Reports the memory held per ResourceRecordSet, HostedZone and HealthCheck
+instance, as traced by tracemalloc. The __slots__-based classes are
+compared against copies of the previous dict-based ones, which also kept
+a second dict of initial values on every record set.
+
+The field values themselves are built up front and shared by both runs,
+so only the per-object overhead is counted.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_model_memory
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from route53.health_check import HealthCheck
+from route53.hosted_zone import HostedZone
+from route53.resource_record_set import AResourceRecordSet
+
+
+class LegacyResourceRecordSet(object):
+    """
+    ResourceRecordSet.__init__ as it was before __slots__.
+    """
+
+    def __init__(self, connection, zone_id, name, ttl, records, weight=None,
+                 region=None, set_identifier=None, health_check=None, failover=None):
+        self.connection = connection
+        self.zone_id = zone_id
+        self.name = name
+        self.ttl = int(ttl) if ttl else None
+        self.records = records
+        self.region = region
+        self.weight = weight
+        self.health_check = health_check
+        self.set_identifier = set_identifier
+        self._initial_vals = dict(
+            connection=connection,
+            zone_id=zone_id,
+            name=name,
+            ttl=ttl,
+            records=records,
+            region=region,
+            weight=weight,
+            health_check=health_check,
+            set_identifier=set_identifier,
+        )
+
+
+class LegacyAResourceRecordSet(LegacyResourceRecordSet):
+
+    def __init__(self, alias_hosted_zone_id=None, alias_dns_name=None, *args, **kwargs):
+        super(LegacyAResourceRecordSet, self).__init__(*args, **kwargs)
+        self.alias_hosted_zone_id = alias_hosted_zone_id
+        self.alias_dns_name = alias_dns_name
+        self._initial_vals.update(
+            dict(
+                alias_hosted_zone_id=alias_hosted_zone_id,
+                alias_dns_name=alias_dns_name,
+            )
+        )
+
+
+class LegacyHostedZone(object):
+
+    def __init__(self, connection, id, name, caller_reference,
+                 resource_record_set_count, comment):
+        self.connection = connection
+        self.id = id
+        self.name = name
+        self.caller_reference = caller_reference
+        self.resource_record_set_count = int(resource_record_set_count)
+        self.comment = comment
+        self._nameservers = []
+        self._is_deleted = False
+
+
+class LegacyHealthCheck(object):
+
+    def __init__(self, connection, id, caller_reference, ipaddress, port, type,
+                 resource_path, fqdn, search_string=None, health_check_version=1):
+        self.connection = connection
+        self.id = id
+        self.caller_reference = caller_reference
+        self.ipaddress = ipaddress
+        self.port = int(port)
+        self.type = type
+        self.resource_path = resource_path
+        self.fqdn = fqdn
+        self.search_string = search_string
+        self._is_deleted = False
+
+
+def rrset_kwargs(count):
+    return [
+        dict(connection=None, zone_id='Z1', name='host-%d.example.com.' % i,
+             ttl='300', records=['10.0.%d.%d' % (i // 256 % 256, i % 256)])
+        for i in range(count)
+    ]
+
+
+def zone_kwargs(count):
+    return [
+        dict(connection=None, id='Z%d' % i, name='zone-%d.com.' % i,
+             caller_reference='ref-%d' % i, resource_record_set_count='2',
+             comment=None)
+        for i in range(count)
+    ]
+
+
+def health_check_kwargs(count):
+    return [
+        dict(connection=None, id='hc-%d' % i, caller_reference='ref-%d' % i,
+             ipaddress='10.0.0.1', port='80', type='HTTP',
+             resource_path='/', fqdn='www.example.com')
+        for i in range(count)
+    ]
+
+
+def bytes_per_object(cls, kwargs_list):
+    """
+    :rtype: float
+    :returns: The traced bytes still held per instance, once they've all
+        been built.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(**kwargs) for kwargs in kwargs_list]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding them.
+    held = after - before - objects.__sizeof__()
+    return held / float(len(objects))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    cases = (
+        ('ResourceRecordSet', LegacyAResourceRecordSet, AResourceRecordSet,
+         rrset_kwargs(args.count)),
+        ('HostedZone', LegacyHostedZone, HostedZone, zone_kwargs(args.count)),
+        ('HealthCheck', LegacyHealthCheck, HealthCheck,
+         health_check_kwargs(args.count)),
+    )
+
+    for label, legacy_cls, cls, kwargs_list in cases:
+        before = bytes_per_object(legacy_cls, kwargs_list)
+        after = bytes_per_object(cls, kwargs_list)
+        print('%-18s before %6.0f B/object, after %6.0f B/object (%.0f%% less)' % (
+            label + ':', before, after, 100 * (1 - after / before)))
+
+
+if __name__ == '__main__':
+    main()
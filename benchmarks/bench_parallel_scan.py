@@ -0,0 +1,109 @@
+"""
+Compares listing a large zone page after page (HostedZone.record_sets)
+against HostedZone.scan_record_sets(), which lists several spans of the
+zone side by side.
+
+The stub server answers listings from a made up zone, starting wherever
+the ``name`` param says, and sleeps for ``--latency`` milliseconds per
+page to stand in for the round trip to Amazon.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parallel_scan
+"""
+
+import argparse
+import bisect
+import random
+import string
+import time
+from urllib.parse import parse_qs
+
+from benchmarks.stub_server import StubRoute53Server
+from route53.hosted_zone import HostedZone
+from route53.util import record_name_sort_key
+
+RRSET_TEMPLATE = (
+    '<ResourceRecordSet><Name>%s</Name><Type>A</Type><TTL>300</TTL>'
+    '<ResourceRecords><ResourceRecord><Value>10.0.0.1</Value></ResourceRecord>'
+    '</ResourceRecords></ResourceRecordSet>'
+)
+
+
+def build_zone(records):
+    """
+    :rtype: list
+    :returns: ``records`` random names, sorted the way the API lists them.
+    """
+
+    rand = random.Random(0)
+    names = set()
+    while len(names) < records:
+        label = ''.join(rand.choice(string.ascii_lowercase) for _ in range(8))
+        names.add('%s.example.com.' % label)
+    return sorted(names, key=record_name_sort_key)
+
+
+def make_handler(names, latency):
+    keys = [record_name_sort_key(name) for name in names]
+
+    def handler(match, query, body):
+        params = parse_qs(query)
+        start = 0
+        if 'name' in params:
+            start = bisect.bisect_left(keys, record_name_sort_key(params['name'][0]))
+        end = start + int(params['maxitems'][0])
+
+        marker = ''
+        if end < len(names):
+            marker = ('<NextRecordName>%s</NextRecordName>'
+                      '<NextRecordType>A</NextRecordType>' % names[end])
+        time.sleep(latency)
+        return 200, (
+            '<ListResourceRecordSetsResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<ResourceRecordSets>%s</ResourceRecordSets>%s</ListResourceRecordSetsResponse>' % (
+                ''.join(RRSET_TEMPLATE % name for name in names[start:end]), marker)
+        ).encode('utf-8')
+
+    return handler
+
+
+def timed(records):
+    start = time.perf_counter()
+    count = sum(1 for _ in records)
+    return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--latency', type=float, default=20,
+                        help='Milliseconds per page.')
+    parser.add_argument('--partitions', type=int, default=8)
+    args = parser.parse_args()
+
+    names = build_zone(args.records)
+    server = StubRoute53Server().start()
+    server.add_route('GET', r'hostedzone/[^/]+/rrset$',
+                     make_handler(names, args.latency / 1000.0))
+
+    try:
+        conn = server.connect(pool_size=args.partitions)
+        zone = HostedZone(conn, 'Z1', 'example.com.', 'ref', len(names), None)
+
+        for label, records in (
+                ('serial', zone.record_sets),
+                ('scan, ordered', zone.scan_record_sets(partitions=args.partitions)),
+                ('scan, unordered', zone.scan_record_sets(
+                    partitions=args.partitions, ordered=False))):
+            before = server.request_count
+            count, elapsed = timed(records)
+            print('%-16s %d rrsets in %7.1f ms, %d requests' % (
+                label + ':', count, elapsed * 1000, server.request_count - before))
+        conn.close()
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Compares listing record sets as ResourceRecordSet instances (the default)
+against listing them as plain RawResourceRecordSet tuples (``raw=True``).
+
+Reports records parsed per second, and the memory still held per record,
+as traced by tracemalloc, once they've all been listed into a list. The
+page is parsed into a tree up front, so neither the HTTP round trip nor
+lxml's own parsing is counted.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_raw_rrsets
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.bench_tag_dispatch import RRSET_TEMPLATES, build_root
+from route53.xml_parsers import list_resource_record_sets_by_zone_id_parser
+
+
+def list_all(e_root, raw):
+    return list(list_resource_record_sets_by_zone_id_parser(
+        e_root, connection=None, zone_id='Z1', raw=raw,
+    ))
+
+
+def records_per_second(e_root, raw, rounds):
+    """
+    :rtype: float
+    :returns: The best rate over ``rounds`` runs.
+    """
+
+    best = None
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            count = len(list_all(e_root, raw))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return count / best
+
+
+def bytes_per_record(e_root, raw):
+    """
+    :rtype: float
+    :returns: The traced bytes still held per record, once listed.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = list_all(e_root, raw)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding them.
+    held = after - before - records.__sizeof__()
+    return held / float(len(records))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    e_root = build_root(RRSET_TEMPLATES, 'ResourceRecordSets', args.records)
+
+    results = []
+    for label, raw in (('objects', False), ('raw', True)):
+        rate = records_per_second(e_root, raw, args.rounds)
+        held = bytes_per_record(e_root, raw)
+        results.append((rate, held))
+        print('%-8s %10.0f records/s, %6.0f B/record' % (label + ':', rate, held))
+
+    (object_rate, object_held), (raw_rate, raw_held) = results
+    print('raw is %.2fx as fast, and holds %.0f%% less per record' % (
+        raw_rate / object_rate, 100 * (1 - raw_held / object_held)))
+
+
+if __name__ == '__main__':
+    main()
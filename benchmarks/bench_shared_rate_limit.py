@@ -0,0 +1,120 @@
+"""
+Runs several worker processes against a stub server that enforces a
+Route53-style account quota, answering anything over it with a Throttling
+error. With a per-process TokenBucket each worker stays under the quota on
+its own, but together they blow through it. With a FileTokenBucket shared
+by all workers, aggregate throughput holds at the quota with no throttles.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_shared_rate_limit
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from route53.exceptions import ThrottlingError
+from route53.rate_limit import TokenBucket, FileTokenBucket
+from route53.retry import RetryPolicy
+from benchmarks.stub_server import StubRoute53Server, load_response
+
+THROTTLED = (
+    b'<ErrorResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+    b'<Error><Type>Sender</Type><Code>Throttling</Code>'
+    b'<Message>Rate exceeded</Message></Error>'
+    b'<RequestId>stub</RequestId></ErrorResponse>'
+)
+
+
+def worker(endpoint_version, endpoint, limiter_kind, quota, path, start_at, duration, results):
+
+    if limiter_kind == 'shared':
+        limiter = FileTokenBucket(path, rate=quota, burst=1)
+    else:
+        limiter = TokenBucket(rate=quota, burst=1)
+
+    import route53
+    conn = route53.connect(
+        aws_access_key_id='BENCHMARK',
+        aws_secret_access_key='BENCHMARK',
+        endpoint_version=endpoint_version,
+        rate_limiter=limiter,
+        # Count throttles instead of hiding them behind retries.
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    conn._endpoint = endpoint
+
+    ok = throttled = 0
+    # All workers start together, once they've all been spawned.
+    time.sleep(max(0, start_at - time.time()))
+    stop_at = start_at + duration
+    while time.time() < stop_at:
+        try:
+            conn._transport.send_request('hostedzone/Z1', {}, 'GET')
+            ok += 1
+        except ThrottlingError:
+            throttled += 1
+    # Requests queued up on the limiter may finish a little past stop_at.
+    results.put((ok, throttled, time.time()))
+
+
+def run(server, limiter_kind, processes, quota, duration):
+    path = os.path.join(tempfile.mkdtemp(), 'route53-bucket')
+    results = multiprocessing.Queue()
+    start_at = time.time() + 2
+    workers = [
+        multiprocessing.Process(
+            target=worker,
+            args=(server.endpoint_version, server.endpoint, limiter_kind,
+                  quota, path, start_at, duration, results),
+        )
+        for _ in range(processes)
+    ]
+    for proc in workers:
+        proc.start()
+    totals = [results.get() for _ in workers]
+    for proc in workers:
+        proc.join()
+
+    ok = sum(total[0] for total in totals)
+    throttled = sum(total[1] for total in totals)
+    elapsed = max(total[2] for total in totals) - start_at
+    print('%-10s %6.1f req/s ok, %5d throttled' % (limiter_kind, ok / elapsed, throttled))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--processes', type=int, default=16)
+    parser.add_argument('--quota', type=float, default=5)
+    parser.add_argument('--duration', type=float, default=5)
+    args = parser.parse_args()
+
+    body = load_response('GetHostedZoneResponse.xml')
+    # The server allows a little slack over the quota, like AWS does.
+    server_bucket = TokenBucket(rate=args.quota, burst=args.quota)
+    lock = threading.Lock()
+
+    def get_zone(match, query, request_body):
+        with lock:
+            if server_bucket.reserve() > 0:
+                # Hand the token back, this request is being refused.
+                server_bucket.reserve(-1)
+                return 400, THROTTLED
+        return 200, body
+
+    server = StubRoute53Server().start()
+    server.add_route('GET', r'hostedzone/[^/]+$', get_zone)
+    try:
+        print('%d processes, quota %.1f req/s' % (args.processes, args.quota))
+        run(server, 'local', args.processes, args.quota, args.duration)
+        run(server, 'shared', args.processes, args.quota, args.duration)
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares listing one large ListResourceRecordSets page the buffered way
+(whole body read, then parsed into a tree) against the streaming parser,
+which yields record sets as the body comes in.
+
+Reports the time until the first record set is yielded, the total time,
+and the peak memory traced by tracemalloc while listing.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_streaming_rrsets
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.bench_bytes_parsing import build_page
+from benchmarks.stub_server import StubRoute53Server
+
+
+def run(conn, stream):
+    """
+    :rtype: tuple
+    :returns: A tuple in the form of
+        ``(seconds_to_first, seconds_total, peak_bytes, count)``.
+    """
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in conn._list_resource_record_sets_by_zone_id('Z1', stream=stream):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=20000)
+    args = parser.parse_args()
+
+    body = build_page(args.records)
+    server = StubRoute53Server().start()
+    server.add_route('GET', r'hostedzone/[^/]+/rrset$', lambda m, q, b: (200, body))
+
+    try:
+        conn = server.connect()
+        # Warm up the pool, so both runs start on an open connection.
+        run(conn, False)
+
+        for label, stream in (('buffered', False), ('streamed', True)):
+            first, total, peak, count = run(conn, stream)
+            print('%s: %d rrsets, first after %7.2f ms, total %7.2f ms, '
+                  'peak %8.1f KiB traced' % (
+                      label, count, first * 1000, total * 1000, peak / 1024.0))
+        conn.close()
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
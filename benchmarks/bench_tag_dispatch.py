@@ -0,0 +1,206 @@
+"""
+Compares the parsers, which dispatch child tags through qualified tag
+tables, against the previous implementations, which stripped the namespace
+off of every tag, walked an if/elif chain, and looked nested values up
+with ``find('./{*}...')``.
+
+The page is a mix of plain, weighted and alias record sets. Each parser is
+timed twice: end to end, and with object construction swapped out for a
+plain ``dict``, to isolate the cost of picking the XML apart.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_tag_dispatch
+"""
+
+import argparse
+import gc
+import time
+
+from lxml import etree
+
+from route53.xml_parsers import common_health_check
+from route53.xml_parsers.common_health_check import (
+    HEALTH_CHECK_TAG_TO_KWARG_MAP, parse_health_check,
+)
+from route53.xml_parsers.list_resource_record_sets_by_zone_id import (
+    RRSET_TAG_TO_KWARG_MAP, RRSET_TYPE_TO_RSET_SUBCLASS_MAP, parse_rrset,
+)
+
+NAMESPACE = 'https://route53.amazonaws.com/doc/2013-04-01/'
+
+RRSET_TEMPLATES = (
+    '<ResourceRecordSet><Name>host-%(i)d.example.com.</Name><Type>A</Type>'
+    '<TTL>300</TTL><ResourceRecords>'
+    '<ResourceRecord><Value>10.0.0.1</Value></ResourceRecord>'
+    '<ResourceRecord><Value>10.0.0.2</Value></ResourceRecord>'
+    '</ResourceRecords></ResourceRecordSet>',
+
+    '<ResourceRecordSet><Name>weighted-%(i)d.example.com.</Name>'
+    '<Type>CNAME</Type><SetIdentifier>primary</SetIdentifier>'
+    '<Weight>10</Weight><TTL>60</TTL><ResourceRecords>'
+    '<ResourceRecord><Value>primary.example.com.</Value></ResourceRecord>'
+    '</ResourceRecords></ResourceRecordSet>',
+
+    '<ResourceRecordSet><Name>alias-%(i)d.example.com.</Name><Type>A</Type>'
+    '<AliasTarget><HostedZoneId>Z2FDTNDATAQYW2</HostedZoneId>'
+    '<DNSName>lb.example.com.</DNSName></AliasTarget></ResourceRecordSet>',
+)
+
+HEALTH_CHECK_TEMPLATE = (
+    '<HealthCheck><Id>hc-%(i)d</Id><CallerReference>ref-%(i)d</CallerReference>'
+    '<HealthCheckConfig><IPAddress>10.0.0.1</IPAddress><Port>80</Port>'
+    '<Type>HTTP_STR_MATCH</Type><ResourcePath>/status</ResourcePath>'
+    '<FullyQualifiedDomainName>www.example.com</FullyQualifiedDomainName>'
+    '<SearchString>OK</SearchString></HealthCheckConfig>'
+    '<HealthCheckVersion>1</HealthCheckVersion></HealthCheck>'
+)
+
+
+def legacy_parse_rrset(e_rrset, connection, zone_id):
+    """
+    parse_rrset as it was before the dispatch tables.
+    """
+
+    kwargs = {
+        'connection': connection,
+        'zone_id': zone_id,
+    }
+    rrset_type = None
+
+    for e_field in e_rrset:
+        tag_name = e_field.tag.split('}')[1]
+        field_text = e_field.text
+
+        if tag_name == 'Type':
+            rrset_type = field_text
+            continue
+        elif tag_name == 'AliasTarget':
+            kwargs['alias_hosted_zone_id'] = e_field.find('./{*}HostedZoneId').text
+            kwargs['alias_dns_name'] = e_field.find('./{*}DNSName').text
+            kwargs['ttl'] = None
+            continue
+        elif tag_name == 'ResourceRecords':
+            records = []
+            for e_record in e_field:
+                for e_value in e_record:
+                    records.append(e_value.text)
+            kwargs['records'] = records
+            continue
+
+        kwargs[RRSET_TAG_TO_KWARG_MAP[tag_name]] = field_text
+
+    if 'records' not in kwargs:
+        kwargs['records'] = []
+
+    return RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset_type](**kwargs)
+
+
+def legacy_parse_health_check(e_healthcheck, connection):
+    """
+    parse_health_check as it was before the dispatch tables.
+    """
+
+    kwargs = {}
+    for e_field in e_healthcheck:
+        tag_name = e_field.tag.split('}')[1]
+        field_text = e_field.text
+
+        if tag_name == 'HealthCheckConfig':
+            for kw_name, sub_tag in (
+                    ('ipaddress', 'IPAddress'), ('port', 'Port'),
+                    ('type', 'Type'), ('resource_path', 'ResourcePath'),
+                    ('fqdn', 'FullyQualifiedDomainName'),
+                    ('search_string', 'SearchString')):
+                e_sub = e_field.find('./{*}' + sub_tag)
+                kwargs[kw_name] = e_sub.text if e_sub is not None else None
+            continue
+
+        kwargs[HEALTH_CHECK_TAG_TO_KWARG_MAP[tag_name]] = field_text
+
+    return common_health_check.HealthCheck(connection, **kwargs)
+
+
+def build_root(template_list, container, count):
+    parts = ['<Response xmlns="%s"><%s>' % (NAMESPACE, container)]
+    for i in range(count):
+        parts.append(template_list[i % len(template_list)] % {'i': i})
+    parts.append('</%s></Response>' % container)
+    return etree.fromstring(''.join(parts).encode('utf-8'))
+
+
+class constructors_stubbed(object):
+    """
+    Swaps the model classes out for ``dict``, so only the parsing is timed.
+    """
+
+    def __enter__(self):
+        self.rrset_map = dict(RRSET_TYPE_TO_RSET_SUBCLASS_MAP)
+        for key in RRSET_TYPE_TO_RSET_SUBCLASS_MAP:
+            RRSET_TYPE_TO_RSET_SUBCLASS_MAP[key] = dict
+        self.health_check = common_health_check.HealthCheck
+        common_health_check.HealthCheck = lambda connection, **kwargs: kwargs
+
+    def __exit__(self, *exc_info):
+        RRSET_TYPE_TO_RSET_SUBCLASS_MAP.update(self.rrset_map)
+        common_health_check.HealthCheck = self.health_check
+
+
+def measure(parse, elements, rounds):
+    """
+    :rtype: float
+    :returns: The best time, in seconds, to parse all of ``elements``.
+    """
+
+    best = None
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for element in elements:
+                parse(element)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best
+
+
+def report(label, legacy, dispatch, count):
+    print('%-36s if/elif %7.1f ms, dispatch %7.1f ms, speedup %5.2fx' % (
+        '%s (%d):' % (label, count), legacy * 1000, dispatch * 1000,
+        legacy / dispatch))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    e_rrsets = list(build_root(RRSET_TEMPLATES, 'ResourceRecordSets', args.records)[0])
+    e_checks = list(build_root((HEALTH_CHECK_TEMPLATE,), 'HealthChecks', args.records)[0])
+
+    cases = (
+        ('rrsets',
+         lambda e: legacy_parse_rrset(e, None, 'Z1'),
+         lambda e: parse_rrset(e, None, 'Z1'),
+         e_rrsets),
+        ('health checks',
+         lambda e: legacy_parse_health_check(e, None),
+         lambda e: parse_health_check(e, None),
+         e_checks),
+    )
+
+    for label, legacy, dispatch, elements in cases:
+        report(label, measure(legacy, elements, args.rounds),
+               measure(dispatch, elements, args.rounds), len(elements))
+
+    with constructors_stubbed():
+        for label, legacy, dispatch, elements in cases:
+            report(label + ', parse only', measure(legacy, elements, args.rounds),
+                   measure(dispatch, elements, args.rounds), len(elements))
+
+
+if __name__ == '__main__':
+    main()
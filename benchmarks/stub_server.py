@@ -0,0 +1,129 @@
+"""
+A tiny threaded HTTP server that pretends to be the Route53 API. The
+benchmarks in this directory point a connection at it, so they measure
+python-route53 itself rather than Amazon's network.
+"""
+
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import route53
+
+RESPONSES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'tests', 'responses',
+)
+
+def load_response(response_file, **kwargs):
+    """
+    Loads one of the canned API responses used by the unit tests.
+
+    :param str response_file: The file name, within ``tests/responses``.
+    :rtype: bytes
+    :returns: The response body, with any ``%(key)s`` placeholders filled in
+        from ``kwargs``.
+    """
+
+    with open(os.path.join(RESPONSES_DIR, response_file), 'r') as fobj:
+        return (fobj.read() % kwargs).encode('utf-8')
+
+
+class StubRoute53Server(object):
+    """
+    Serves canned responses on a local port. Routes are registered with
+    :py:meth:`add_route`, and are matched against the request method and
+    the path that follows the API version.
+    """
+
+    def __init__(self, endpoint_version='2013-04-01'):
+        self.endpoint_version = endpoint_version
+        self.routes = []
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 lets clients keep the connection open between requests.
+            protocol_version = 'HTTP/1.1'
+            # Otherwise headers and body sit in separate segments, waiting
+            # on delayed ACKs from the client.
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, response_body = stub.handle(self.command, self.path, body)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/xml')
+                self.send_header('Content-Length', str(len(response_body)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(response_body)
+
+            do_GET = do_POST = do_DELETE = do_HEAD = _dispatch
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address
+        return 'http://%s:%s/%s/' % (host, port, self.endpoint_version)
+
+    def add_route(self, method, path_regex, handler):
+        """
+        :param str method: 'GET', 'POST', or 'DELETE'.
+        :param str path_regex: Matched against the path after the version,
+            without the query string.
+        :param callable handler: Called as ``handler(match, query, body)``
+            and returns a ``(status, body_bytes)`` tuple.
+        """
+
+        self.routes.append((method, re.compile(path_regex), handler))
+
+    def handle(self, method, raw_path, body):
+        with self._lock:
+            self.request_count += 1
+
+        path, _, query = raw_path.partition('?')
+        prefix = '/%s/' % self.endpoint_version
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+
+        for route_method, regex, handler in self.routes:
+            match = regex.match(path)
+            if route_method == method and match:
+                return handler(match, query, body)
+
+        return 404, b'<?xml version="1.0"?><ErrorResponse/>'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def connect(self, **kwargs):
+        """
+        Returns a connection that sends its requests to this stub server.
+        """
+
+        conn = route53.connect(
+            aws_access_key_id='BENCHMARK',
+            aws_secret_access_key='BENCHMARK',
+            endpoint_version=self.endpoint_version,
+            **kwargs
+        )
+        conn._endpoint = self.endpoint
+        return conn
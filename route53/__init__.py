@@ -16,12 +16,35 @@ def connect(aws_access_key_id=None, aws_secret_access_key=None, **kwargs):
 
     :keyword str aws_access_key_id: Your AWS Access Key ID
     :keyword str aws_secret_access_key: Your AWS Secret Access Key
+    :keyword int pool_size: The maximum number of keep-alive HTTP connections
+        to hold open to the endpoint.
+    :keyword bool keep_alive: Set to ``False`` to close HTTP connections after
+        each request.
+    :keyword int prewarm: The number of pooled HTTP connections to open before
+        this function returns.
+    :keyword float rate_limit: Caps the requests per second sent over the
+        connection, shared by all threads using it.
+    :keyword int rate_limit_burst: How many requests may be sent back to back
+        before ``rate_limit`` applies.
+    :keyword bool stream_record_sets: Parse record set listings as they
+        stream in, rather than a whole page at a time.
+    :keyword float cache_ttl: Cache zone, record set and health check
+        lookups for this many seconds. Writes through the connection drop
+        what they affect.
+    :keyword int cache_max_entries: The most responses to cache at once.
+    :keyword bool coalesce_requests: Set to ``False`` to stop identical GET
+        requests that are in flight at the same time from sharing one.
+
+    :keyword connectionClass: Pass
+        :py:class:`route53.async_connection.AsyncRoute53Connection` to get an
+        asyncio connection instead.
 
     :rtype: :py:class:`route53.connection.Route53Connection`
     :return: A connection to Amazon's Route 53
     """
 
-    if 'connectionClass' not in kwargs or kwargs['connectionClass'] is None:
+    connectionClass = kwargs.pop('connectionClass', None)
+    if connectionClass is None:
         from route53.connection import Route53Connection
         connectionClass = Route53Connection
 
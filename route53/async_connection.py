@@ -0,0 +1,485 @@
+"""
+An asyncio flavor of :py:class:`Route53Connection <route53.connection.Route53Connection>`.
+Every API call is a coroutine, and the listing calls are async generators,
+so many zones can be queried concurrently on a single event loop.
+"""
+
+import asyncio
+
+from route53 import xml_parsers, xml_generators
+from route53.async_transport import AiohttpTransport
+from route53.change_info import get_change_id
+from route53.concurrency import AsyncSingleFlight, async_read_ahead
+from route53.connection import Route53Connection
+from route53.harvest import CRASHED, HarvestTracker, aiter_zone_events
+from route53.util import request_key
+from route53.xml_parsers.common_change_info import parse_change_info
+from route53.xml_parsers.common_error import parse_error
+
+class AsyncRoute53Connection(Route53Connection):
+    """
+    Works just like :py:class:`Route53Connection <route53.connection.Route53Connection>`,
+    except that:
+
+    * :py:meth:`list_hosted_zones`, :py:meth:`list_health_checks` and
+      :py:attr:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`
+      return async generators, to be used with ``async for``.
+    * The create, get and delete methods are coroutines, to be awaited.
+    * The ``delete()`` methods on the returned
+      :py:class:`HostedZone <route53.hosted_zone.HostedZone>`,
+      :py:class:`HealthCheck <route53.health_check.HealthCheck>` and
+      record set objects return awaitables.
+
+    The blocking conveniences that issue several requests behind the scenes
+    (lazy :py:attr:`HostedZone.nameservers <route53.hosted_zone.HostedZone.nameservers>`,
+    ``HostedZone.delete(force=True)``, ``HostedZone.create_*_record``,
+    ``HostedZone.batch()``, ``HostedZone.change_buffer()``,
+    ``HostedZone.sync()``, ``ResourceRecordSet.save()`` and
+    ``ChangeInfo.wait_until_insync()``) are not supported. Go through the
+    coroutines on this class instead.
+
+    Use it as an async context manager, so that the HTTP session is closed
+    when you're done::
+
+        async with AsyncRoute53Connection(key_id, secret) as conn:
+            async for zone in conn.list_hosted_zones():
+                print(zone)
+    """
+
+    default_transport_class = AiohttpTransport
+    """The transport used if no ``transport_class`` kwarg is given."""
+
+    single_flight_class = AsyncSingleFlight
+    """Shares identical GET requests that are in flight at the same time."""
+
+    def __init__(self, aws_access_key_id, aws_secret_access_key, prewarm=0, **kwargs):
+        """
+        :param str aws_access_key_id: An account's access key ID.
+        :param str aws_secret_access_key: An account's secret access key.
+        :keyword int prewarm: The number of pooled connections to open when
+            entering the connection's ``async with`` block.
+
+        See :py:class:`Route53Connection <route53.connection.Route53Connection>`
+        for the other keyword arguments.
+        """
+
+        # Pre-warming has to wait for a running event loop.
+        super(AsyncRoute53Connection, self).__init__(
+            aws_access_key_id, aws_secret_access_key, prewarm=0, **kwargs
+        )
+        self._prewarm = prewarm
+
+    async def __aenter__(self):
+        if self._prewarm:
+            await self._transport.prewarm(self._prewarm)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the transport's HTTP session and its pooled connections.
+        """
+
+        await self._transport.close()
+
+    async def _send_request(self, path, data, method):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection._send_request <route53.connection.Route53Connection._send_request>`.
+
+        :rtype: lxml.etree._Element
+        :returns: An lxml Element root.
+        """
+
+        cache_key, generation, root = self._check_cache(path, data, method)
+        if root is not None:
+            return root
+
+        if self._single_flight is not None and method == 'GET':
+            root = await self._single_flight.do(
+                request_key(path, data),
+                lambda: self._send_uncached_request(path, data, method)
+            )
+        else:
+            root = await self._send_uncached_request(path, data, method)
+        self._fill_cache(cache_key, generation, root)
+        return root
+
+    async def _send_uncached_request(self, path, data, method):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection._send_uncached_request <route53.connection.Route53Connection._send_uncached_request>`.
+
+        :rtype: lxml.etree._Element
+        :returns: An lxml Element root.
+        """
+
+        try:
+            response_body = await self._transport.send_request(path, data, method)
+        finally:
+            self._invalidate_cache(path, method)
+        return self._parse_response_body(response_body)
+
+    async def _iter_pages(self, path, params, method, next_marker_xpath,
+                          next_marker_param_name, next_type_xpath=None):
+        """
+        Async generator counterpart of
+        :py:meth:`Route53Connection._iter_pages <route53.connection.Route53Connection._iter_pages>`.
+
+        :rtype: async generator
+        :returns: An async generator of lxml Element roots, one per page.
+        """
+
+        params = dict(params)
+
+        while True:
+            root = await self._send_request(path, params, method)
+
+            next_params = self._get_next_page_params(
+                root, params,
+                next_marker_xpath, next_marker_param_name, next_type_xpath
+            )
+            yield root
+
+            if next_params is None:
+                break
+            params = next_params
+
+    async def _do_autopaginating_api_call(self, path, params, method, parser_func,
+        next_marker_xpath, next_marker_param_name,
+        next_type_xpath=None, parser_kwargs=None, prefetch=None):
+        """
+        Async generator counterpart of
+        :py:meth:`Route53Connection._do_autopaginating_api_call <route53.connection.Route53Connection._do_autopaginating_api_call>`.
+        Takes the same arguments.
+
+        :rtype: async generator
+        :returns: Returns an async generator that may be returned by the
+            top-level API method.
+        """
+
+        if not parser_kwargs:
+            parser_kwargs = {}
+
+        if prefetch is None:
+            prefetch = self._prefetch_pages
+
+        pages = self._iter_pages(
+            path, params, method,
+            next_marker_xpath, next_marker_param_name, next_type_xpath
+        )
+        if prefetch:
+            pages = async_read_ahead(pages, prefetch)
+
+        async for root in pages:
+            for record in parser_func(root, connection=self, **parser_kwargs):
+                yield record
+
+    async def _do_streaming_api_call(self, path, params, method, stream_parser_class,
+        next_marker_xpath, next_marker_param_name,
+        next_type_xpath=None, parser_kwargs=None):
+        """
+        Async generator counterpart of
+        :py:meth:`Route53Connection._do_streaming_api_call <route53.connection.Route53Connection._do_streaming_api_call>`.
+        Takes the same arguments.
+
+        :rtype: async generator
+        :returns: Returns an async generator that may be returned by the
+            top-level API method.
+        """
+
+        if not parser_kwargs:
+            parser_kwargs = {}
+
+        params = dict(params)
+
+        while True:
+            parser = stream_parser_class(connection=self, **parser_kwargs)
+            chunks = await self._transport.send_streaming_request(
+                path, params, method
+            )
+            try:
+                async for chunk in chunks:
+                    for record in parser.feed(chunk):
+                        yield record
+            finally:
+                if hasattr(chunks, 'aclose'):
+                    await chunks.aclose()
+            root = parser.close()
+
+            params = self._get_next_page_params(
+                root, params,
+                next_marker_xpath, next_marker_param_name, next_type_xpath
+            )
+            if params is None:
+                break
+
+    async def harvest_record_sets(self, zones, max_workers=None,
+                                  on_progress=None, on_error=None,
+                                  lazy=False, raw=False, page_chunks=100):
+        """
+        Async generator counterpart of
+        :py:meth:`Route53Connection.harvest_record_sets <route53.connection.Route53Connection.harvest_record_sets>`.
+        Takes the same arguments, with up to ``max_workers`` zones listed
+        concurrently on the event loop. ``zones`` may also be an async
+        iterable, like :py:meth:`list_hosted_zones`.
+
+        :rtype: async generator
+        :returns: An async generator of ``(zone, rrset)`` tuples.
+        """
+
+        if hasattr(zones, '__aiter__'):
+            zones = [zone async for zone in zones]
+        else:
+            zones = list(zones)
+        if max_workers is None:
+            max_workers = self._pool_size
+
+        list_kwargs = {
+            'page_chunks': page_chunks,
+            'prefetch': 0,
+            'lazy': lazy,
+            'raw': raw,
+        }
+        tracker = HarvestTracker(len(zones), on_progress, on_error)
+        # Bounded, so the workers don't run too far ahead of the consumer.
+        events = asyncio.Queue(maxsize=max_workers * page_chunks)
+        slots = asyncio.Semaphore(max_workers)
+
+        async def _worker(zone):
+            async with slots:
+                try:
+                    async for event in aiter_zone_events(self, zone, list_kwargs):
+                        await events.put(event)
+                except Exception as exc:
+                    await events.put((CRASHED, zone, exc))
+
+        tasks = [asyncio.ensure_future(_worker(zone)) for zone in zones]
+        try:
+            while tracker.zones_done < tracker.zones_total:
+                pair = tracker.handle(*await events.get())
+                if pair is not None:
+                    yield pair
+        finally:
+            for task in tasks:
+                task.cancel()
+        tracker.finish()
+
+    async def create_hosted_zone(self, name, caller_reference=None, comment=None):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.create_hosted_zone <route53.connection.Route53Connection.create_hosted_zone>`.
+
+        :rtype: tuple
+        :returns: A tuple in the form of ``(hosted_zone, change_info)``.
+        """
+
+        body = xml_generators.create_hosted_zone_writer(
+            connection=self,
+            name=name,
+            caller_reference=caller_reference,
+            comment=comment
+        )
+
+        root = await self._send_request(
+            path='hostedzone',
+            data=body,
+            method='POST',
+        )
+
+        return xml_parsers.created_hosted_zone_parser(
+            root=root,
+            connection=self
+        )
+
+    async def get_hosted_zone_by_id(self, id):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.get_hosted_zone_by_id <route53.connection.Route53Connection.get_hosted_zone_by_id>`.
+
+        :rtype: :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
+        :returns: The requested hosted zone, with its nameservers populated.
+        """
+
+        root = await self._send_request(
+            path='hostedzone/%s' % id,
+            data={},
+            method='GET',
+        )
+
+        return xml_parsers.get_hosted_zone_by_id_parser(
+            root=root,
+            connection=self,
+        )
+
+    async def prefetch_nameservers(self, zones, max_workers=None):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.prefetch_nameservers <route53.connection.Route53Connection.prefetch_nameservers>`.
+        Once done, :py:attr:`HostedZone.nameservers <route53.hosted_zone.HostedZone.nameservers>`
+        can be read without a request. ``zones`` may also be an async
+        iterable, like :py:meth:`list_hosted_zones`.
+
+        :rtype: list
+        :returns: ``zones``, as a list.
+        """
+
+        if hasattr(zones, '__aiter__'):
+            zones = [zone async for zone in zones]
+        else:
+            zones = list(zones)
+        missing = self._get_zones_missing_nameservers(zones)
+        if not missing:
+            return zones
+
+        slots = asyncio.Semaphore(max_workers or self._pool_size)
+
+        async def _fetch(zones_with_id):
+            async with slots:
+                root = await self._send_request(
+                    path='hostedzone/%s' % zones_with_id[0].id,
+                    data={},
+                    method='GET',
+                )
+            self._fill_nameservers(zones_with_id, root)
+
+        await asyncio.gather(*[_fetch(group) for group in missing.values()])
+        return zones
+
+    async def delete_hosted_zone_by_id(self, id):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.delete_hosted_zone_by_id <route53.connection.Route53Connection.delete_hosted_zone_by_id>`.
+
+        :rtype: dict
+        :returns: A dict of change info, which contains some details about
+            the request.
+        """
+
+        root = await self._send_request(
+            path='hostedzone/%s' % id,
+            data={},
+            method='DELETE',
+        )
+
+        return xml_parsers.delete_hosted_zone_by_id_parser(
+            root=root,
+            connection=self,
+        )
+
+    async def _change_resource_record_sets(self, change_set, comment=None):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection._change_resource_record_sets <route53.connection.Route53Connection._change_resource_record_sets>`.
+
+        :rtype: dict
+        :returns: A dict of change info, which contains some details about
+            the request.
+        """
+
+        body = xml_generators.change_resource_record_set_writer(
+            connection=self,
+            change_set=change_set,
+            comment=comment
+        )
+
+        root = await self._send_request(
+            path='hostedzone/%s/rrset' % change_set.hosted_zone_id,
+            data=body,
+            method='POST',
+        )
+
+        e_change_info = root.find('./{*}ChangeInfo')
+        if e_change_info is None:
+            raise parse_error(root)
+        return parse_change_info(e_change_info, connection=self)
+
+    async def get_change(self, id):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.get_change <route53.connection.Route53Connection.get_change>`.
+
+        :rtype: :py:class:`ChangeInfo <route53.change_info.ChangeInfo>`
+        :returns: A dict of change info.
+        """
+
+        root = await self._send_request(
+            path='change/%s' % get_change_id(id),
+            data={},
+            method='GET',
+        )
+
+        e_change_info = root.find('./{*}ChangeInfo')
+        if e_change_info is None:
+            raise parse_error(root)
+        return parse_change_info(e_change_info, connection=self)
+
+    async def create_health_check(self, ipaddress, port, type, resource_path, fqdn, search_string, caller_reference=None):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.create_health_check <route53.connection.Route53Connection.create_health_check>`.
+
+        :rtype: :py:class:`HealthCheck <route53.health_check.HealthCheck>`
+        :returns: The newly created health check.
+        """
+
+        body = xml_generators.create_health_check_writer(
+            connection=self,
+            caller_reference=caller_reference,
+            ipaddress=ipaddress,
+            port=port,
+            type=type,
+            resource_path=resource_path,
+            fqdn=fqdn,
+            search_string=search_string
+        )
+
+        root = await self._send_request(
+            path='healthcheck',
+            data=body,
+            method='POST',
+        )
+
+        return xml_parsers.created_health_check_parser(
+            root=root,
+            connection=self
+        )
+
+    async def get_health_check_by_id(self, id):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.get_health_check_by_id <route53.connection.Route53Connection.get_health_check_by_id>`.
+
+        :rtype: :py:class:`HealthCheck <route53.health_check.HealthCheck>`
+        :returns: The requested health check.
+        """
+
+        root = await self._send_request(
+            path='healthcheck/%s' % id,
+            data={},
+            method='GET',
+        )
+
+        return xml_parsers.get_health_check_by_id_parser(
+            root=root,
+            connection=self,
+        )
+
+    async def delete_health_check_by_id(self, id):
+        """
+        Async counterpart of
+        :py:meth:`Route53Connection.delete_health_check_by_id <route53.connection.Route53Connection.delete_health_check_by_id>`.
+        """
+
+        root = await self._send_request(
+            path='healthcheck/%s' % id,
+            data={},
+            method='DELETE',
+        )
+
+        return xml_parsers.delete_health_check_by_id_parser(
+            root=root,
+            connection=self,
+        )
@@ -0,0 +1,401 @@
+"""
+This module contains asyncio-based HTTP transports, used by
+:py:class:`AsyncRoute53Connection <route53.async_connection.AsyncRoute53Connection>`.
+They sign requests exactly like the blocking transports in
+:py:mod:`route53.transport`, but the HTTP methods are coroutines.
+"""
+
+import asyncio
+import time
+from route53.exceptions import Route53Error, TransportError
+from route53.transport import BaseTransport
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class AsyncBaseTransport(BaseTransport):
+    """
+    This serves as an interface for asyncio HTTP transports. Sub-classes
+    implement the HTTP method-specific methods as coroutines.
+    """
+
+    async def send_request(self, path, data, method):
+        """
+        All outbound requests go through this method. It defers to the
+        transport's various HTTP method-specific methods.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param data: The params to send along with the request.
+        :type data: Either a dict or bytes, depending on the request type.
+        :param str method: One of 'GET', 'POST', or 'DELETE'.
+
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        return await self._send_with_retries(
+            self._dispatch_request, path, data, method
+        )
+
+    async def send_streaming_request(self, path, data, method):
+        """
+        Async counterpart of
+        :py:meth:`BaseTransport.send_streaming_request <route53.transport.BaseTransport.send_streaming_request>`.
+
+        :rtype: async iterable
+        :returns: An async iterable of bytes chunks, making up the response
+            body.
+        """
+
+        return await self._send_with_retries(
+            self._open_stream, path, data, method
+        )
+
+    async def _send_with_retries(self, send, path, data, method):
+        """
+        Awaits ``send(path, data, method)`` until it succeeds, or the
+        connection's retry policy gives up.
+
+        :param callable send: A coroutine function that sends a single
+            attempt at the request.
+        :returns: Whatever ``send`` returns.
+        """
+
+        policy = self.connection._retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            limiter = self.connection._rate_limiter
+            if limiter is not None:
+                # Wait for our turn without blocking the event loop.
+                delay = limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                return await send(path, data, method)
+            except Route53Error as exc:
+                delay = policy.get_delay(exc, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    async def _dispatch_request(self, path, data, method):
+        """
+        Signs and sends a single attempt at a request, via the HTTP
+        method-specific methods.
+
+        See :py:meth:`send_request` for the arguments.
+        """
+
+        headers = self.get_request_headers()
+
+        if method == 'GET':
+            return await self._send_get_request(path, data, headers)
+        elif method == 'POST':
+            return await self._send_post_request(path, data, headers)
+        elif method == 'DELETE':
+            return await self._send_delete_request(path, headers)
+        else:
+            raise Route53Error("Invalid request method: %s" % method)
+
+    async def _open_stream(self, path, data, method):
+        """
+        Transport sub-classes may override this if they can stream response
+        bodies. By default, the whole body comes back as a single chunk.
+
+        :rtype: async iterable
+        :returns: An async iterable of bytes chunks.
+        """
+
+        body = await self._dispatch_request(path, data, method)
+
+        async def _chunks():
+            yield body
+
+        return _chunks()
+
+    async def prewarm(self, count):
+        """
+        Transport sub-classes may override this if they keep connections
+        around between requests.
+
+        :param int count: The number of connections to open.
+        """
+
+        pass
+
+    async def close(self):
+        """
+        Transport sub-classes may override this if they hold on to any
+        resources (sockets, pools) between requests.
+        """
+
+        pass
+
+    async def _send_get_request(self, path, params, headers):
+        """
+        Transport sub-classes need to override this.
+
+        Sends the GET request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param dict params: Key/value pairs to send.
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        raise NotImplementedError
+
+    async def _send_post_request(self, path, data, headers):
+        """
+        Transport sub-classes need to override this.
+
+        Sends the POST request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param data: Either a dict, or bytes.
+        :type data: dict or bytes
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        raise NotImplementedError
+
+    async def _send_delete_request(self, path, headers):
+        """
+        Transport sub-classes need to override this.
+
+        Sends the DELETE request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        raise NotImplementedError
+
+
+class AiohttpTransport(AsyncBaseTransport):
+    """
+    An aiohttp-based transport. More details may be found on the
+    `aiohttp webpage`_. Install it with ``pip install route53[async]``.
+
+    The underlying ``aiohttp.ClientSession`` is created on first use, since
+    it has to be bound to a running event loop. Its connection pool is
+    sized from the connection's ``pool_size`` and ``keep_alive`` settings.
+
+    .. _aiohttp webpage: https://docs.aiohttp.org/
+    """
+
+    STREAM_CHUNK_SIZE = 16 * 1024
+    """The number of bytes read off the socket at a time when streaming."""
+
+    def __init__(self, connection):
+        """
+        :param AsyncRoute53Connection connection: The connection being used
+            with the transport.
+        """
+
+        if aiohttp is None:
+            raise Route53Error("AiohttpTransport requires the aiohttp package.")
+
+        super(AiohttpTransport, self).__init__(connection)
+        self._session = None
+
+    def _get_session(self):
+        """
+        :rtype: aiohttp.ClientSession
+        :returns: The session shared by all requests on this transport.
+        """
+
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection._pool_size,
+                force_close=not self.connection._keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def prewarm(self, count):
+        """
+        Opens up to ``count`` pooled connections to the Route53 endpoint by
+        sending unsigned HEAD requests concurrently. Failures are ignored.
+
+        :param int count: The number of connections to open.
+        """
+
+        session = self._get_session()
+
+        async def _open_connection():
+            try:
+                async with session.head(self.endpoint):
+                    pass
+            except aiohttp.ClientError:
+                pass
+
+        count = min(count, self.connection._pool_size)
+        await asyncio.gather(*[_open_connection() for _ in range(count)])
+
+    async def close(self):
+        """
+        Closes the session, along with all of its pooled connections.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, method, path, **kwargs):
+        """
+        Sends a request through the session, and checks the response for
+        errors.
+
+        :param str method: The HTTP method.
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :rtype: bytes
+        :returns: The body of the (successful) response.
+        """
+
+        try:
+            async with self._get_session().request(
+                    method, self.endpoint + path, **kwargs) as r:
+                body = await r.read()
+                self._check_response(r.status, body)
+                return body
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            raise self._transport_error(exc, method)
+
+    def _transport_error(self, exc, method):
+        """
+        :param Exception exc: A connection error or timeout.
+        :param str method: The HTTP method of the failed request.
+        :rtype: TransportError
+        :returns: The error to raise, noting whether the request may have
+            gone out.
+        """
+
+        # A connection that couldn't be opened means nothing was sent.
+        sent = not isinstance(exc, aiohttp.ClientConnectorError)
+        return TransportError(str(exc), method=method, sent=sent)
+
+    async def _open_stream(self, path, data, method):
+        """
+        Streams GET responses off the socket in chunks of
+        ``STREAM_CHUNK_SIZE`` bytes. Other methods are sent as usual.
+
+        :rtype: async generator
+        :returns: An async generator of bytes chunks, making up the response
+            body.
+        """
+
+        if method != 'GET':
+            return await super(AiohttpTransport, self)._open_stream(
+                path, data, method
+            )
+
+        headers = self.get_request_headers()
+        try:
+            r = await self._get_session().request(
+                'GET', self.endpoint + path,
+                params=self._clean_params(data), headers=headers,
+            )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            raise self._transport_error(exc, 'GET')
+
+        if r.status >= 400:
+            try:
+                body = await r.read()
+            finally:
+                r.release()
+            self._check_response(r.status, body)
+
+        return self._iter_response_chunks(r)
+
+    async def _iter_response_chunks(self, r):
+        """
+        :param aiohttp.ClientResponse r: A response whose body hasn't been
+            read yet.
+        :rtype: async generator
+        :returns: An async generator of bytes chunks. The connection goes
+            back to the pool once the generator is exhausted or closed.
+        """
+
+        try:
+            async for chunk in r.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                yield chunk
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            raise TransportError(str(exc), method='GET')
+        finally:
+            r.release()
+
+    def _clean_params(self, params):
+        """
+        Unlike requests, aiohttp won't silently drop None values, nor
+        stringify the others.
+
+        :param dict params: Key/value pairs to send.
+        :rtype: dict
+        :returns: The params, ready for aiohttp.
+        """
+
+        return dict(
+            (key, str(val)) for key, val in params.items() if val is not None
+        )
+
+    async def _send_get_request(self, path, params, headers):
+        """
+        Sends the GET request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param dict params: Key/value pairs to send.
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        return await self._request(
+            'GET', path, params=self._clean_params(params), headers=headers
+        )
+
+    async def _send_post_request(self, path, data, headers):
+        """
+        Sends the POST request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param data: Either a dict, or bytes.
+        :type data: dict or bytes
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        return await self._request('POST', path, data=data, headers=headers)
+
+    async def _send_delete_request(self, path, headers):
+        """
+        Sends the DELETE request to the Route53 endpoint.
+
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :param dict headers: A dict of headers to send with the request.
+        :rtype: bytes
+        :returns: The body of the response.
+        """
+
+        return await self._request('DELETE', path, headers=headers)
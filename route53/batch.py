@@ -0,0 +1,175 @@
+"""
+Batched record set changes. Rather than sending a request per record set,
+as :py:meth:`HostedZone.create_a_record <route53.hosted_zone.HostedZone.create_a_record>`
+and friends do, a batch collects changes and sends them in as few requests
+as Route53's limits allow. See
+:py:meth:`HostedZone.batch <route53.hosted_zone.HostedZone.batch>`.
+"""
+
+from route53.change_set import ChangeSet, MAX_CHANGES_PER_REQUEST, \
+    MAX_RECORDS_PER_REQUEST, MAX_VALUE_CHARS_PER_REQUEST
+from route53.exceptions import Route53Error
+from route53.xml_parsers.list_resource_record_sets_by_zone_id import RRSET_TYPE_TO_RSET_SUBCLASS_MAP
+
+class ChangeBatch(object):
+    """
+    Collects record set creations, upserts and deletions for one hosted
+    zone, and sends them all on :py:meth:`commit`. Can be used as a context
+    manager, committing when the block is left without an exception::
+
+        with zone.batch() as batch:
+            for i in range(20000):
+                batch.create_record('A', 'host%d.example.com.' % i, ['10.0.0.1'])
+            batch.delete(old_rrset)
+
+        print(batch.change_infos)
+    """
+
+    def __init__(self, connection, hosted_zone_id, comment=None,
+                 max_changes=MAX_CHANGES_PER_REQUEST,
+                 max_records=MAX_RECORDS_PER_REQUEST,
+                 max_value_chars=MAX_VALUE_CHARS_PER_REQUEST):
+        """
+        :param Route53Connection connection: The connection instance being
+            used to send the change requests.
+        :param str hosted_zone_id: The ID of the hosted zone the changes
+            are made to.
+        :keyword str comment: An optional comment to go along with each
+            request.
+        :keyword int max_changes: The most changes per request.
+        :keyword int max_records: The most values per request.
+        :keyword int max_value_chars: The most characters in all of a
+            request's values, put together.
+        """
+
+        self.connection = connection
+        self.hosted_zone_id = hosted_zone_id
+        self.comment = comment
+        self.limits = dict(
+            max_changes=max_changes,
+            max_records=max_records,
+            max_value_chars=max_value_chars,
+        )
+        self.change_set = ChangeSet(connection, hosted_zone_id)
+        self.change_infos = []
+
+    def __len__(self):
+        return len(self.change_set)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+
+    def _check_zone(self, rrset):
+        if rrset.zone_id != self.hosted_zone_id:
+            raise Route53Error(
+                "%s belongs to another hosted zone." % rrset.name)
+
+    def create(self, rrset):
+        """
+        Adds the creation of a record set.
+
+        :param ResourceRecordSet rrset: The record set to create.
+        :rtype: ResourceRecordSet
+        :returns: ``rrset``.
+        """
+
+        self._check_zone(rrset)
+        self.change_set.add_change('CREATE', rrset)
+        return rrset
+
+    def create_record(self, rrset_type, name, values, ttl=60, **kwargs):
+        """
+        Adds the creation of a new record set.
+
+        :param str rrset_type: The record type, like ``'A'``.
+        :param str name: The fully qualified name of the record to add.
+        :param list values: A list of value strings for the record.
+        :keyword int ttl: The time-to-live of the record (in seconds).
+
+        Any other keyword arguments (``weight``, ``set_identifier``...) are
+        passed on to the record set, as with
+        :py:meth:`HostedZone.create_a_record <route53.hosted_zone.HostedZone.create_a_record>`.
+
+        :rtype: ResourceRecordSet
+        :returns: The new ResourceRecordSet sub-class instance.
+        """
+
+        rrset_type = rrset_type.upper()
+        if rrset_type == 'SOA' or rrset_type not in RRSET_TYPE_TO_RSET_SUBCLASS_MAP:
+            raise Route53Error("Can't create %s records." % rrset_type)
+
+        rrset = RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset_type](
+            connection=self.connection,
+            zone_id=self.hosted_zone_id,
+            name=name,
+            ttl=ttl,
+            records=values,
+            **kwargs
+        )
+        return self.create(rrset)
+
+    def upsert(self, rrset):
+        """
+        Adds the creation of a record set, or the replacement of the one
+        with the same name, type and set identifier. Needs API version
+        2013-04-01 or later.
+
+        :param ResourceRecordSet rrset: The record set to upsert.
+        :rtype: ResourceRecordSet
+        :returns: ``rrset``.
+        """
+
+        self._check_zone(rrset)
+        self.change_set.add_change('UPSERT', rrset)
+        return rrset
+
+    def delete(self, rrset):
+        """
+        Adds the deletion of a record set.
+
+        :param ResourceRecordSet rrset: The record set to delete.
+        """
+
+        if rrset.rrset_type == 'SOA':
+            raise Route53Error("SOA records can't be created or deleted.")
+        self._check_zone(rrset)
+        self.change_set.add_change('DELETE', rrset)
+
+    def commit(self):
+        """
+        Sends every change collected so far, in as few requests as the
+        limits allow, deletions first. The batch is empty afterwards, and
+        may be re-used.
+
+        If a request fails, the ones before it have already gone through,
+        and the exception is raised with the changes that are left still
+        in the batch.
+
+        :rtype: list
+        :returns: A list of change info dicts, one per request sent. These
+            are also added to :py:attr:`change_infos`.
+        """
+
+        change_sets = self.change_set.split(**self.limits)
+        change_infos = []
+        for i, change_set in enumerate(change_sets):
+            try:
+                change_info = self.connection._change_resource_record_sets(
+                    change_set, comment=self.comment)
+            except Exception:
+                # Keep what's left, to be committed again.
+                self.change_set = ChangeSet(self.connection, self.hosted_zone_id)
+                for unsent in change_sets[i:]:
+                    self.change_set.deletions.extend(unsent.deletions)
+                    self.change_set.upserts.extend(unsent.upserts)
+                    self.change_set.creations.extend(unsent.creations)
+                raise
+            change_infos.append(change_info)
+            self.change_infos.append(change_info)
+
+        self.change_set = ChangeSet(self.connection, self.hosted_zone_id)
+        return change_infos
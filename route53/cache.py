@@ -0,0 +1,157 @@
+"""
+An in-memory cache of API responses, for read-heavy callers that look the
+same zones and record sets up over and over. It is opt-in, see the
+``cache_ttl`` argument of
+:py:class:`Route53Connection <route53.connection.Route53Connection>`.
+
+Only GET responses for hosted zones, record sets and health checks are
+cached. Whenever a write (a POST or a DELETE) goes through the same
+connection, everything it could have changed is dropped, so a connection
+never reads back stale copies of its own changes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from route53.util import request_key
+
+# The API paths whose GET responses may be cached. Change statuses are
+# left out, since they're polled for updates.
+CACHEABLE_ROOTS = frozenset(['hostedzone', 'healthcheck'])
+
+class ResponseCache(object):
+    """
+    A thread-safe LRU cache of parsed responses, with a TTL.
+
+    Entries are keyed by request path and params. The parsed response roots
+    are shared between everyone that reads them, so they're to be treated
+    as read-only. The parsers never modify them.
+    """
+
+    def __init__(self, ttl, max_entries=1024, clock=time.monotonic):
+        """
+        :param float ttl: How many seconds an entry is good for.
+        :keyword int max_entries: The most entries held at once. The least
+            recently used entry is evicted to make room for a new one.
+        :keyword callable clock: Returns the current time in seconds. Mostly
+            here for the unit tests.
+        """
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation. Responses to requests that were
+        # sent before then may be stale, and aren't stored.
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(path, params):
+        """
+        :param str path: The request path.
+        :param dict params: The request params.
+        :rtype: tuple or None
+        :returns: The cache key for the request, or ``None`` if it can't
+            be cached.
+        """
+
+        if path.split('/', 1)[0] not in CACHEABLE_ROOTS:
+            return None
+        return request_key(path, params)
+
+    def get(self, key):
+        """
+        :param tuple key: As returned by :py:meth:`make_key`.
+        :rtype: lxml.etree._Element or None
+        :returns: The cached response root, or ``None`` on a miss.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, root = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return root
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, root, generation):
+        """
+        Stores a response, unless the cache was invalidated since it was
+        requested.
+
+        :param tuple key: As returned by :py:meth:`make_key`.
+        :param lxml.etree._Element root: The parsed response.
+        :param int generation: The value of :py:attr:`generation` from
+            before the request was sent.
+        """
+
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, root)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path):
+        """
+        Drops everything a write to ``path`` could have changed: the listing
+        it belongs to (``hostedzone`` for ``hostedzone/Z1/rrset``), and
+        everything about the resource itself (``hostedzone/Z1`` and
+        beneath).
+
+        :param str path: The path of the write request.
+        """
+
+        parts = path.split('/')
+        collection = parts[0]
+        resource = '/'.join(parts[:2]) if len(parts) > 1 else None
+
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            for key in list(self._entries):
+                key_path = key[0]
+                if key_path == collection or (
+                        resource is not None and (
+                            key_path == resource or
+                            key_path.startswith(resource + '/'))):
+                    del self._entries[key]
+
+    def clear(self):
+        """
+        Drops every entry.
+        """
+
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        """
+        :rtype: dict
+        :returns: The ``hits``, ``misses``, ``evictions`` and
+            ``invalidations`` so far, and the current number of
+            ``entries``.
+        """
+
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+            }
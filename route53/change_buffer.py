@@ -0,0 +1,321 @@
+"""
+A write-behind buffer for record set changes, for services that make many
+small changes to a zone as things happen. See
+:py:meth:`HostedZone.change_buffer <route53.hosted_zone.HostedZone.change_buffer>`.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+from route53.change_set import ChangeSet
+from route53.exceptions import Route53Error
+from route53.util import normalize_record_name
+
+def _record_key(rrset):
+    return normalize_record_name(rrset.name), rrset.rrset_type, rrset.set_identifier
+
+# What a pending change to a record set and a later one to the same record
+# set make, by their actions. None means they cancel out. A pair that's
+# missing can't be combined, so the first is sent before the second is
+# taken.
+_MERGED_ACTIONS = {
+    ('CREATE', 'DELETE'): None,
+    ('CREATE', 'UPSERT'): 'CREATE',
+    ('UPSERT', 'UPSERT'): 'UPSERT',
+    ('DELETE', 'UPSERT'): 'UPSERT',
+    ('DELETE', 'CREATE'): 'UPSERT',
+}
+
+class ChangeBuffer(object):
+    """
+    Collects record set changes from any number of threads, and sends them
+    in batches from a background thread. A batch goes out once
+    ``max_changes`` changes are waiting, or ``max_delay`` seconds after the
+    first of them came in, whichever is sooner.
+
+    Every change gets a :py:class:`concurrent.futures.Future`, resolving to
+    the change info dict of the request it went out in, or raising the
+    exception that request failed with.
+
+    A request's changes are sent deletions first, so changes to the same
+    record set that are waiting together are combined into one, to keep
+    their effect in order. A creation that's upserted becomes a creation
+    with the new values, and a deletion followed by a creation becomes an
+    upsert (on API versions without UPSERT, the two are sent together,
+    deletion first). A creation that's deleted again cancels out with the
+    deletion: neither is sent, and both futures resolve to ``None``.
+    Changes that can't be combined (a second creation, or a deletion of
+    a record set that was just upserted, whose values a deletion has to
+    match) wait for the earlier one to be sent.
+
+    Close the buffer when done with it, to send whatever is left::
+
+        with zone.change_buffer(max_delay=0.5) as buf:
+            future = buf.create(rrset)
+            ...
+        print(future.result())
+    """
+
+    def __init__(self, connection, hosted_zone_id, max_changes=100,
+                 max_delay=1.0, comment=None, **limits):
+        """
+        :param Route53Connection connection: The connection instance being
+            used to send the change requests.
+        :param str hosted_zone_id: The ID of the hosted zone the changes
+            are made to.
+        :keyword int max_changes: Send a batch once this many changes are
+            waiting.
+        :keyword float max_delay: Send a batch once its first change has
+            waited this many seconds.
+        :keyword str comment: An optional comment to go along with each
+            request.
+
+        The ``max_records`` and ``max_value_chars`` limits of
+        :py:meth:`ChangeSet.split <route53.change_set.ChangeSet.split>` may
+        be passed along as well. A batch too big for one request is split
+        up, into as few requests as it takes.
+        """
+
+        self.connection = connection
+        self.hosted_zone_id = hosted_zone_id
+        self.max_changes = max_changes
+        self.max_delay = max_delay
+        self.comment = comment
+        self.limits = limits
+
+        self._cond = threading.Condition()
+        # Held while a batch is taken and sent, so batches go out in order.
+        # Re-entrant, in case a future's callback flushes.
+        self._send_lock = threading.RLock()
+        # [action, rrset, futures] lists, in the order they came in. Changes
+        # that were combined share one, with all of their futures.
+        self._pending = []
+        # The pending changes of each record set, by name, type and set
+        # identifier.
+        self._pending_by_record = {}
+        self._deadline = None
+        self._closed = False
+        self._thread = None
+
+        self.requests_sent = 0
+        """The number of change requests sent so far."""
+        self.changes_cancelled = 0
+        """The number of changes that cancelled out, and weren't sent."""
+        self.changes_merged = 0
+        """The number of changes combined into an earlier one."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def create(self, rrset):
+        """
+        Queues the creation of a record set.
+
+        :param ResourceRecordSet rrset: The record set to create.
+        :rtype: concurrent.futures.Future
+        :returns: Resolves to the change info dict of the request the
+            change went out in.
+        """
+
+        return self._add('CREATE', rrset)
+
+    def upsert(self, rrset):
+        """
+        Queues the creation or replacement of a record set. Needs API
+        version 2013-04-01 or later.
+
+        :param ResourceRecordSet rrset: The record set to upsert.
+        :rtype: concurrent.futures.Future
+        :returns: Resolves to the change info dict of the request the
+            change went out in.
+        """
+
+        return self._add('UPSERT', rrset)
+
+    def delete(self, rrset):
+        """
+        Queues the deletion of a record set.
+
+        :param ResourceRecordSet rrset: The record set to delete.
+        :rtype: concurrent.futures.Future
+        :returns: Resolves to the change info dict of the request the
+            change went out in, or to ``None`` if it cancelled out a
+            creation that hadn't gone out yet.
+        """
+
+        return self._add('DELETE', rrset)
+
+    def _add(self, action, rrset):
+        if rrset.zone_id != self.hosted_zone_id:
+            raise Route53Error("%s belongs to another hosted zone." % rrset.name)
+        if action == 'UPSERT' and not self.connection.supports_upsert:
+            raise Route53Error(
+                "UPSERT needs API version 2013-04-01 or later, not %s." %
+                self.connection.endpoint_version)
+
+        future = Future()
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise Route53Error("The change buffer is closed.")
+                cancelled = self._merge(action, rrset, future)
+            if cancelled is not None:
+                break
+            # Sent from this thread, so the earlier change goes out first.
+            self.flush()
+
+        # Resolved outside of the lock, since callbacks run right away.
+        for cancelled_future in cancelled:
+            cancelled_future.set_result(None)
+        return future
+
+    def _merge(self, action, rrset, future):
+        """
+        Adds a change, combining it with the pending change to the same
+        record set, if there is one. Called with the lock held.
+
+        :rtype: list or None
+        :returns: The futures of changes that cancelled out, to be resolved
+            to ``None``. ``None`` if the change can't be combined with the
+            pending one, and has to wait until that's been sent.
+        """
+
+        key = _record_key(rrset)
+        changes = self._pending_by_record.setdefault(key, [])
+        if changes:
+            last = changes[-1]
+            pair = (last[0], action)
+            if pair == ('DELETE', 'CREATE') and not self.connection.supports_upsert:
+                # Fine to send together, as the deletion goes first.
+                pass
+            elif pair not in _MERGED_ACTIONS:
+                return None
+            elif _MERGED_ACTIONS[pair] is None:
+                changes.pop()
+                if not changes:
+                    del self._pending_by_record[key]
+                self._pending = [change for change in self._pending if change is not last]
+                if not self._pending:
+                    self._deadline = None
+                self.changes_cancelled += len(last[2]) + 1
+                return last[2] + [future]
+            else:
+                last[0] = _MERGED_ACTIONS[pair]
+                last[1] = rrset
+                last[2].append(future)
+                self.changes_merged += 1
+                return []
+
+        change = [action, rrset, [future]]
+        changes.append(change)
+        self._pending.append(change)
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self.max_delay
+        self._start()
+        self._cond.notify()
+        return []
+
+    def _start(self):
+        """
+        Starts the background thread, if it isn't running yet. Called with
+        the lock held.
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='route53-change-buffer')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._is_due():
+                    timeout = None
+                    if self._deadline is not None:
+                        timeout = max(self._deadline - time.monotonic(), 0)
+                    self._cond.wait(timeout)
+                if self._closed and not self._pending:
+                    return
+            self.flush()
+
+    def _is_due(self):
+        return bool(self._pending) and (
+            len(self._pending) >= self.max_changes or
+            time.monotonic() >= self._deadline
+        )
+
+    def flush(self):
+        """
+        Sends every change that's waiting right away, from the calling
+        thread. Failures are handed to the changes' futures, not raised.
+        """
+
+        with self._send_lock:
+            with self._cond:
+                changes = self._pending
+                self._pending = []
+                self._pending_by_record = {}
+                self._deadline = None
+            if changes:
+                self._send(changes)
+
+    def _send(self, changes):
+        """
+        Sends a batch of changes, in as few requests as it takes, and
+        resolves their futures.
+
+        :param list changes: ``[action, rrset, futures]`` lists.
+        """
+
+        change_set = ChangeSet(self.connection, self.hosted_zone_id)
+        futures = {}
+        for action, rrset, change_futures in changes:
+            change_set.add_change(action, rrset)
+            futures.setdefault((action, id(rrset)), []).append(change_futures)
+
+        def pop_futures(change_set):
+            return [
+                future
+                for action, rrset in change_set.changes
+                for future in futures[(action, id(rrset))].pop(0)
+            ]
+
+        try:
+            change_sets = change_set.split(**self.limits)
+        except Exception as exc:
+            for future in pop_futures(change_set):
+                future.set_exception(exc)
+            return
+
+        for i, change_set in enumerate(change_sets):
+            try:
+                change_info = self.connection._change_resource_record_sets(
+                    change_set, comment=self.comment)
+            except Exception as exc:
+                # The rest may depend on this one, so they're failed too.
+                for unsent in change_sets[i:]:
+                    for future in pop_futures(unsent):
+                        future.set_exception(exc)
+                return
+            self.requests_sent += 1
+            for future in pop_futures(change_set):
+                future.set_result(change_info)
+
+    def close(self):
+        """
+        Sends whatever is still waiting, and stops the background thread.
+        No more changes may be added afterwards.
+        """
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        # In case the thread never started, or is this one.
+        self.flush()
@@ -0,0 +1,243 @@
+"""
+Change info, as returned by the calls that change things, and the means of
+waiting for the changes to be applied.
+
+Route53 takes a little while to push a change out to all of its DNS
+servers. Until then, the change's status is ``PENDING``. Once it's
+``INSYNC``, every server answers with the new data.
+"""
+
+import heapq
+import inspect
+import itertools
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+from route53.exceptions import ChangeTimeoutError, Route53Error
+
+def get_change_id(request_id):
+    """
+    :param str request_id: A change's ID, with or without the leading
+        ``/change/``.
+    :rtype: str
+    :returns: The bare change ID, like ``'C2682N5HXP0BZ4'``.
+    """
+
+    return request_id.rsplit('/', 1)[-1]
+
+def _check_blocking(connection):
+    """
+    Following up on changes blocks, so it's not for async connections,
+    whose ``get_change()`` hands back a coroutine.
+
+    :raises Route53Error: If ``connection`` is async.
+    """
+
+    if inspect.iscoroutinefunction(connection.get_change):
+        raise Route53Error(
+            "Can't wait on changes through an async connection. Await "
+            "get_change() instead.")
+
+class ChangeInfo(dict):
+    """
+    The details of a change: ``request_id``, ``request_status`` and
+    ``request_submitted_at``. It's a dict, as it always has been, with a few
+    conveniences for following up on the change.
+    """
+
+    def __init__(self, connection=None, *args, **kwargs):
+        """
+        :keyword Route53Connection connection: The connection the change was
+            made through, used to check up on it.
+
+        Any other arguments are passed to ``dict``.
+        """
+
+        super(ChangeInfo, self).__init__(*args, **kwargs)
+        self.connection = connection
+
+    @property
+    def change_id(self):
+        """
+        The bare change ID, as taken by
+        :py:meth:`Route53Connection.get_change <route53.connection.Route53Connection.get_change>`.
+        """
+
+        return get_change_id(self['request_id'])
+
+    @property
+    def is_insync(self):
+        """
+        ``True`` once the change has been applied everywhere.
+        """
+
+        return self['request_status'] == 'INSYNC'
+
+    def refresh(self):
+        """
+        Looks the change up again, and updates this dict with its current
+        status.
+
+        :rtype: ChangeInfo
+        :returns: This change info.
+        """
+
+        _check_blocking(self.connection)
+        self.update(self.connection.get_change(self.change_id))
+        return self
+
+    def wait_until_insync(self, timeout=None):
+        """
+        Waits until the change is ``INSYNC``, then updates this dict with
+        its current status. The change is polled by the connection's
+        :py:attr:`change_waiter <route53.connection.Route53Connection.change_waiter>`,
+        along with every other change being waited on.
+
+        :keyword float timeout: The most seconds to wait. Waits for as long
+            as it takes, by default.
+        :rtype: ChangeInfo
+        :returns: This change info.
+        :raises ChangeTimeoutError: If the change isn't ``INSYNC`` in time.
+        """
+
+        if self.is_insync:
+            return self
+
+        _check_blocking(self.connection)
+        future = self.connection.change_waiter.watch(self.change_id)
+        try:
+            self.update(future.result(timeout))
+        except TimeoutError:
+            raise ChangeTimeoutError(
+                "Change %s isn't INSYNC after %s seconds." % (self.change_id, timeout))
+        return self
+
+class ChangeWaiter(object):
+    """
+    Waits on any number of pending changes with a single polling thread.
+    Each change is polled with exponential backoff, starting at
+    ``base_delay`` and doubling up to ``max_delay``. The polls are sent one
+    at a time, under the connection's rate limit, if it has one.
+
+    The thread is started when there's something to wait on, and exits
+    when there isn't.
+    """
+
+    def __init__(self, connection, base_delay=2.0, max_delay=30.0):
+        """
+        :param Route53Connection connection: The connection to poll through.
+            Async connections aren't supported.
+        :keyword float base_delay: Seconds until a change is first polled.
+        :keyword float max_delay: The longest a change goes between polls,
+            in seconds.
+        """
+
+        _check_blocking(connection)
+
+        self.connection = connection
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        # [future, delay] of each change being waited on, by change ID.
+        self._watches = {}
+        # (poll_at, seq, change_id) of each change, soonest first.
+        self._schedule = []
+        self._seq = itertools.count()
+        self._thread = None
+
+        self.polls = 0
+        """The number of times a change was polled."""
+
+    def watch(self, change_id):
+        """
+        Starts waiting on a change, unless it's already being waited on.
+
+        :param str change_id: The change's ID, with or without the leading
+            ``/change/``.
+        :rtype: concurrent.futures.Future
+        :returns: Resolves to the change's
+            :py:class:`ChangeInfo` once it's ``INSYNC``, or raises the
+            exception polling for it failed with.
+        """
+
+        change_id = get_change_id(change_id)
+        with self._cond:
+            watch = self._watches.get(change_id)
+            if watch is not None:
+                return watch[0]
+
+            future = Future()
+            self._watches[change_id] = [future, self.base_delay]
+            self._schedule_poll(change_id, self.base_delay)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='route53-change-waiter')
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def pending(self):
+        """
+        :rtype: int
+        :returns: The number of changes being waited on.
+        """
+
+        with self._cond:
+            return len(self._watches)
+
+    def _schedule_poll(self, change_id, delay):
+        # Called with the lock held.
+        heapq.heappush(
+            self._schedule, (time.monotonic() + delay, next(self._seq), change_id))
+
+    def _next_due(self):
+        """
+        Waits for the next change that's due a poll.
+
+        :rtype: str or None
+        :returns: The change's ID, or ``None`` once nothing is left to wait
+            on, in which case the thread is done.
+        """
+
+        with self._cond:
+            while self._schedule:
+                poll_at, _, change_id = self._schedule[0]
+                wait = poll_at - time.monotonic()
+                if wait <= 0:
+                    heapq.heappop(self._schedule)
+                    return change_id
+                # Woken early if a change that's due sooner comes in.
+                self._cond.wait(wait)
+            self._thread = None
+            return None
+
+    def _run(self):
+        while True:
+            change_id = self._next_due()
+            if change_id is None:
+                return
+
+            self.polls += 1
+            try:
+                change_info = self.connection.get_change(change_id)
+                insync = change_info.is_insync
+            except Exception as exc:
+                with self._cond:
+                    future = self._watches.pop(change_id)[0]
+                # Callers may have cancelled the future in the meantime.
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+                continue
+
+            with self._cond:
+                if insync:
+                    future = self._watches.pop(change_id)[0]
+                else:
+                    future = None
+                    watch = self._watches[change_id]
+                    watch[1] = min(watch[1] * 2, self.max_delay)
+                    self._schedule_poll(change_id, watch[1])
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_result(change_info)
@@ -1,4 +1,33 @@
 from route53.exceptions import Route53Error
+from route53.xml_generators.change_resource_record_set import get_change_values
+
+# Route53's limits on a single ChangeResourceRecordSets request.
+MAX_CHANGES_PER_REQUEST = 1000
+"""The most changes in one request."""
+MAX_RECORDS_PER_REQUEST = 1000
+"""The most ResourceRecord elements (values) in one request."""
+MAX_VALUE_CHARS_PER_REQUEST = 32000
+"""The most characters in all of one request's values, put together."""
+
+def get_change_size(change):
+    """
+    :param tuple change: A change tuple from a ChangeSet.
+    :rtype: tuple
+    :returns: A tuple in the form of ``(values, value_chars)``: the
+        number of values the change sends, and their total length, as
+        counted against the per-request limits.
+    """
+
+    action, rrset = change
+
+    if rrset.is_alias_record_set():
+        # Aliases don't send any values.
+        return 0, 0
+
+    values = get_change_values(change)['records'] or []
+    # Route53 counts the values of an UPSERT twice.
+    times = 2 if action == 'UPSERT' else 1
+    return times * len(values), times * sum(len(value) for value in values)
 
 class ChangeSet(object):
     """
@@ -18,23 +47,103 @@ class ChangeSet(object):
         self.hosted_zone_id = hosted_zone_id
         self.creations = []
         self.deletions = []
+        self.upserts = []
 
     def add_change(self, action, record_set):
         """
         Adds a change to this change set.
 
-        :param str action: Must be one of either 'CREATE' or 'DELETE'.
+        :param str action: Must be one of 'CREATE', 'DELETE' or 'UPSERT'.
+            'UPSERT' creates the record set, or replaces the one with the
+            same name, type and set identifier. It needs API version
+            2013-04-01 or later.
         :param resource_record_set.ResourceRecordSet record_set: The
-            ResourceRecordSet object that was created or deleted.
+            ResourceRecordSet object that was created, deleted or upserted.
         """
 
         action = action.upper()
 
-        if action not in ['CREATE', 'DELETE']:
-            raise Route53Error("action must be one of 'CREATE' or 'DELETE'")
+        if action not in ['CREATE', 'DELETE', 'UPSERT']:
+            raise Route53Error("action must be one of 'CREATE', 'DELETE' or 'UPSERT'")
+
+        if action == 'UPSERT' and not self.connection.supports_upsert:
+            raise Route53Error(
+                "UPSERT needs API version 2013-04-01 or later, not %s." %
+                self.connection.endpoint_version)
 
         change_tuple = (action, record_set)
         if action == 'CREATE':
             self.creations.append(change_tuple)
+        elif action == 'UPSERT':
+            self.upserts.append(change_tuple)
         else:
             self.deletions.append(change_tuple)
+
+    @property
+    def changes(self):
+        """
+        All of the changes, in the order they're sent in: deletions, then
+        upserts, then creations.
+
+        :rtype: list
+        :returns: A list of ``(action, record_set)`` tuples.
+        """
+
+        return self.deletions + self.upserts + self.creations
+
+    def __len__(self):
+        return len(self.deletions) + len(self.upserts) + len(self.creations)
+
+    def split(self, max_changes=MAX_CHANGES_PER_REQUEST,
+              max_records=MAX_RECORDS_PER_REQUEST,
+              max_value_chars=MAX_VALUE_CHARS_PER_REQUEST):
+        """
+        Splits this change set into as few as possible that each fit in one
+        request. Each change goes into the first change set it fits in.
+
+        The change sets are to be sent in order. Every deletion is in the
+        same change set as, or an earlier one than, every creation and
+        upsert, so a record set can be replaced by deleting and re-creating
+        it.
+
+        :keyword int max_changes: The most changes per change set.
+        :keyword int max_records: The most values per change set.
+        :keyword int max_value_chars: The most characters in all of a
+            change set's values, put together.
+        :rtype: list
+        :returns: A list of ChangeSet instances.
+        """
+
+        limits = (max_changes, max_records, max_value_chars)
+        # Each is [change_set, [changes, records, value_chars]].
+        bins = []
+
+        def add(change, first_bin):
+            size = (1,) + get_change_size(change)
+            if any(needed > limit for needed, limit in zip(size, limits)):
+                raise Route53Error(
+                    "The %s of %s is too big for a single request." % (
+                        change[0], change[1].name))
+
+            for change_set, used in bins[first_bin:]:
+                if all(total + needed <= limit for total, needed, limit
+                       in zip(used, size, limits)):
+                    break
+            else:
+                change_set = ChangeSet(self.connection, self.hosted_zone_id)
+                used = [0, 0, 0]
+                bins.append((change_set, used))
+
+            change_set.add_change(*change)
+            for i, needed in enumerate(size):
+                used[i] += needed
+
+        for change in self.deletions:
+            add(change, 0)
+        # Upserts and creations can share the last change set with
+        # deletions, since those are written first, but not an earlier one.
+        first_creation_bin = max(len(bins) - 1, 0)
+        for change in self.upserts + self.creations:
+            add(change, first_creation_bin)
+
+        return [change_set for change_set, _ in bins]
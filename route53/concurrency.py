@@ -0,0 +1,308 @@
+"""
+Small threading (and asyncio) helpers used to overlap API requests with
+the caller's own work.
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Markers passed through the read-ahead queues along with the items.
+_ITEM = 'item'
+_ERROR = 'error'
+_DONE = 'done'
+
+def read_ahead(iterable, depth):
+    """
+    Pulls items from ``iterable`` in a background thread, staying up to
+    ``depth`` items ahead of the consumer. This is used to fetch the next
+    pages of a listing while the current one is still being worked on.
+
+    If the consumer stops iterating early, the background thread stops
+    pulling items as soon as the one it's working on is done. Exceptions
+    raised by ``iterable`` are re-raised to the consumer, in order.
+
+    :param iterable: Any iterable. It is only ever touched by the background
+        thread.
+    :param int depth: The maximum number of items that may be pulled, but
+        not yet consumed, at any given time.
+    :rtype: generator
+    :returns: A generator yielding the same items as ``iterable``.
+    """
+
+    buf = queue.Queue()
+    # One slot per item we're allowed to be ahead by.
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def _producer():
+        try:
+            iterator = iter(iterable)
+            while True:
+                # Wait for the consumer to free up a slot, but bail out
+                # if it went away in the meantime.
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                buf.put((_ITEM, item))
+        except Exception as exc:
+            buf.put((_ERROR, exc))
+            return
+        buf.put((_DONE, None))
+
+    thread = threading.Thread(target=_producer, name='route53-read-ahead')
+    thread.daemon = True
+    thread.start()
+
+    def _consumer():
+        try:
+            while True:
+                kind, value = buf.get()
+                if kind == _DONE:
+                    return
+                elif kind == _ERROR:
+                    raise value
+                slots.release()
+                yield value
+        finally:
+            stop.set()
+
+    return _consumer()
+
+def parallel_chain(iterables, max_workers, ordered=True, buffer_size=500):
+    """
+    Drains several iterables at once, on a pool of ``max_workers``
+    threads, and yields all of their items.
+
+    With ``ordered``, the items come out as if the iterables had been
+    chained one after another: all of the first one's, then all of the
+    second one's, and so on. The later iterables are still drained in the
+    meantime, but each may only get ``buffer_size`` items ahead before its
+    worker waits for its turn. Otherwise, items are yielded as soon as they
+    come in, whichever iterable they're from, with up to ``buffer_size``
+    waiting on the consumer.
+
+    If the consumer stops iterating early, the workers stop after the item
+    they're working on. An exception raised by any of the iterables is
+    re-raised to the consumer, in its place among the items.
+
+    :param list iterables: The iterables to drain. Each is only ever
+        touched by the worker thread that drains it, which also closes it
+        when done, if it has a ``close()`` method.
+    :param int max_workers: The number of worker threads.
+    :keyword bool ordered: If ``True``, keep the items in chained order.
+    :keyword int buffer_size: The most items held per iterable (or in all,
+        if not ``ordered``) that the consumer hasn't gotten to yet.
+    :rtype: generator
+    :returns: A generator yielding the items of all of ``iterables``.
+    """
+
+    iterables = list(iterables)
+    if ordered:
+        bufs = [queue.Queue(buffer_size) for _ in iterables]
+    else:
+        bufs = [queue.Queue(buffer_size)] * len(iterables)
+    stop = threading.Event()
+
+    def _put(buf, entry):
+        # Wait for room, but bail out if the consumer went away in the
+        # meantime.
+        while True:
+            try:
+                buf.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                if stop.is_set():
+                    return False
+
+    def _producer(index, iterable):
+        if stop.is_set():
+            return
+        buf = bufs[index]
+        iterator = None
+        try:
+            iterator = iter(iterable)
+            for item in iterator:
+                if not _put(buf, (index, _ITEM, item)) or stop.is_set():
+                    return
+        except Exception as exc:
+            _put(buf, (index, _ERROR, exc))
+            return
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+        _put(buf, (index, _DONE, None))
+
+    def _consumer():
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='route53-parallel'
+        )
+        try:
+            for index, iterable in enumerate(iterables):
+                executor.submit(_producer, index, iterable)
+
+            # In order, the one iterable being read from is the current
+            # one. Otherwise, they all share the one buffer.
+            current = 0
+            remaining = len(iterables)
+            while remaining:
+                index, kind, value = bufs[current].get()
+                if kind == _ERROR:
+                    raise value
+                elif kind == _ITEM:
+                    yield value
+                    continue
+
+                remaining -= 1
+                if ordered:
+                    current += 1
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    return _consumer()
+
+def async_read_ahead(aiterable, depth):
+    """
+    The asyncio counterpart of :py:func:`read_ahead`. The async iterable
+    is driven by a separate task, staying up to ``depth`` items ahead of
+    the consumer.
+
+    :param aiterable: Any async iterable.
+    :param int depth: The maximum number of items that may be pulled, but
+        not yet consumed, at any given time.
+    :rtype: async generator
+    :returns: An async generator yielding the same items as ``aiterable``.
+    """
+
+    async def _consumer():
+        buf = asyncio.Queue()
+        slots = asyncio.Semaphore(depth)
+
+        async def _producer():
+            try:
+                iterator = aiterable.__aiter__()
+                while True:
+                    await slots.acquire()
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    buf.put_nowait((_ITEM, item))
+            except Exception as exc:
+                buf.put_nowait((_ERROR, exc))
+                return
+            buf.put_nowait((_DONE, None))
+
+        task = asyncio.ensure_future(_producer())
+        try:
+            while True:
+                kind, value = await buf.get()
+                if kind == _DONE:
+                    return
+                elif kind == _ERROR:
+                    raise value
+                slots.release()
+                yield value
+        finally:
+            task.cancel()
+
+    return _consumer()
+
+class SingleFlight(object):
+    """
+    Lets callers that ask for the same thing at the same time share a single
+    call. The first caller for a key makes the call, and any others that
+    come along before it's done wait for its result (or exception) instead
+    of making their own.
+
+    Nothing is remembered once the call is done. That's up to the response
+    cache, if any.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        # Calls made, and calls saved by sharing one already in flight.
+        self.sent = 0
+        self.saved = 0
+
+    def do(self, key, func):
+        """
+        :param key: A hashable key. Calls with equal keys are shared.
+        :param callable func: Makes the call, if nobody else is already.
+        :returns: What ``func`` returned, for this caller or another one.
+        """
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self.sent += 1
+            else:
+                self.saved += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def stats(self):
+        """
+        :rtype: dict
+        :returns: How many calls were ``sent``, and how many were ``saved``
+            by sharing one already in flight.
+        """
+
+        with self._lock:
+            return {'sent': self.sent, 'saved': self.saved}
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    The asyncio counterpart of :py:class:`SingleFlight`. The shared call
+    runs as its own task, so it carries on for the others if the caller
+    that started it is cancelled.
+    """
+
+    async def do(self, key, func):
+        """
+        :param key: A hashable key. Calls with equal keys are shared.
+        :param callable func: Returns the coroutine making the call, if
+            nobody else is already.
+        :returns: What the coroutine returned, for this caller or another
+            one.
+        """
+
+        # Only ever touched from the event loop, so no locking needed.
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.saved += 1
+        else:
+            task = self._in_flight[key] = asyncio.ensure_future(func())
+            self.sent += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task):
+        del self._in_flight[key]
+        if not task.cancelled():
+            # Counts as retrieved, even if every waiter was cancelled.
+            task.exception()
@@ -1,8 +1,20 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from lxml import etree
 from route53 import xml_parsers, xml_generators
-from route53.exceptions import Route53Error
+from route53.cache import ResponseCache
+from route53.change_info import ChangeWaiter, get_change_id
+from route53.concurrency import SingleFlight, parallel_chain, read_ahead
+from route53.harvest import HarvestTracker, iter_zone_events
+from route53.hosted_zone import cache_nameservers, get_cached_nameservers
+from route53.rate_limit import TokenBucket
+from route53.retry import RetryPolicy
 from route53.transport import RequestsTransport
+from route53.util import request_key
 from route53.xml_parsers.common_change_info import parse_change_info
+from route53.xml_parsers.common_error import parse_error
+from route53.xml_parsers.common_hosted_zone import parse_delegation_set
 
 class Route53Connection(object):
     """
@@ -15,13 +27,73 @@ class Route53Connection(object):
     .. warning:: Do not instantiate instances of this class yourself.
     """
 
-    endpoint_version = '2012-02-29'
+    endpoint_version = '2013-04-01'
     """The date-based API version. Mostly visible for your reference."""
 
-    def __init__(self, aws_access_key_id, aws_secret_access_key, endpoint_version = '2012-02-29', **kwargs):
+    default_transport_class = RequestsTransport
+    """The transport used if no ``transport_class`` kwarg is given."""
+
+    single_flight_class = SingleFlight
+    """Shares identical GET requests that are in flight at the same time."""
+
+    change_waiter_class = ChangeWaiter
+    """Polls the changes waited on by :py:attr:`change_waiter`."""
+
+    def __init__(self, aws_access_key_id, aws_secret_access_key, endpoint_version = '2013-04-01',
+                 pool_size=10, keep_alive=True, prewarm=0, prefetch_pages=0,
+                 stream_record_sets=False,
+                 rate_limit=None, rate_limit_burst=None, rate_limiter=None,
+                 retry_policy=None, cache_ttl=None, cache_max_entries=1024,
+                 coalesce_requests=True, **kwargs):
         """
         :param str aws_access_key_id: An account's access key ID.
         :param str aws_secret_access_key: An account's secret access key.
+        :keyword str endpoint_version: The date-based API version to use.
+            Versions before 2013-04-01 don't have the UPSERT change action,
+            so record sets are saved by deleting and re-creating them.
+        :keyword int pool_size: The maximum number of HTTP connections the
+            transport keeps open to the endpoint. Raise this if many threads
+            share this connection.
+        :keyword bool keep_alive: If ``False``, connections are closed after
+            every response instead of being re-used.
+        :keyword int prewarm: The number of pooled connections to open
+            right away, before the first request is sent.
+        :keyword int prefetch_pages: The default number of pages that
+            paginated listings fetch in the background, ahead of the page
+            being consumed. ``0`` disables read-ahead.
+        :keyword bool stream_record_sets: If ``True``, record set listings
+            are parsed incrementally as each page streams in, instead of
+            after the whole page has arrived. This keeps memory use flat
+            with large pages, and gets the first record sets out sooner.
+        :keyword float rate_limit: If set, the maximum number of requests
+            per second sent over this connection, across all threads.
+            Route 53 allows about 5 per second, per account.
+        :keyword int rate_limit_burst: The number of requests that may go
+            out back to back before ``rate_limit`` kicks in. Defaults to
+            ``rate_limit``.
+        :keyword rate_limiter: A rate limiter instance to use instead of
+            the in-process one built from ``rate_limit``. For example, a
+            :py:class:`FileTokenBucket <route53.rate_limit.FileTokenBucket>`
+            shared by several worker processes. Anything with ``acquire()``
+            and ``reserve()`` methods like
+            :py:class:`TokenBucket <route53.rate_limit.TokenBucket>` works.
+        :keyword RetryPolicy retry_policy: Decides which failed requests are
+            retried, and how long to back off in between. Defaults to a
+            :py:class:`RetryPolicy <route53.retry.RetryPolicy>` with its
+            default settings. Pass ``RetryPolicy(max_attempts=1)`` to turn
+            retries off.
+        :keyword float cache_ttl: If set, the responses to hosted zone,
+            record set and health check lookups and listings are cached for
+            this many seconds. Creating, changing or deleting anything
+            through this connection drops the entries it affects. Changes
+            made elsewhere show up once the TTL runs out. See
+            :py:class:`ResponseCache <route53.cache.ResponseCache>`.
+        :keyword int cache_max_entries: The most responses cached at once,
+            with the least recently used evicted first.
+        :keyword bool coalesce_requests: If ``True``, GET requests identical
+            to one that's already in flight (same path and params) wait for
+            its response instead of sending their own. See
+            :py:meth:`single_flight_info`.
         """
 
         self.endpoint_version = endpoint_version
@@ -29,11 +101,68 @@ class Route53Connection(object):
         self._xml_namespace = 'https://route53.amazonaws.com/doc/%s/' % self.endpoint_version
         self._aws_access_key_id = aws_access_key_id
         self._aws_secret_access_key = aws_secret_access_key
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._prefetch_pages = prefetch_pages
+        self._stream_record_sets = stream_record_sets
+        if rate_limiter is not None:
+            self._rate_limiter = rate_limiter
+        elif rate_limit:
+            self._rate_limiter = TokenBucket(rate_limit, rate_limit_burst)
+        else:
+            self._rate_limiter = None
+        self._retry_policy = retry_policy or RetryPolicy()
+        if cache_ttl:
+            self._cache = ResponseCache(cache_ttl, cache_max_entries)
+        else:
+            self._cache = None
+        if coalesce_requests:
+            self._single_flight = self.single_flight_class()
+        else:
+            self._single_flight = None
+        self._change_waiter = None
+        self._change_waiter_lock = threading.Lock()
         if 'transport_class' not in kwargs or kwargs['transport_class'] is None:
-            self._transport = RequestsTransport(self)
+            self._transport = self.default_transport_class(self)
         else:
             self._transport = kwargs['transport_class'](self)
 
+        if prewarm:
+            self._transport.prewarm(prewarm)
+
+    @property
+    def supports_upsert(self):
+        """
+        ``True`` if this connection's API version has the UPSERT change
+        action.
+        """
+
+        return self.endpoint_version >= '2013-04-01'
+
+    @property
+    def change_waiter(self):
+        """
+        The :py:class:`ChangeWaiter <route53.change_info.ChangeWaiter>`
+        shared by every change waited on through this connection, created
+        the first time it's needed. All of the polling for
+        :py:meth:`ChangeInfo.wait_until_insync <route53.change_info.ChangeInfo.wait_until_insync>`
+        goes through it, in one loop, under this connection's rate limit.
+        """
+
+        with self._change_waiter_lock:
+            if self._change_waiter is None:
+                self._change_waiter = self.change_waiter_class(self)
+            return self._change_waiter
+
+    def close(self):
+        """
+        Releases any pooled HTTP connections held by the transport. The
+        connection may still be used afterwards, new HTTP connections will
+        be opened as needed.
+        """
+
+        self._transport.close()
+
     def _send_request(self, path, data, method):
         """
         Uses the HTTP transport to query the Route53 API. Runs the response
@@ -48,13 +177,205 @@ class Route53Connection(object):
         :returns: An lxml Element root.
         """
 
-        response_body = self._transport.send_request(path, data, method)
-        root = etree.fromstring(response_body)
+        cache_key, generation, root = self._check_cache(path, data, method)
+        if root is not None:
+            return root
+
+        if self._single_flight is not None and method == 'GET':
+            root = self._single_flight.do(
+                request_key(path, data),
+                lambda: self._send_uncached_request(path, data, method)
+            )
+        else:
+            root = self._send_uncached_request(path, data, method)
+        self._fill_cache(cache_key, generation, root)
         return root
 
+    def _send_uncached_request(self, path, data, method):
+        """
+        Sends the request and parses the response, passing the response
+        cache and the single-flight sharing by. Takes the same arguments as
+        :py:meth:`_send_request`.
+
+        :rtype: lxml.etree._Element
+        :returns: An lxml Element root.
+        """
+
+        try:
+            response_body = self._transport.send_request(path, data, method)
+        finally:
+            self._invalidate_cache(path, method)
+        return self._parse_response_body(response_body)
+
+    def _check_cache(self, path, data, method):
+        """
+        Looks a request up in the response cache, if there is one.
+
+        :rtype: tuple
+        :returns: The cache key (``None`` if the request can't be cached),
+            the cache generation the request is sent under, and the cached
+            response root (``None`` on a miss).
+        """
+
+        if self._cache is None or method != 'GET':
+            return None, None, None
+        cache_key = self._cache.make_key(path, data)
+        if cache_key is None:
+            return None, None, None
+        # Read before the request goes out, so a write that lands while
+        # it's in flight keeps its response out of the cache.
+        generation = self._cache.generation
+        return cache_key, generation, self._cache.get(cache_key)
+
+    def _fill_cache(self, cache_key, generation, root):
+        """
+        Stores a response looked up by :py:meth:`_check_cache`.
+        """
+
+        if cache_key is not None:
+            self._cache.put(cache_key, root, generation)
+
+    def _invalidate_cache(self, path, method):
+        """
+        Drops the cached responses a write to ``path`` may have changed.
+        Done whether or not the write succeeded, since a failed write may
+        still have gone through.
+        """
+
+        if self._cache is not None and method != 'GET':
+            self._cache.invalidate(path)
+
+    def cache_info(self):
+        """
+        :rtype: dict or None
+        :returns: The response cache's ``hits``, ``misses``, ``evictions``,
+            ``invalidations`` and ``entries``, or ``None`` if caching is
+            off. See the ``cache_ttl`` argument.
+        """
+
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
+    def single_flight_info(self):
+        """
+        :rtype: dict or None
+        :returns: How many GET requests were ``sent``, and how many were
+            ``saved`` by sharing an identical one already in flight, or
+            ``None`` if ``coalesce_requests`` is off.
+        """
+
+        if self._single_flight is None:
+            return None
+        return self._single_flight.stats()
+
+    def clear_cache(self):
+        """
+        Drops every cached response, if caching is on.
+        """
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _parse_response_body(self, response_body):
+        """
+        Parses a response body into an lxml Element root.
+
+        Transports hand back the raw bytes, which lxml decodes itself
+        according to the XML declaration. Third-party transports that still
+        return str are encoded first, since lxml refuses str input that
+        carries an encoding declaration.
+
+        :param bytes response_body: The body of the response.
+        :rtype: lxml.etree._Element
+        :returns: An lxml Element root.
+        """
+
+        if not isinstance(response_body, bytes):
+            response_body = response_body.encode('utf-8')
+        return etree.fromstring(response_body)
+
+    def _iter_pages(self, path, params, method, next_marker_xpath,
+                    next_marker_param_name, next_type_xpath=None):
+        """
+        Sends the paginated API request over and over, yielding the root of
+        every page until the last one. The parameters for the next request
+        are worked out before each page is yielded, so the next request may
+        be sent while the caller is still busy with the current page.
+
+        See :py:meth:`_do_autopaginating_api_call` for the arguments.
+
+        :rtype: generator
+        :returns: A generator of lxml Element roots, one per page.
+        """
+
+        # Each page gets its own copy, since a read-ahead request may be
+        # in flight while we work out the next one.
+        params = dict(params)
+
+        # We loop indefinitely since we have no idea how many "pages" of
+        # results we're going to have to go through.
+        while True:
+            # An lxml Element node.
+            root = self._send_request(path, params, method)
+
+            next_params = self._get_next_page_params(
+                root, params,
+                next_marker_xpath, next_marker_param_name, next_type_xpath
+            )
+            yield root
+
+            if next_params is None:
+                # We've hit the last page.
+                break
+            params = next_params
+
+    def _get_next_page_params(self, root, params, next_marker_xpath,
+                              next_marker_param_name, next_type_xpath=None):
+        """
+        Works out the request params for the page after ``root``.
+
+        See :py:meth:`_do_autopaginating_api_call` for the arguments.
+
+        :param lxml.etree._Element root: The root of the current page.
+        :param dict params: The params the current page was requested with.
+        :rtype: dict or None
+        :returns: The params for the next request, or ``None`` if ``root``
+            is the last page.
+        """
+
+        # This will determine at what offset we start the next query.
+        next_marker = root.find(next_marker_xpath)
+        if next_marker is None:
+            # If the NextMarker tag is absent, we know we've hit the
+            # last page.
+            return None
+
+        # if NextMarker is present, we'll adjust our API request params
+        # and query again for the next page.
+        params = dict(params)
+        params[next_marker_param_name] = next_marker.text
+
+        if next_type_xpath:
+            # This is a _list_resource_record_sets_by_zone_id call. Look
+            # for the given tag via XPath and adjust our type arg for
+            # the next request. Without specifying this, we loop
+            # infinitely.
+            next_type = root.find(next_type_xpath)
+            params['type'] = next_type.text
+            # Weighted and latency record sets may also be split up
+            # between pages, in which case the set identifier to pick
+            # up from is given, too.
+            next_identifier = root.find('./{*}NextRecordIdentifier')
+            params['identifier'] = (
+                next_identifier.text if next_identifier is not None else None
+            )
+
+        return params
+
     def _do_autopaginating_api_call(self, path, params, method, parser_func,
         next_marker_xpath, next_marker_param_name,
-        next_type_xpath=None, parser_kwargs=None):
+        next_type_xpath=None, parser_kwargs=None, prefetch=None):
         """
         Given an API method, the arguments passed to it, and a function to
         hand parsing off to, loop through the record sets in the API call
@@ -75,6 +396,9 @@ class Route53Connection(object):
             an additional paginator token. Specifying this XPath looks for it.
         :keyword dict parser_kwargs: Optional dict of additional kwargs to pass
             on to the parser function.
+        :keyword int prefetch: The number of pages to fetch in the background,
+            ahead of the page being yielded from. If ``None``, the
+            connection's ``prefetch_pages`` setting is used.
         :rtype: generator
         :returns: Returns a generator that may be returned by the top-level
             API method.
@@ -83,36 +407,68 @@ class Route53Connection(object):
         if not parser_kwargs:
             parser_kwargs = {}
 
-        # We loop indefinitely since we have no idea how many "pages" of
-        # results we're going to have to go through.
-        while True:
-            # An lxml Element node.
-            root = self._send_request(path, params, method)
+        if prefetch is None:
+            prefetch = self._prefetch_pages
+
+        pages = self._iter_pages(
+            path, params, method,
+            next_marker_xpath, next_marker_param_name, next_type_xpath
+        )
+        if prefetch:
+            pages = read_ahead(pages, prefetch)
 
+        for root in pages:
             # Individually yield HostedZone instances after parsing/instantiating.
             for record in parser_func(root, connection=self, **parser_kwargs):
                 yield record
 
-            # This will determine at what offset we start the next query.
-            next_marker = root.find(next_marker_xpath)
-            if next_marker is None:
-                # If the NextMarker tag is absent, we know we've hit the
-                # last page.
-                break
+    def _do_streaming_api_call(self, path, params, method, stream_parser_class,
+        next_marker_xpath, next_marker_param_name,
+        next_type_xpath=None, parser_kwargs=None):
+        """
+        Like :py:meth:`_do_autopaginating_api_call`, but each page is parsed
+        incrementally as its body streams in. Records are yielded as soon as
+        they've been parsed, and the pagination tags are picked up once the
+        page is complete.
+
+        :param class stream_parser_class: Instantiated with the connection
+            and ``parser_kwargs`` for each page. It should have ``feed()``
+            and ``close()`` methods, like
+            :py:class:`ResourceRecordSetStreamParser <route53.xml_parsers.list_resource_record_sets_by_zone_id.ResourceRecordSetStreamParser>`.
+
+        See :py:meth:`_do_autopaginating_api_call` for the other arguments.
+
+        :rtype: generator
+        :returns: Returns a generator that may be returned by the top-level
+            API method.
+        """
+
+        if not parser_kwargs:
+            parser_kwargs = {}
 
-            # if NextMarker is present, we'll adjust our API request params
-            # and query again for the next page.
-            params[next_marker_param_name] = next_marker.text
+        params = dict(params)
 
-            if next_type_xpath:
-                # This is a _list_resource_record_sets_by_zone_id call. Look
-                # for the given tag via XPath and adjust our type arg for
-                # the next request. Without specifying this, we loop
-                # infinitely.
-                next_type = root.find(next_type_xpath)
-                params['type'] = next_type.text
+        while True:
+            parser = stream_parser_class(connection=self, **parser_kwargs)
+            chunks = self._transport.send_streaming_request(path, params, method)
+            try:
+                for chunk in chunks:
+                    for record in parser.feed(chunk):
+                        yield record
+            finally:
+                # Hands the HTTP connection back if we're stopped early.
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+            root = parser.close()
+
+            params = self._get_next_page_params(
+                root, params,
+                next_marker_xpath, next_marker_param_name, next_type_xpath
+            )
+            if params is None:
+                break
 
-    def list_hosted_zones(self, page_chunks=100):
+    def list_hosted_zones(self, page_chunks=100, prefetch=None, raw=False):
         """
         List all hosted zones associated with this connection's account. Since
         this method returns a generator, you can pull as many or as few
@@ -125,6 +481,12 @@ class Route53Connection(object):
             :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
             instances to retrieve per request. The default is fine for almost
             everyone.
+        :keyword int prefetch: The number of pages to fetch in the background
+            while you work through the current one. Defaults to the
+            connection's ``prefetch_pages`` setting.
+        :keyword bool raw: If ``True``, yield plain, immutable
+            :py:class:`RawHostedZone <route53.raw.RawHostedZone>` tuples
+            rather than HostedZone instances. Much cheaper for bulk exports.
 
         :rtype: generator
         :returns: A generator of :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
@@ -136,8 +498,10 @@ class Route53Connection(object):
             params={'maxitems': page_chunks},
             method='GET',
             parser_func=xml_parsers.list_hosted_zones_parser,
+            parser_kwargs={'raw': raw},
             next_marker_xpath="./{*}NextMarker",
             next_marker_param_name="marker",
+            prefetch=prefetch,
         )
 
     def create_hosted_zone(self, name, caller_reference=None, comment=None):
@@ -198,6 +562,97 @@ class Route53Connection(object):
             connection=self,
         )
 
+    def prefetch_nameservers(self, zones, max_workers=None):
+        """
+        Fills in the nameservers of many hosted zones at once, so that
+        :py:attr:`HostedZone.nameservers <route53.hosted_zone.HostedZone.nameservers>`
+        doesn't send a request per zone. Zones listed by
+        :py:meth:`list_hosted_zones` come without them.
+
+        Zones that already have their nameservers are skipped, as are
+        zones that were looked up before in this process: nameservers are
+        cached for good, since a zone's delegation set never changes. The
+        rest are looked up on a pool of worker threads::
+
+            zones = conn.prefetch_nameservers(conn.list_hosted_zones())
+            for zone in zones:
+                print(zone.name, zone.nameservers)
+
+        :param zones: An iterable of
+            :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
+            instances.
+        :keyword int max_workers: The number of lookups in flight at once.
+            Defaults to the connection's ``pool_size``.
+        :rtype: list
+        :returns: ``zones``, as a list.
+        """
+
+        zones = list(zones)
+        missing = self._get_zones_missing_nameservers(zones)
+        if not missing:
+            return zones
+
+        if max_workers is None:
+            max_workers = self._pool_size
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            # Raises the first failure, if any.
+            list(executor.map(self._fetch_nameservers, missing.values()))
+
+        return zones
+
+    def _get_zones_missing_nameservers(self, zones):
+        """
+        Fills in the nameservers of ``zones`` from the process-wide cache,
+        where possible.
+
+        :param list zones: HostedZone instances.
+        :rtype: dict
+        :returns: The zones that still need looking up, as lists of
+            HostedZone instances keyed by zone ID.
+        """
+
+        missing = {}
+        for zone in zones:
+            if zone._nameservers:
+                continue
+            nameservers = get_cached_nameservers(zone.id)
+            if nameservers is not None:
+                zone._nameservers = nameservers
+            else:
+                missing.setdefault(zone.id, []).append(zone)
+        return missing
+
+    def _fetch_nameservers(self, zones):
+        """
+        Looks up the nameservers of a zone, and fills them in.
+
+        :param list zones: HostedZone instances, all with the same ID.
+        """
+
+        root = self._send_request(
+            path='hostedzone/%s' % zones[0].id,
+            data={},
+            method='GET',
+        )
+        self._fill_nameservers(zones, root)
+
+    def _fill_nameservers(self, zones, root):
+        """
+        Fills in the nameservers of zones from a GetHostedZone response, and
+        caches them.
+
+        :param list zones: HostedZone instances, all with the same ID.
+        :param lxml.etree._Element root: The GetHostedZone response.
+        """
+
+        # Modifies the first zone in place.
+        parse_delegation_set(zones[0], root.find('./{*}DelegationSet'))
+        nameservers = zones[0]._nameservers
+        cache_nameservers(zones[0].id, nameservers)
+        for zone in zones[1:]:
+            zone._nameservers = list(nameservers)
+
     def delete_hosted_zone_by_id(self, id):
         """
         Deletes a hosted zone, by hosted zone ID (not name).
@@ -231,7 +686,9 @@ class Route53Connection(object):
 
     def _list_resource_record_sets_by_zone_id(self, id, rrset_type=None,
                                              identifier=None, name=None,
-                                             page_chunks=100):
+                                             page_chunks=100, prefetch=None,
+                                             stream=None, lazy=False,
+                                             raw=False, record_range=None):
         """
         Lists a hosted zone's resource record sets by Zone ID, if you
         already know it.
@@ -254,6 +711,24 @@ class Route53Connection(object):
         :keyword int page_chunks: This API call is paginated behind-the-scenes
             by this many ResourceRecordSet instances. The default should be
             fine for just about everybody, aside from those with tons of RRS.
+        :keyword int prefetch: The number of pages to fetch in the background
+            while you work through the current one. Defaults to the
+            connection's ``prefetch_pages`` setting. Ignored when streaming.
+        :keyword bool stream: If ``True``, each page is parsed as it streams
+            in, and record sets are yielded as soon as they've been parsed.
+            Defaults to the connection's ``stream_record_sets`` setting.
+        :keyword bool lazy: If ``True``, only the name and type of each
+            record set are parsed up front. The rest of the fields are
+            parsed the first time one of them is touched. Handy for scans
+            that only look at names and types.
+        :keyword bool raw: If ``True``, yield plain, immutable
+            :py:class:`RawResourceRecordSet <route53.raw.RawResourceRecordSet>`
+            tuples rather than ResourceRecordSet instances. Overrides
+            ``lazy``.
+        :keyword RecordRange record_range: Only list the record sets
+            within this :py:class:`RecordRange <route53.record_range.RecordRange>`.
+            Its start overrides ``name`` and ``rrset_type``, and the listing
+            stops once past its end.
 
         :rtype: generator
         :returns: A generator of ResourceRecordSet instances.
@@ -266,17 +741,107 @@ class Route53Connection(object):
             'maxitems': page_chunks,
         }
 
-        return  self._do_autopaginating_api_call(
-            path='hostedzone/%s/rrset' % id,
-            params=params,
-            method='GET',
-            parser_func=xml_parsers.list_resource_record_sets_by_zone_id_parser,
-            parser_kwargs={'zone_id': id},
-            next_marker_xpath="./{*}NextRecordName",
-            next_marker_param_name="name",
-            next_type_xpath="./{*}NextRecordType"
+        if record_range is not None:
+            params.update(record_range.start_params())
+
+        if stream is None:
+            # Streamed pages aren't cached, so a caching connection
+            # buffers them.
+            stream = self._stream_record_sets and self._cache is None
+
+        if stream:
+            record_sets = self._do_streaming_api_call(
+                path='hostedzone/%s/rrset' % id,
+                params=params,
+                method='GET',
+                stream_parser_class=xml_parsers.ResourceRecordSetStreamParser,
+                parser_kwargs={'zone_id': id, 'lazy': lazy, 'raw': raw},
+                next_marker_xpath="./{*}NextRecordName",
+                next_marker_param_name="name",
+                next_type_xpath="./{*}NextRecordType",
+            )
+        else:
+            record_sets = self._do_autopaginating_api_call(
+                path='hostedzone/%s/rrset' % id,
+                params=params,
+                method='GET',
+                parser_func=xml_parsers.list_resource_record_sets_by_zone_id_parser,
+                parser_kwargs={'zone_id': id, 'lazy': lazy, 'raw': raw},
+                next_marker_xpath="./{*}NextRecordName",
+                next_marker_param_name="name",
+                next_type_xpath="./{*}NextRecordType",
+                prefetch=prefetch,
+            )
+
+        if record_range is None:
+            return record_sets
+        if hasattr(record_sets, '__aiter__'):
+            # From an AsyncRoute53Connection.
+            return record_range.afilter(record_sets)
+        return record_range.filter(record_sets)
+
+    def harvest_record_sets(self, zones, max_workers=None, on_progress=None,
+                            on_error=None, lazy=False, raw=False,
+                            page_chunks=100):
+        """
+        Lists the record sets of many zones at once, on a pool of worker
+        threads. Each zone is listed page by page as usual, but up to
+        ``max_workers`` zones are in flight at any given time, so the
+        account's request quota (see ``rate_limit``) is what sets the pace::
+
+            for zone, rrset in conn.harvest_record_sets(conn.list_hosted_zones()):
+                print(zone.name, rrset.name, rrset.rrset_type)
+
+        A zone that fails to list doesn't stop the others. See
+        ``on_error``.
+
+        :param zones: An iterable of
+            :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
+            instances, or zone IDs.
+        :keyword int max_workers: The number of zones listed at once.
+            Defaults to the connection's ``pool_size``.
+        :keyword callable on_progress: Called as
+            ``on_progress(zone, count, zones_done, zones_total)`` each time
+            a zone is done, where ``count`` is the number of record sets it
+            had (``None`` if it failed).
+        :keyword callable on_error: Called as ``on_error(zone, exception)``
+            when a zone fails to list. If not given, a
+            :py:class:`HarvestError <route53.exceptions.HarvestError>`
+            listing the failures is raised once the other zones are done.
+        :keyword bool lazy: See
+            :py:meth:`HostedZone.list_record_sets <route53.hosted_zone.HostedZone.list_record_sets>`.
+        :keyword bool raw: Likewise.
+        :keyword int page_chunks: The number of record sets to request per
+            page.
+
+        :rtype: generator
+        :returns: A generator of ``(zone, rrset)`` tuples, in the order they
+            come in. ``zone`` is as it was given in ``zones``.
+        """
+
+        zones = list(zones)
+        if max_workers is None:
+            max_workers = self._pool_size
+
+        list_kwargs = {
+            'page_chunks': page_chunks,
+            'prefetch': 0,
+            'lazy': lazy,
+            'raw': raw,
+        }
+        tracker = HarvestTracker(len(zones), on_progress, on_error)
+        events = parallel_chain(
+            [iter_zone_events(self, zone, list_kwargs) for zone in zones],
+            max_workers,
+            ordered=False,
         )
 
+        for kind, zone, value in events:
+            pair = tracker.handle(kind, zone, value)
+            if pair is not None:
+                yield pair
+        tracker.finish()
+
     def _change_resource_record_sets(self, change_set, comment=None):
         """
         Given a ChangeSet, POST it to the Route53 API.
@@ -307,11 +872,37 @@ class Route53Connection(object):
 
         e_change_info = root.find('./{*}ChangeInfo')
         if e_change_info is None:
-            error = root.find('./{*}Error').find('./{*}Message').text
-            raise Route53Error(error)
-        return parse_change_info(e_change_info)
+            raise parse_error(root)
+        return parse_change_info(e_change_info, connection=self)
+
+    def get_change(self, id):
+        """
+        Looks up the current status of a change, as returned by the calls
+        that create, change or delete things.
+
+        .. tip:: To wait for a change to be applied, see
+            :py:meth:`ChangeInfo.wait_until_insync <route53.change_info.ChangeInfo.wait_until_insync>`.
+
+        :param str id: The change's ID, with or without the leading
+            ``/change/``.
+        :rtype: :py:class:`ChangeInfo <route53.change_info.ChangeInfo>`
+        :returns: A dict of change info. ``request_status`` is
+            ``'PENDING'`` until the change has been applied everywhere, and
+            ``'INSYNC'`` after.
+        """
+
+        root = self._send_request(
+            path='change/%s' % get_change_id(id),
+            data={},
+            method='GET',
+        )
+
+        e_change_info = root.find('./{*}ChangeInfo')
+        if e_change_info is None:
+            raise parse_error(root)
+        return parse_change_info(e_change_info, connection=self)
 
-    def list_health_checks(self, page_chunks=100):
+    def list_health_checks(self, page_chunks=100, prefetch=None, raw=False):
         """
         List all health checks associated with this connection's account. Since
         this method returns a generator, you can pull as many or as few
@@ -324,6 +915,12 @@ class Route53Connection(object):
             :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
             instances to retrieve per request. The default is fine for almost
             everyone.
+        :keyword int prefetch: The number of pages to fetch in the background
+            while you work through the current one. Defaults to the
+            connection's ``prefetch_pages`` setting.
+        :keyword bool raw: If ``True``, yield plain, immutable
+            :py:class:`RawHealthCheck <route53.raw.RawHealthCheck>` tuples
+            rather than HealthCheck instances. Much cheaper for bulk exports.
 
         :rtype: generator
         :returns: A generator of :py:class:`HostedZone <route53.hosted_zone.HostedZone>`
@@ -335,8 +932,10 @@ class Route53Connection(object):
             params={'maxitems': page_chunks},
             method='GET',
             parser_func=xml_parsers.list_health_checks_parser,
+            parser_kwargs={'raw': raw},
             next_marker_xpath="./{*}NextMarker",
             next_marker_param_name="marker",
+            prefetch=prefetch,
         )
 
     def create_health_check(self, ipaddress, port, type, resource_path, fqdn, search_string, caller_reference=None):
@@ -432,3 +1031,4 @@ class Route53Connection(object):
             root=root,
             connection=self,
         )
+
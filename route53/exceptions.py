@@ -14,4 +14,147 @@ class AlreadyDeletedError(Route53Error):
     has been deleted in Route53.
     """
 
-    pass
\ No newline at end of file
+    pass
+
+class TransportError(Route53Error):
+    """
+    Raised when a request never got an answer from Route53 (connection
+    refused or reset, timeouts, and so on).
+
+    GETs may always be sent again. A POST or DELETE is only retried if it
+    failed before it went out, since otherwise Route53 may have acted on
+    it already, and sending it again would create things twice, or fail
+    with ``InvalidChangeBatch``.
+    """
+
+    def __init__(self, message, method=None, sent=True):
+        """
+        :param str message: What went wrong.
+        :keyword str method: The HTTP method of the failed request.
+        :keyword bool sent: ``False`` if the request failed before any of
+            it was sent, like when the connection couldn't be opened.
+        """
+
+        super(TransportError, self).__init__(message)
+
+        self.method = method
+        self.sent = sent
+
+    @property
+    def retryable(self):
+        """Whether the same request may safely be sent again."""
+
+        return self.method == 'GET' or not self.sent
+
+
+class Route53APIError(Route53Error):
+    """
+    Raised when the Route53 API answers with an error response. The more
+    specific sub-classes below are raised for the error codes that callers
+    are likely to want to handle.
+    """
+
+    retryable = False
+    """Whether the same request may succeed if sent again later."""
+
+    def __init__(self, message, code=None, request_id=None, status=None):
+        """
+        :param str message: The human-readable error message.
+        :keyword str code: The error code from the response, like
+            ``Throttling`` or ``InvalidChangeBatch``.
+        :keyword str request_id: The ID that Amazon assigned to the failed
+            request. Handy for support cases.
+        :keyword int status: The HTTP status code of the response.
+        """
+
+        super(Route53APIError, self).__init__(message)
+
+        self.message = message
+        self.code = code
+        self.request_id = request_id
+        self.status = status
+
+    def __str__(self):
+        if self.code:
+            return '%s: %s' % (self.code, self.message)
+        return str(self.message)
+
+
+class ThrottlingError(Route53APIError):
+    """
+    The account went over its request rate quota.
+    """
+
+    retryable = True
+
+
+class PriorRequestNotCompleteError(Route53APIError):
+    """
+    A change to the same hosted zone is still being applied.
+    """
+
+    retryable = True
+
+
+class ServiceError(Route53APIError):
+    """
+    Route53 had trouble on its end (5xx responses).
+    """
+
+    retryable = True
+
+
+class InvalidChangeBatchError(Route53APIError):
+    """
+    A change batch was rejected, for example because it tried to create a
+    record set that already exists, or delete one that doesn't.
+    """
+
+    pass
+
+
+class NoSuchHostedZoneError(Route53APIError):
+    """
+    The requested hosted zone doesn't exist.
+    """
+
+    pass
+
+
+class NoSuchHealthCheckError(Route53APIError):
+    """
+    The requested health check doesn't exist.
+    """
+
+    pass
+
+
+class HarvestError(Route53Error):
+    """
+    Raised by :py:meth:`Route53Connection.harvest_record_sets <route53.connection.Route53Connection.harvest_record_sets>`
+    once every zone has been listed, if any of them failed and no
+    ``on_error`` callback was given.
+    """
+
+    def __init__(self, failures):
+        """
+        :param list failures: A list of ``(zone, exception)`` tuples, one
+            per failed zone.
+        """
+
+        super(HarvestError, self).__init__(
+            "Failed to list the record sets of %d zone(s). First error: %s" % (
+                len(failures), failures[0][1])
+        )
+
+        self.failures = failures
+
+
+class ChangeTimeoutError(Route53Error):
+    """
+    Raised by :py:meth:`ChangeInfo.wait_until_insync <route53.change_info.ChangeInfo.wait_until_insync>`
+    if the change isn't ``INSYNC`` by the deadline. The change is still
+    being applied, and may yet go through.
+    """
+
+    pass
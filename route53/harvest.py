@@ -0,0 +1,121 @@
+"""
+The bookkeeping behind
+:py:meth:`Route53Connection.harvest_record_sets <route53.connection.Route53Connection.harvest_record_sets>`,
+shared by the threaded and asyncio flavors. Each zone's listing is turned
+into a stream of events, which are merged and handed to a
+:py:class:`HarvestTracker` as they arrive.
+"""
+
+from route53.exceptions import HarvestError, Route53Error
+
+# The kinds of events a zone's listing turns into.
+RRSET = 'rrset'
+ZONE_DONE = 'done'
+ZONE_FAILED = 'failed'
+# Something other than the API went wrong. Re-raised to the consumer.
+CRASHED = 'crashed'
+
+def get_zone_id(zone):
+    """
+    :param zone: A HostedZone instance, or a zone ID.
+    :rtype: str
+    :returns: The zone's ID.
+    """
+
+    return getattr(zone, 'id', zone)
+
+def iter_zone_events(connection, zone, list_kwargs):
+    """
+    Lists one zone's record sets, as events. A failure to list the zone
+    ends its events, rather than raising.
+
+    :param Route53Connection connection: The connection to list through.
+    :param zone: A HostedZone instance, or a zone ID.
+    :param dict list_kwargs: Passed on to
+        :py:meth:`Route53Connection._list_resource_record_sets_by_zone_id <route53.connection.Route53Connection._list_resource_record_sets_by_zone_id>`.
+    :rtype: generator
+    :returns: A generator of ``(kind, zone, value)`` tuples: an ``RRSET``
+        per record set, then either ``ZONE_DONE`` with the number of record
+        sets, or ``ZONE_FAILED`` with the exception.
+    """
+
+    count = 0
+    try:
+        for rrset in connection._list_resource_record_sets_by_zone_id(
+                get_zone_id(zone), **list_kwargs):
+            yield RRSET, zone, rrset
+            count += 1
+    except Route53Error as exc:
+        yield ZONE_FAILED, zone, exc
+        return
+    yield ZONE_DONE, zone, count
+
+async def aiter_zone_events(connection, zone, list_kwargs):
+    """
+    Async generator counterpart of :py:func:`iter_zone_events`.
+    """
+
+    count = 0
+    try:
+        async for rrset in connection._list_resource_record_sets_by_zone_id(
+                get_zone_id(zone), **list_kwargs):
+            yield RRSET, zone, rrset
+            count += 1
+    except Route53Error as exc:
+        yield ZONE_FAILED, zone, exc
+        return
+    yield ZONE_DONE, zone, count
+
+class HarvestTracker(object):
+    """
+    Keeps track of which zones are done, calls the callbacks, and collects
+    the failures.
+    """
+
+    def __init__(self, zones_total, on_progress=None, on_error=None):
+        """
+        :param int zones_total: The number of zones being listed.
+        :keyword callable on_progress: See
+            :py:meth:`Route53Connection.harvest_record_sets <route53.connection.Route53Connection.harvest_record_sets>`.
+        :keyword callable on_error: Likewise.
+        """
+
+        self.zones_total = zones_total
+        self.zones_done = 0
+        self.failures = []
+        self.on_progress = on_progress
+        self.on_error = on_error
+
+    def handle(self, kind, zone, value):
+        """
+        :rtype: tuple or None
+        :returns: A ``(zone, rrset)`` tuple to yield, if the event is a
+            record set.
+        """
+
+        if kind == RRSET:
+            return zone, value
+        elif kind == CRASHED:
+            raise value
+
+        self.zones_done += 1
+        if kind == ZONE_FAILED:
+            self.failures.append((zone, value))
+            if self.on_error is not None:
+                self.on_error(zone, value)
+            count = None
+        else:
+            count = value
+
+        if self.on_progress is not None:
+            self.on_progress(zone, count, self.zones_done, self.zones_total)
+        return None
+
+    def finish(self):
+        """
+        Raises a :py:class:`HarvestError <route53.exceptions.HarvestError>`
+        if any zone failed, and nobody was told about it.
+        """
+
+        if self.failures and self.on_error is None:
+            raise HarvestError(self.failures)
@@ -10,6 +10,11 @@ class HealthCheck(object):
         one of the methods on :py:class:`route53.connection.Route53Connection`.
     """
 
+    __slots__ = (
+        'connection', 'id', 'caller_reference', 'ipaddress', 'port', 'type',
+        'resource_path', 'fqdn', 'search_string', '_is_deleted',
+    )
+
     def __init__(self, connection, id, caller_reference, ipaddress, port, type, resource_path, fqdn, search_string=None, health_check_version=1):
         """
         :param Route53Connection connection: The connection instance that
@@ -27,7 +32,7 @@ class HealthCheck(object):
         self.id = id
         self.caller_reference = caller_reference
         self.ipaddress = ipaddress
-        self.port = int(port)
+        self.port = int(port) if port is not None else None
         self.type = type
         self.resource_path = resource_path
         self.fqdn = fqdn
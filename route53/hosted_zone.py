@@ -1,6 +1,42 @@
+from route53.change_buffer import ChangeBuffer
 from route53.change_set import ChangeSet
 from route53.exceptions import AlreadyDeletedError
+from route53.concurrency import parallel_chain
+from route53.record_range import RecordRange, split_zone
 from route53.resource_record_set import AResourceRecordSet, AAAAResourceRecordSet, CNAMEResourceRecordSet, MXResourceRecordSet, NSResourceRecordSet, PTRResourceRecordSet, SOAResourceRecordSet, SPFResourceRecordSet, SRVResourceRecordSet, TXTResourceRecordSet
+from route53.util import normalize_record_name
+
+# Nameservers by zone ID, shared by every connection in the process. A
+# zone's delegation set never changes, so these never go stale.
+_NAMESERVER_CACHE = {}
+
+def get_cached_nameservers(zone_id):
+    """
+    :param str zone_id: A hosted zone's ID.
+    :rtype: list or None
+    :returns: The zone's nameservers, if they've been looked up before in
+        this process.
+    """
+
+    nameservers = _NAMESERVER_CACHE.get(zone_id)
+    return list(nameservers) if nameservers is not None else None
+
+def cache_nameservers(zone_id, nameservers):
+    """
+    Remembers a zone's nameservers, for the rest of the process.
+
+    :param str zone_id: A hosted zone's ID.
+    :param list nameservers: The zone's nameservers.
+    """
+
+    _NAMESERVER_CACHE[zone_id] = tuple(nameservers)
+
+def clear_nameserver_cache():
+    """
+    Forgets every cached nameserver.
+    """
+
+    _NAMESERVER_CACHE.clear()
 
 class HostedZone(object):
     """
@@ -13,6 +49,11 @@ class HostedZone(object):
         one of the methods on :py:class:`route53.connection.Route53Connection`.
     """
 
+    __slots__ = (
+        'connection', 'id', 'name', 'caller_reference',
+        'resource_record_set_count', 'comment', '_nameservers', '_is_deleted',
+    )
+
     def __init__(self, connection, id, name, caller_reference,
                  resource_record_set_count, comment):
         """
@@ -45,6 +86,12 @@ class HostedZone(object):
     @property
     def nameservers(self):
         """
+        Looked up with an extra request, the first time around, for zones
+        that came from
+        :py:meth:`Route53Connection.list_hosted_zones <route53.connection.Route53Connection.list_hosted_zones>`.
+        To look up many zones' at once, see
+        :py:meth:`Route53Connection.prefetch_nameservers <route53.connection.Route53Connection.prefetch_nameservers>`.
+
         :rtype: list
         :returns: A list of nameserver strings for this hosted zone.
         """
@@ -54,10 +101,14 @@ class HostedZone(object):
         # lazy load by querying it in after the fact. It's safe to cache like
         # this since  these nameserver values won't change.
         if not self._nameservers:
-            # We'll just snatch the nameserver values from a fresh copy
-            # via GetHostedZone.
-            hosted_zone = self.connection.get_hosted_zone_by_id(self.id)
-            self._nameservers = hosted_zone._nameservers
+            nameservers = get_cached_nameservers(self.id)
+            if nameservers is None:
+                # We'll just snatch the nameserver values from a fresh copy
+                # via GetHostedZone.
+                hosted_zone = self.connection.get_hosted_zone_by_id(self.id)
+                nameservers = hosted_zone._nameservers
+                cache_nameservers(self.id, nameservers)
+            self._nameservers = nameservers
 
         return self._nameservers
 
@@ -65,24 +116,201 @@ class HostedZone(object):
     def record_sets(self):
         """
         Queries for the Resource Record Sets that are under this HostedZone.
-        This is typically the way to go to find specific record sets, or
-        to list them all.
+        This is typically the way to go to list them all. If you're after
+        one specific record set, :py:meth:`get_record_set` gets it with a
+        single request.
 
-        We don't currently implement any filtering convenience method,
-        since it is very easy to do this yourself, catered to your own needs.
-        For example, if you find your match, you may choose to stop iterating
-        on the generator, potentially saving yourself extra API queries
-        (behind the scenes).
+        If you find your match, you may choose to stop iterating on the
+        generator, potentially saving yourself extra API queries (behind
+        the scenes).
 
         .. warning:: This result set can get pretty large if you have a ton
             of records.
 
+        .. note:: If this zone came from an
+            :py:class:`AsyncRoute53Connection <route53.async_connection.AsyncRoute53Connection>`,
+            this is an async generator, to be used with ``async for``.
+
         :rtype: generator
         :returns: A generator of ResourceRecordSet sub-classes.
         """
 
-        for rrset in self.connection._list_resource_record_sets_by_zone_id(self.id):
-            yield rrset
+        return self.list_record_sets()
+
+    def list_record_sets(self, lazy=False, stream=None, prefetch=None,
+                         page_chunks=100, raw=False, name=None,
+                         rrset_type=None, subtree=False):
+        """
+        Like :py:attr:`record_sets`, with a few knobs for big zones.
+
+        The listing can be narrowed down to one ``name`` (and its
+        ``subtree``), and one ``rrset_type``. Rather than listing the whole
+        zone and filtering, the listing starts at the name, and stops once
+        it has moved past what was asked for::
+
+            # Everything at or beneath eu.internal.example.com.
+            zone.list_record_sets(name='*.eu.internal.example.com', subtree=True)
+            # All of www's A records, weighted ones included.
+            zone.list_record_sets(name='www.example.com', rrset_type='A')
+
+        :keyword bool lazy: If ``True``, only the name and type of each
+            record set are parsed up front. Everything else is parsed the
+            first time it's touched. The record sets are still instances of
+            the usual ResourceRecordSet sub-classes, so ``delete()`` and
+            ``save()`` work as usual.
+        :keyword bool stream: If ``True``, each page is parsed as it
+            streams in. Defaults to the connection's ``stream_record_sets``
+            setting.
+        :keyword int prefetch: The number of pages to fetch in the
+            background. Defaults to the connection's ``prefetch_pages``
+            setting.
+        :keyword int page_chunks: The number of record sets to request per
+            page.
+        :keyword bool raw: If ``True``, yield plain, immutable
+            :py:class:`RawResourceRecordSet <route53.raw.RawResourceRecordSet>`
+            tuples instead. They can't be saved or deleted, but are a lot
+            cheaper to build and hold on to, which suits exports.
+        :keyword str name: Only list record sets with this name. The
+            trailing dot is optional, and case doesn't matter.
+        :keyword str rrset_type: Only list record sets of this type, like
+            ``'A'``. Without a ``name``, the whole zone is listed and
+            filtered.
+        :keyword bool subtree: If ``True``, also list every record set
+            beneath ``name``. A leading ``*.`` on ``name`` is dropped.
+
+        :rtype: generator
+        :returns: A generator of ResourceRecordSet sub-classes.
+        """
+
+        record_range = None
+        if name is not None or rrset_type is not None or subtree:
+            record_range = RecordRange(
+                name=name, rrset_type=rrset_type, subtree=subtree,
+            )
+
+        return self.connection._list_resource_record_sets_by_zone_id(
+            self.id, page_chunks=page_chunks, prefetch=prefetch,
+            stream=stream, lazy=lazy, raw=raw, record_range=record_range,
+        )
+
+    def scan_record_sets(self, partitions=8, split_names=None,
+                         max_workers=None, ordered=True, lazy=False,
+                         raw=False, page_chunks=100):
+        """
+        Lists all of this zone's record sets, several pages at a time. A
+        plain listing can only fetch one page after another, since each
+        page says where the next one starts. Here, the zone's names are
+        split into ``partitions`` spans instead, each listed from its own
+        starting point on a pool of threads, under the connection's rate
+        limit.
+
+        See :py:func:`split_zone <route53.record_range.split_zone>` for
+        how the zone is split up.
+
+        .. note:: Not supported on zones from an
+            :py:class:`AsyncRoute53Connection <route53.async_connection.AsyncRoute53Connection>`.
+
+        :keyword int partitions: The number of spans to split the zone into.
+        :keyword list split_names: The names to split the zone at, instead.
+        :keyword int max_workers: The number of spans listed at once.
+            Defaults to ``partitions``, capped at the connection's
+            ``pool_size``.
+        :keyword bool ordered: If ``True``, record sets are yielded in the
+            same order as :py:attr:`record_sets`. Later spans are listed
+            ahead by up to a few pages each, then wait for their turn. If
+            ``False``, they're yielded as they come in.
+        :keyword bool lazy: See :py:meth:`list_record_sets`.
+        :keyword bool raw: See :py:meth:`list_record_sets`.
+        :keyword int page_chunks: The number of record sets to request per
+            page.
+
+        :rtype: generator
+        :returns: A generator of ResourceRecordSet sub-classes.
+        """
+
+        spans = split_zone(self.name, partitions, split_names)
+        if max_workers is None:
+            max_workers = min(len(spans), self.connection._pool_size)
+
+        listings = [
+            self.connection._list_resource_record_sets_by_zone_id(
+                self.id, page_chunks=page_chunks, prefetch=0, lazy=lazy,
+                raw=raw, record_range=span,
+            )
+            for span in spans
+        ]
+        return parallel_chain(listings, max_workers, ordered=ordered)
+
+    def get_record_set(self, name, rrset_type, set_identifier=None):
+        """
+        Looks up a single record set. Rather than listing the zone from the
+        top, the listing is started right at ``name`` and ``rrset_type``
+        (and ``set_identifier``), one record set per page. That's a single
+        request, no matter how big the zone is.
+
+        .. note:: Not supported on zones from an
+            :py:class:`AsyncRoute53Connection <route53.async_connection.AsyncRoute53Connection>`.
+
+        :param str name: The record set's name. The trailing dot is
+            optional, and case doesn't matter.
+        :param str rrset_type: The record set's type, like ``'A'``.
+        :keyword str set_identifier: Weighted and latency record sets only:
+            The set identifier of the one to get. If not given, the first
+            record set with this name and type is returned.
+        :rtype: ResourceRecordSet
+        :returns: The matching ResourceRecordSet sub-class instance, or
+            ``None`` if there isn't one.
+        """
+
+        name = normalize_record_name(name)
+        rrset_type = rrset_type.upper()
+
+        record_sets = self.connection._list_resource_record_sets_by_zone_id(
+            self.id, rrset_type=rrset_type, name=name,
+            identifier=set_identifier, page_chunks=1, prefetch=0,
+            stream=False,
+        )
+
+        # The listing starts at our record set, if it exists. Otherwise, it
+        # starts at whatever comes after it, so there's no point in paging on.
+        rrset = next(iter(record_sets), None)
+        if hasattr(record_sets, 'close'):
+            record_sets.close()
+
+        if rrset is None or rrset.name != name or rrset.rrset_type != rrset_type:
+            return None
+        if set_identifier is not None and rrset.set_identifier != set_identifier:
+            return None
+        return rrset
+
+    def record_table(self, stream=None, prefetch=None, page_chunks=100):
+        """
+        Lists all of this zone's record sets into a columnar
+        :py:class:`RecordTable <route53.record_table.RecordTable>`, which
+        can be filtered without a Python object per record set.
+
+        See :py:meth:`list_record_sets` for the keyword arguments.
+
+        .. note:: Not supported on zones from an
+            :py:class:`AsyncRoute53Connection <route53.async_connection.AsyncRoute53Connection>`.
+
+        :rtype: :py:class:`RecordTable <route53.record_table.RecordTable>`
+        :returns: A snapshot of the zone's record sets.
+        """
+
+        # Imported here, since the parsers import this module.
+        from route53.record_table import RecordTable
+
+        # The rows are copied straight out of raw tuples, no need for
+        # full-blown record sets.
+        return RecordTable.from_record_sets(
+            self.list_record_sets(
+                stream=stream, prefetch=prefetch, page_chunks=page_chunks,
+                raw=True,
+            ),
+            connection=self.connection,
+            zone_id=self.id,
+        )
 
     def delete(self, force=False):
         """
@@ -137,6 +365,108 @@ class HostedZone(object):
         if self._is_deleted:
             raise AlreadyDeletedError("Can't manipulate a deleted zone.")
 
+    def batch(self, comment=None, **limits):
+        """
+        Starts a batch of record set changes to this zone, to be sent in as
+        few requests as possible. Handy for creating or deleting many
+        record sets at once, where ``create_*_record()`` would send a
+        request apiece::
+
+            with zone.batch() as batch:
+                for name, ip in hosts:
+                    batch.create_record('A', name, [ip])
+
+        :keyword str comment: An optional comment to go along with each
+            request.
+
+        The ``max_changes``, ``max_records`` and ``max_value_chars``
+        keyword arguments override Route53's per-request limits, see
+        :py:class:`ChangeBatch <route53.batch.ChangeBatch>`.
+
+        :rtype: :py:class:`ChangeBatch <route53.batch.ChangeBatch>`
+        :returns: An empty batch. Nothing is sent until it's committed.
+        """
+
+        self._halt_if_already_deleted()
+
+        # Imported here, since the parsers import this module.
+        from route53.batch import ChangeBatch
+        return ChangeBatch(self.connection, self.id, comment=comment, **limits)
+
+    def change_buffer(self, max_changes=100, max_delay=1.0, comment=None,
+                      **limits):
+        """
+        Starts a write-behind buffer of record set changes to this zone.
+        Changes made through it from any number of threads are sent
+        together, once ``max_changes`` of them are waiting or the first has
+        waited ``max_delay`` seconds. Share one buffer per zone, and close
+        it when done.
+
+        :keyword int max_changes: Send a batch once this many changes are
+            waiting.
+        :keyword float max_delay: Send a batch once its first change has
+            waited this many seconds.
+        :keyword str comment: An optional comment to go along with each
+            request.
+        :rtype: :py:class:`ChangeBuffer <route53.change_buffer.ChangeBuffer>`
+        """
+
+        self._halt_if_already_deleted()
+
+        return ChangeBuffer(
+            self.connection, self.id, max_changes=max_changes,
+            max_delay=max_delay, comment=comment, **limits
+        )
+
+    def sync(self, desired_records, dry_run=False, comment=None,
+             page_chunks=100, **limits):
+        """
+        Brings this zone's record sets in line with ``desired_records``:
+        record sets that are missing are created, ones that differ are
+        modified, and ones that aren't desired are deleted. Record sets are
+        matched up by name, type and set identifier. The zone's SOA and apex
+        NS record sets are left be, unless they're among the desired ones.
+        So are record sets of types that can't be changed yet (CAA, DS...),
+        which are listed in the plan's ``skipped`` instead.
+
+        The desired record sets are held in memory, sorted into listing
+        order. The live ones are streamed and merged against them, so of
+        those, only the ones that differ are held in memory. The changes
+        are sent in as few requests as possible.
+
+        :param desired_records: An iterable of ResourceRecordSets,
+            :py:class:`RawResourceRecordSets <route53.raw.RawResourceRecordSet>`,
+            or dicts with ``name``, ``rrset_type`` and ``records`` keys,
+            plus any of the other RawResourceRecordSet fields. Dicts
+            default to a ``ttl`` of 60.
+        :keyword bool dry_run: If ``True``, only work out the changes,
+            without sending them.
+        :keyword str comment: An optional comment to go along with each
+            request.
+        :keyword int page_chunks: The page size of the live listing.
+
+        The ``max_changes``, ``max_records`` and ``max_value_chars``
+        keyword arguments override Route53's per-request limits, see
+        :py:class:`ChangeBatch <route53.batch.ChangeBatch>`.
+
+        :rtype: :py:class:`SyncPlan <route53.sync.SyncPlan>`
+        :returns: The changes, with the number of requests they take in
+            ``request_count``. Unless this was a dry run, they've been sent,
+            and the change info dicts are in ``change_infos``.
+        """
+
+        self._halt_if_already_deleted()
+
+        # Imported here, since the parsers import this module.
+        from route53.sync import plan_sync
+        plan = plan_sync(
+            self, desired_records, comment=comment, page_chunks=page_chunks,
+            **limits
+        )
+        if not dry_run and len(plan):
+            plan.apply()
+        return plan
+
     def _add_record(self, record_set_class, name, values, ttl=60, weight=None,
                     region=None,set_identifier=None, alias_hosted_zone_id=None,
                     alias_dns_name=None, health_check=None):
@@ -0,0 +1,188 @@
+"""
+Client-side rate limiting. Route 53 throttles each AWS account to a small
+number of requests per second, and anything over that comes back as a
+``Throttling`` error, wasting a round trip. Limiting on our end lets
+parallel workers run right at the quota instead.
+"""
+
+import os
+import struct
+import threading
+import time
+from route53.exceptions import Route53Error
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows.
+    fcntl = None
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket. Tokens trickle in at ``rate`` per second,
+    up to ``burst`` of them, and each request takes one.
+
+    Callers that find the bucket empty don't spin. They take a reservation
+    on a future token, and are told how long to wait for it. This keeps
+    waiting callers in order, and keeps the request rate right at ``rate``
+    no matter how many threads are queued up.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        """
+        :param float rate: The sustained number of requests per second.
+        :keyword int burst: The number of requests that may be sent back to
+            back after a quiet period. Defaults to ``rate`` (and at least 1).
+        :keyword callable clock: Returns the current time in seconds. Mostly
+            here for the unit tests.
+        """
+
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self._clock = clock
+        self._tokens = self.burst
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Takes ``tokens`` from the bucket, even if that puts it in the red.
+
+        :keyword int tokens: How many tokens to take.
+        :rtype: float
+        :returns: The number of seconds the caller has to wait before its
+            tokens are actually available. ``0`` if it may go right away.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._tokens, delay = self._take(
+                self._tokens, self._last_refill, now, tokens
+            )
+            self._last_refill = now
+            return delay
+
+    def _take(self, available, last_refill, now, tokens):
+        """
+        The bucket arithmetic, shared by all the bucket flavors.
+
+        :param float available: The number of tokens at ``last_refill``.
+            May be negative, if there are outstanding reservations.
+        :param float last_refill: When ``available`` was last updated.
+        :param float now: The current time.
+        :param int tokens: How many tokens to take.
+        :rtype: tuple
+        :returns: A tuple in the form of ``(available, delay)``, with the
+            number of tokens left after this reservation, and the number of
+            seconds the caller has to wait for its tokens.
+        """
+
+        available = min(
+            self.burst,
+            available + max(0, now - last_refill) * self.rate
+        )
+        available -= tokens
+
+        if available >= 0:
+            return available, 0
+        return available, -available / self.rate
+
+    def acquire(self, tokens=1):
+        """
+        Takes ``tokens`` from the bucket, blocking until they're available.
+
+        :keyword int tokens: How many tokens to take.
+        """
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket whose state lives in a small file, guarded by an
+    exclusive ``flock``. Every process on the host that points a
+    FileTokenBucket at the same path draws from the same budget, so a pool
+    of worker processes can run at the account's quota as a whole.
+
+    Pass one of these to a connection's ``rate_limiter`` kwarg. It is safe
+    to create it before forking, each process opens its own handle to the
+    file on first use.
+
+    .. note:: This relies on ``fcntl``, so it is only available on POSIX
+        systems. The file should be on a local filesystem.
+    """
+
+    # Available tokens, and the time they were counted at.
+    _STATE = struct.Struct('<dd')
+
+    def __init__(self, path, rate, burst=None, clock=time.time):
+        """
+        :param str path: The file to keep the shared state in. It is created
+            if it doesn't exist yet.
+        :param float rate: The sustained number of requests per second,
+            shared by all processes.
+        :keyword int burst: The number of requests that may be sent back to
+            back after a quiet period. Defaults to ``rate`` (and at least 1).
+        :keyword callable clock: Returns the current time in seconds. This
+            has to be comparable across processes, so it defaults to
+            :py:func:`time.time`.
+        """
+
+        if fcntl is None:
+            raise Route53Error("FileTokenBucket requires fcntl (POSIX only).")
+
+        super(FileTokenBucket, self).__init__(rate, burst, clock)
+        self.path = path
+        self._fd = None
+        self._fd_pid = None
+
+    def _get_fd(self):
+        """
+        :rtype: int
+        :returns: A file descriptor for the state file, opened by this
+            process. Descriptors inherited over a fork share their lock
+            with the parent, so those can't be used.
+        """
+
+        pid = os.getpid()
+        if self._fd_pid != pid:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._fd_pid = pid
+        return self._fd
+
+    def reserve(self, tokens=1):
+        """
+        Takes ``tokens`` from the shared bucket, even if that puts it in the
+        red.
+
+        :keyword int tokens: How many tokens to take.
+        :rtype: float
+        :returns: The number of seconds the caller has to wait before its
+            tokens are actually available. ``0`` if it may go right away.
+        """
+
+        # flock only excludes other open files, so the threads within this
+        # process take turns first.
+        with self._lock:
+            fd = self._get_fd()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = self._clock()
+                raw = os.pread(fd, self._STATE.size, 0)
+                if len(raw) == self._STATE.size:
+                    available, last_refill = self._STATE.unpack(raw)
+                else:
+                    # A brand new file starts out full.
+                    available, last_refill = self.burst, now
+
+                available, delay = self._take(available, last_refill, now, tokens)
+                os.pwrite(fd, self._STATE.pack(available, now), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+        return delay
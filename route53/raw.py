@@ -0,0 +1,43 @@
+"""
+Plain, immutable stand-ins for the model classes, handed back by the listing
+methods when called with ``raw=True``. They hold the parsed values and
+nothing else: no connection, no change tracking, and no methods to save
+or delete with. That makes them cheap to build and to keep around in bulk,
+for exports and the like.
+
+They are namedtuples, so fields can be read by name or by position, and
+``_asdict()`` turns one into a dict.
+"""
+
+from collections import namedtuple
+
+RawResourceRecordSet = namedtuple('RawResourceRecordSet', (
+    'zone_id', 'name', 'rrset_type', 'ttl', 'records', 'set_identifier',
+    'weight', 'region', 'health_check', 'failover', 'alias_hosted_zone_id',
+    'alias_dns_name',
+))
+RawResourceRecordSet.__doc__ = """
+A record set, as listed by
+:py:meth:`HostedZone.list_record_sets <route53.hosted_zone.HostedZone.list_record_sets>`.
+``ttl`` is an int (``None`` for aliases), and ``records`` is a tuple. The
+rest are strings as the API returns them, or ``None`` where missing.
+"""
+
+RawHostedZone = namedtuple('RawHostedZone', (
+    'id', 'name', 'caller_reference', 'resource_record_set_count', 'comment',
+))
+RawHostedZone.__doc__ = """
+A hosted zone, as listed by
+:py:meth:`Route53Connection.list_hosted_zones <route53.connection.Route53Connection.list_hosted_zones>`.
+``resource_record_set_count`` is an int.
+"""
+
+RawHealthCheck = namedtuple('RawHealthCheck', (
+    'id', 'caller_reference', 'ipaddress', 'port', 'type', 'resource_path',
+    'fqdn', 'search_string', 'health_check_version',
+))
+RawHealthCheck.__doc__ = """
+A health check, as listed by
+:py:meth:`Route53Connection.list_health_checks <route53.connection.Route53Connection.list_health_checks>`.
+``port`` is an int, or ``None`` for checks without one (calculated checks).
+"""
@@ -0,0 +1,206 @@
+"""
+Narrows a record set listing down to a range of the zone: one name, one
+subtree, or a span of names. The listing is started at the beginning of
+the range, and stopped as soon as it has moved past the end, so small
+ranges of big zones only cost a page or two.
+"""
+
+from route53.exceptions import Route53Error
+from route53.util import normalize_record_name, record_name_sort_key
+
+class BaseRecordRange(object):
+    """
+    The common bits of the range classes. Sub-classes implement
+    :py:meth:`start_params`, :py:meth:`is_past` and :py:meth:`matches`.
+    """
+
+    def start_params(self):
+        """
+        :rtype: dict
+        :returns: The ``name`` and ``type`` params to start the listing at.
+        """
+
+        raise NotImplementedError
+
+    def is_past(self, rrset):
+        """
+        :param rrset: A listed record set, from a listing started at
+            :py:meth:`start_params`.
+        :rtype: bool
+        :returns: ``True`` if the listing has moved past the end of the
+            range, meaning nothing after ``rrset`` can match.
+        """
+
+        raise NotImplementedError
+
+    def matches(self, rrset):
+        """
+        :param rrset: A listed record set, within the range.
+        :rtype: bool
+        :returns: ``True`` if ``rrset`` is to be yielded.
+        """
+
+        return True
+
+    def filter(self, record_sets):
+        """
+        :param generator record_sets: A listing started at
+            :py:meth:`start_params`.
+        :rtype: generator
+        :returns: The record sets within the range. The listing is closed
+            once past its end.
+        """
+
+        try:
+            for rrset in record_sets:
+                if self.is_past(rrset):
+                    break
+                if self.matches(rrset):
+                    yield rrset
+        finally:
+            # Stops paging, and hands back a streamed response.
+            record_sets.close()
+
+    async def afilter(self, record_sets):
+        """
+        Async generator counterpart of :py:meth:`filter`.
+        """
+
+        try:
+            async for rrset in record_sets:
+                if self.is_past(rrset):
+                    break
+                if self.matches(rrset):
+                    yield rrset
+        finally:
+            await record_sets.aclose()
+
+class RecordRange(BaseRecordRange):
+    """
+    A range of record sets, as given to
+    :py:meth:`HostedZone.list_record_sets <route53.hosted_zone.HostedZone.list_record_sets>`.
+
+    Route53 lists record sets ordered by name, with the labels reversed
+    (see :py:func:`record_name_sort_key <route53.util.record_name_sort_key>`),
+    then by type. A name and everything beneath it is therefore one
+    contiguous run of the listing, starting at the name itself. So is one
+    type at one name.
+    """
+
+    def __init__(self, name=None, rrset_type=None, subtree=False):
+        """
+        :keyword str name: Only record sets with this name. The trailing dot
+            is optional, and case doesn't matter.
+        :keyword str rrset_type: Only record sets of this type, like
+            ``'A'``.
+        :keyword bool subtree: If ``True``, also include every record set
+            beneath ``name``. A leading ``*.`` on ``name`` is dropped.
+        """
+
+        if subtree and not name:
+            raise Route53Error("A subtree needs a name.")
+
+        if name is not None:
+            name = normalize_record_name(name)
+            if subtree and name.startswith('\\052.'):
+                name = name[len('\\052.'):]
+
+        self.name = name
+        self.rrset_type = rrset_type.upper() if rrset_type else None
+        self.subtree = subtree
+
+        if subtree:
+            self._name_key = record_name_sort_key(name)
+
+    def start_params(self):
+        """
+        :rtype: dict
+        :returns: The ``name`` and ``type`` params to start the listing at.
+            The type can only be pushed down along with an exact name. It's
+            filtered on as the listing goes, otherwise.
+        """
+
+        if self.name is None:
+            return {}
+        if self.subtree or self.rrset_type is None:
+            return {'name': self.name}
+        return {'name': self.name, 'type': self.rrset_type}
+
+    def is_past(self, rrset):
+        if self.name is None:
+            return False
+        if self.subtree:
+            return not record_name_sort_key(rrset.name).startswith(self._name_key)
+        if rrset.name != self.name:
+            return True
+        return self.rrset_type is not None and rrset.rrset_type != self.rrset_type
+
+    def matches(self, rrset):
+        return self.rrset_type is None or rrset.rrset_type == self.rrset_type
+
+class NameSpan(BaseRecordRange):
+    """
+    The record sets from one name, up to (but not including) another, in
+    the order the API lists them. Used to split a zone into partitions that
+    can be listed side by side, see
+    :py:meth:`HostedZone.scan_record_sets <route53.hosted_zone.HostedZone.scan_record_sets>`.
+    """
+
+    def __init__(self, start=None, end=None):
+        """
+        :keyword str start: The name to start at. Defaults to the start of
+            the zone.
+        :keyword str end: The name to stop before. Defaults to the end of
+            the zone.
+        """
+
+        self.start = normalize_record_name(start) if start else None
+        self.end = normalize_record_name(end) if end else None
+        self._end_key = record_name_sort_key(self.end) if end else None
+
+    def start_params(self):
+        if self.start is None:
+            return {}
+        return {'name': self.start}
+
+    def is_past(self, rrset):
+        return (
+            self._end_key is not None and
+            record_name_sort_key(rrset.name) >= self._end_key
+        )
+
+# Leading characters of the default split points, see split_zone().
+_SPLIT_CHARS = 'abcdefghijklmnopqrstuvwxyz'
+
+def split_zone(zone_name, partitions, split_names=None):
+    """
+    Splits a zone's name space into spans, to be listed side by side.
+
+    Without ``split_names``, the zone is split on the first letter of the
+    label right beneath the zone's name, as evenly as the alphabet allows.
+    That's a rough guess. Zones whose names bunch up (``host-0001``,
+    ``host-0002``...) are better split with ``split_names``.
+
+    :param str zone_name: The zone's name.
+    :param int partitions: The number of spans to aim for.
+    :keyword list split_names: Names to split at, instead.
+    :rtype: list
+    :returns: A list of :py:class:`NameSpan` instances, in listing order,
+        covering the whole zone.
+    """
+
+    if split_names is None:
+        zone_name = normalize_record_name(zone_name)
+        split_names = [
+            _SPLIT_CHARS[len(_SPLIT_CHARS) * i // partitions] + '.' + zone_name
+            for i in range(1, min(partitions, len(_SPLIT_CHARS)))
+        ]
+
+    # Dupes would make for empty spans.
+    split_names = sorted(
+        set(normalize_record_name(name) for name in split_names),
+        key=record_name_sort_key
+    )
+
+    bounds = [None] + split_names + [None]
+    return [NameSpan(start, end) for start, end in zip(bounds, bounds[1:])]
@@ -0,0 +1,341 @@
+"""
+A columnar snapshot of a hosted zone's record sets. Rather than one
+ResourceRecordSet instance per record set, each field is kept in its own
+array-backed column, and filters run over whole columns at a time. Real
+record sets are only built for the rows you ask for.
+"""
+
+import ipaddress
+from array import array
+from route53.exceptions import Route53Error
+from route53.xml_parsers.list_resource_record_sets_by_zone_id import RRSET_TYPE_TO_RSET_SUBCLASS_MAP
+
+# Record set types, in the order of their codes in the type column. Types
+# that aren't in here (CAA, DS, NAPTR...) are given the next free code, per
+# table, as they turn up.
+RRSET_TYPES = tuple(sorted(RRSET_TYPE_TO_RSET_SUBCLASS_MAP))
+RRSET_TYPE_CODES = dict((rrset_type, code) for code, rrset_type in enumerate(RRSET_TYPES))
+
+# Stands in for a missing TTL or weight in the numeric columns.
+MISSING = -1
+
+class RecordTable(object):
+    """
+    Holds the record sets of one hosted zone, one column per field:
+
+    * ``names``: A list of names.
+    * ``types``: A bytearray of type codes. See ``rrset_types``.
+    * ``ttls``, ``weights``: Arrays of ints, ``-1`` where missing.
+    * ``set_identifiers``: A list of set identifiers, ``None`` where missing.
+    * ``values``: A flat list of every record set's values, one after
+      another. Row ``i``'s values are
+      ``values[value_offsets[i]:value_offsets[i + 1]]``.
+
+    The rarely used fields (regions, health checks and alias targets) are
+    kept in dicts, keyed by row.
+
+    Get one from :py:meth:`HostedZone.record_table <route53.hosted_zone.HostedZone.record_table>`.
+    Narrow it down with :py:meth:`filter`, which hands back row numbers,
+    then turn those into real record sets with :py:meth:`to_record_sets`::
+
+        table = zone.record_table()
+        rows = table.filter(rrset_type='A', min_ttl=301, network='10.0.0.0/8')
+        for rrset in table.to_record_sets(rows):
+            print(rrset.name, rrset.records)
+    """
+
+    def __init__(self, connection, zone_id):
+        """
+        :param Route53Connection connection: The connection the record sets
+            built by :py:meth:`to_record_sets` will use.
+        :param str zone_id: The zone ID of the HostedZone the record sets
+            belong to.
+        """
+
+        self.connection = connection
+        self.zone_id = zone_id
+
+        self.rrset_types = list(RRSET_TYPES)
+        """The record set types, indexed by their codes in ``types``."""
+        self._type_codes = dict(RRSET_TYPE_CODES)
+
+        self.names = []
+        self.types = bytearray()
+        self.ttls = array('q')
+        self.weights = array('q')
+        self.set_identifiers = []
+        self.values = []
+        self.value_offsets = array('q', [0])
+
+        self.regions = {}
+        self.health_checks = {}
+        self.alias_targets = {}
+
+        # Parsed IP addresses for the values column, built on first use.
+        self._value_ips = None
+
+    @classmethod
+    def from_record_sets(cls, record_sets, connection, zone_id):
+        """
+        Builds a table out of record sets. They can be thrown away as soon
+        as they've been added, so it's best to pass a generator.
+
+        :param record_sets: An iterable of ResourceRecordSet instances, or
+            :py:class:`RawResourceRecordSet <route53.raw.RawResourceRecordSet>`
+            tuples.
+        :param Route53Connection connection: See :py:meth:`__init__`.
+        :param str zone_id: See :py:meth:`__init__`.
+        :rtype: RecordTable
+        """
+
+        table = cls(connection, zone_id)
+        for rrset in record_sets:
+            table.add_record_set(rrset)
+        return table
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_record_set(self, rrset):
+        """
+        Appends a row with the values of ``rrset``.
+
+        :param rrset: The record set to add.
+        :type rrset: ResourceRecordSet or RawResourceRecordSet
+        """
+
+        self.add(
+            name=rrset.name,
+            rrset_type=rrset.rrset_type,
+            ttl=rrset.ttl,
+            records=rrset.records,
+            set_identifier=rrset.set_identifier,
+            weight=rrset.weight,
+            region=rrset.region,
+            health_check=rrset.health_check,
+            alias_hosted_zone_id=getattr(rrset, 'alias_hosted_zone_id', None),
+            alias_dns_name=getattr(rrset, 'alias_dns_name', None),
+        )
+
+    def add(self, name, rrset_type, ttl=None, records=(), set_identifier=None,
+            weight=None, region=None, health_check=None,
+            alias_hosted_zone_id=None, alias_dns_name=None):
+        """
+        Appends a row. Takes the same values as the ResourceRecordSet
+        constructors.
+        """
+
+        row = len(self.names)
+
+        self.names.append(name)
+        self.types.append(self._get_type_code(rrset_type))
+        self.ttls.append(int(ttl) if ttl is not None else MISSING)
+        self.weights.append(int(weight) if weight is not None else MISSING)
+        self.set_identifiers.append(set_identifier)
+        self.values.extend(records)
+        self.value_offsets.append(len(self.values))
+
+        if region is not None:
+            self.regions[row] = region
+        if health_check is not None:
+            self.health_checks[row] = health_check
+        if alias_hosted_zone_id or alias_dns_name:
+            self.alias_targets[row] = (alias_hosted_zone_id, alias_dns_name)
+
+        self._value_ips = None
+
+    def _get_type_code(self, rrset_type):
+        """
+        :param str rrset_type: A record set type, like ``'A'``.
+        :rtype: int
+        :returns: The type's code in the type column, assigning it one if
+            it hasn't got one yet.
+        """
+
+        code = self._type_codes.get(rrset_type)
+        if code is None:
+            code = len(self.rrset_types)
+            if code > 255:
+                raise Route53Error(
+                    "Too many record set types to add %s." % rrset_type)
+            self.rrset_types.append(rrset_type)
+            self._type_codes[rrset_type] = code
+        return code
+
+    def filter(self, rows=None, rrset_type=None, min_ttl=None, max_ttl=None,
+               name_suffix=None, value=None, network=None):
+        """
+        Finds the rows that match all of the given conditions.
+
+        :keyword rows: Only look at these rows, for example those returned
+            by an earlier call. Defaults to all of them.
+        :keyword str rrset_type: Only rows of this type, like ``'A'``.
+        :keyword int min_ttl: Only rows whose TTL is at least this. Rows
+            without a TTL (aliases) never match.
+        :keyword int max_ttl: Only rows whose TTL is at most this.
+        :keyword str name_suffix: Only rows whose name is, or is beneath,
+            this name. A trailing dot is optional.
+        :keyword str value: Only rows with this exact value among their
+            values.
+        :keyword network: Only rows with at least one value that is an IP
+            address within this network, like ``'10.0.0.0/8'``.
+        :type network: str or ipaddress.IPv4Network or ipaddress.IPv6Network
+        :rtype: array.array
+        :returns: The matching row numbers, in order.
+        """
+
+        if rrset_type is not None:
+            rows = self._filter_type(rows, rrset_type)
+        elif rows is None:
+            rows = range(len(self.names))
+
+        if min_ttl is not None or max_ttl is not None:
+            low = MISSING + 1 if min_ttl is None else min_ttl
+            ttls = self.ttls
+            if max_ttl is None:
+                rows = [row for row in rows if ttls[row] >= low]
+            else:
+                rows = [row for row in rows if low <= ttls[row] <= max_ttl]
+
+        if name_suffix is not None:
+            rows = self._filter_name_suffix(rows, name_suffix)
+
+        if value is not None:
+            values = self.values
+            offsets = self.value_offsets
+            rows = [
+                row for row in rows
+                if value in values[offsets[row]:offsets[row + 1]]
+            ]
+
+        if network is not None:
+            rows = self._filter_network(rows, network)
+
+        return array('q', rows)
+
+    def _filter_type(self, rows, rrset_type):
+        """
+        :rtype: list
+        :returns: The rows of type ``rrset_type``, out of ``rows``.
+        """
+
+        code = self._type_codes.get(rrset_type)
+        if code is None:
+            # No row has ever had this type.
+            return []
+
+        types = self.types
+        if rows is not None:
+            return [row for row in rows if types[row] == code]
+
+        # Let bytearray.find() skip over the other types in C.
+        matches = []
+        find = types.find
+        row = find(code)
+        while row != -1:
+            matches.append(row)
+            row = find(code, row + 1)
+        return matches
+
+    def _filter_name_suffix(self, rows, name_suffix):
+        """
+        :rtype: list
+        :returns: The rows whose name is, or is beneath, ``name_suffix``.
+        """
+
+        name_suffix = name_suffix.rstrip('.') + '.'
+        # Beneath the name means on a label boundary.
+        sub_suffix = '.' + name_suffix
+        names = self.names
+        return [
+            row for row in rows
+            if names[row] == name_suffix or names[row].endswith(sub_suffix)
+        ]
+
+    def _filter_network(self, rows, network):
+        """
+        :rtype: list
+        :returns: The rows with at least one value within ``network``.
+        """
+
+        network = ipaddress.ip_network(network)
+        low = int(network.network_address)
+        high = int(network.broadcast_address)
+        version = network.version
+
+        versions, ips = self._get_value_ips()
+        offsets = self.value_offsets
+
+        matches = []
+        for row in rows:
+            for i in range(offsets[row], offsets[row + 1]):
+                if versions[i] == version and low <= ips[i] <= high:
+                    matches.append(row)
+                    break
+        return matches
+
+    def _get_value_ips(self):
+        """
+        Parses the values column as IP addresses, once.
+
+        :rtype: tuple
+        :returns: A tuple in the form of ``(versions, ips)``, parallel to
+            the values column. ``versions`` is a bytearray of IP versions
+            (``0`` for values that aren't IP addresses), and ``ips`` is a
+            list of their integer forms.
+        """
+
+        if self._value_ips is None:
+            versions = bytearray(len(self.values))
+            ips = [0] * len(self.values)
+            for i, value in enumerate(self.values):
+                try:
+                    ip = ipaddress.ip_address(value)
+                except ValueError:
+                    continue
+                versions[i] = ip.version
+                ips[i] = int(ip)
+            self._value_ips = (versions, ips)
+        return self._value_ips
+
+    def to_record_sets(self, rows=None):
+        """
+        Builds real record sets for the given rows.
+
+        :keyword rows: The row numbers, as returned by :py:meth:`filter`.
+            Defaults to all of them.
+        :rtype: list
+        :returns: A list of ResourceRecordSet sub-class instances.
+        """
+
+        if rows is None:
+            rows = range(len(self.names))
+
+        return [self._build_record_set(row) for row in rows]
+
+    def _build_record_set(self, row):
+        rrset_type = self.rrset_types[self.types[row]]
+        if rrset_type not in RRSET_TYPE_TO_RSET_SUBCLASS_MAP:
+            raise Route53Error(
+                "Can't build a record set for %s, an unsupported type." % rrset_type)
+
+        ttl = self.ttls[row]
+        weight = self.weights[row]
+
+        kwargs = {
+            'connection': self.connection,
+            'zone_id': self.zone_id,
+            'name': self.names[row],
+            'ttl': ttl if ttl != MISSING else None,
+            'records': self.values[self.value_offsets[row]:self.value_offsets[row + 1]],
+            'set_identifier': self.set_identifiers[row],
+            # The API hands these back as strings.
+            'weight': str(weight) if weight != MISSING else None,
+            'region': self.regions.get(row),
+            'health_check': self.health_checks.get(row),
+        }
+
+        if row in self.alias_targets:
+            kwargs['alias_hosted_zone_id'], kwargs['alias_dns_name'] = self.alias_targets[row]
+
+        return RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset_type](**kwargs)
@@ -10,9 +10,26 @@ class ResourceRecordSet(object):
         one of the methods on:py:class:`route53.connection.Route53Connection`.
     """
 
+    # Instances don't get a __dict__. There can be hundreds of thousands of
+    # these in memory when walking a big zone.
+    __slots__ = (
+        'connection', 'zone_id', 'name', 'ttl', 'records', 'region',
+        'weight', 'health_check', 'set_identifier', '_initial_snapshot',
+        # The raw XML element of a lazily parsed record set, until it has
+        # been parsed. See route53.xml_parsers.list_resource_record_sets_by_zone_id.
+        '_element',
+    )
+
     # Override this in your sub-class.
     rrset_type = None
 
+    # The attributes whose initial values are kept, to detect changes that
+    # need saving. Sub-classes with extra attributes extend this.
+    _tracked_fields = (
+        'zone_id', 'name', 'ttl', 'records', 'region', 'weight',
+        'health_check', 'set_identifier',
+    )
+
     def __init__(self, connection, zone_id, name, ttl, records, weight=None,
                  region=None, set_identifier=None, health_check=None, failover=None):
         """
@@ -42,7 +59,7 @@ class ResourceRecordSet(object):
         self.connection = connection
         self.zone_id = zone_id
         self.name = name
-        self.ttl = int(ttl) if ttl else None
+        self.ttl = int(ttl) if ttl is not None else None
         self.records = records
         self.region = region
         self.weight = weight
@@ -51,21 +68,45 @@ class ResourceRecordSet(object):
 
         # Keep track of the initial values for this record set. We use this
         # to detect changes that need saving.
-        self._initial_vals = dict(
-            connection=connection,
-            zone_id=zone_id,
-            name=name,
-            ttl=ttl,
-            records=records,
-            region=region,
-            weight=weight,
-            health_check=health_check,
-            set_identifier=set_identifier,
-        )
+        self._take_snapshot()
 
     def __str__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.name)
 
+    def _take_snapshot(self):
+        """
+        Stores the current values of the tracked attributes as the initial
+        ones. This is a plain tuple, in ``_tracked_fields`` order.
+        """
+
+        self._initial_snapshot = tuple(
+            [getattr(self, key) for key in self._tracked_fields]
+        )
+
+    @property
+    def _initial_vals(self):
+        """
+        :rtype: dict
+        :returns: The initial values of the tracked attributes, keyed by
+            attribute name. This is built on the fly, so changing it has no
+            effect.
+        """
+
+        return dict(zip(self._tracked_fields, self._initial_snapshot))
+
+    @property
+    def values(self):
+        """
+        An alias for :py:attr:`records`, matching the ``values`` argument
+        of the ``HostedZone.create_*_record`` methods.
+        """
+
+        return self.records
+
+    @values.setter
+    def values(self, values):
+        self.records = values
+
     @property
     def hosted_zone(self):
         """
@@ -91,7 +132,7 @@ class ResourceRecordSet(object):
             and ``False`` if not.
         """
 
-        for key, val in self._initial_vals:
+        for key, val in zip(self._tracked_fields, self._initial_snapshot):
             if getattr(self, key) != val:
                 # One of the initial values doesn't match, we know
                 # this object has been touched.
@@ -99,6 +140,21 @@ class ResourceRecordSet(object):
 
         return False
 
+    def _is_renamed(self):
+        """
+        Determines whether the name or set identifier were changed since the
+        last retrieval or save. An UPSERT would leave the record set under
+        the old ones be, and create another.
+
+        :rtype: bool
+        """
+
+        initial_vals = self._initial_vals
+        return (
+            self.name != initial_vals['name'] or
+            self.set_identifier != initial_vals['set_identifier']
+        )
+
     def delete(self):
         """
         Deletes this record set.
@@ -115,18 +171,21 @@ class ResourceRecordSet(object):
         """
 
         cset = ChangeSet(connection=self.connection, hosted_zone_id=self.zone_id)
-        # Record sets can't actually be modified. You have to delete the
-        # existing one and create a new one. Since this happens within a single
-        # change set, it appears that the values were modified, when instead
-        # the whole thing is replaced.
-        cset.add_change('DELETE', self)
-        cset.add_change('CREATE', self)
+        if self.connection.supports_upsert and not self._is_renamed():
+            # Replaces the record set in a single change.
+            cset.add_change('UPSERT', self)
+        else:
+            # Record sets can't actually be modified. You have to delete the
+            # existing one and create a new one. Since this happens within a
+            # single change set, it appears that the values were modified,
+            # when instead the whole thing is replaced.
+            cset.add_change('DELETE', self)
+            cset.add_change('CREATE', self)
         retval = self.connection._change_resource_record_sets(cset)
 
-        # Now copy the current attribute values on this instance to
-        # the initial_vals dict. This will re-set the modification tracking.
-        for key, val in self._initial_vals.items():
-            self._initial_vals[key] = getattr(self, key)
+        # Now snapshot the current attribute values on this instance. This
+        # will re-set the modification tracking.
+        self._take_snapshot()
 
         return retval
 
@@ -156,8 +215,14 @@ class AResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ('alias_hosted_zone_id', 'alias_dns_name')
+
     rrset_type = 'A'
 
+    _tracked_fields = ResourceRecordSet._tracked_fields + (
+        'alias_hosted_zone_id', 'alias_dns_name',
+    )
+
     def __init__(self, alias_hosted_zone_id=None, alias_dns_name=None, *args, **kwargs):
         """
         :keyword str alias_hosted_zone_id: Alias A records have this specified.
@@ -166,19 +231,11 @@ class AResourceRecordSet(ResourceRecordSet):
             the DNS name for the ELB that the Alias points to.
         """
 
-        super(AResourceRecordSet, self).__init__(*args, **kwargs)
-
+        # Set before the parent class takes its snapshot of initial values.
         self.alias_hosted_zone_id = alias_hosted_zone_id
         self.alias_dns_name = alias_dns_name
 
-        # Keep track of the initial values for this record set. We use this
-        # to detect changes that need saving.
-        self._initial_vals.update(
-            dict(
-                alias_hosted_zone_id=alias_hosted_zone_id,
-                alias_dns_name=alias_dns_name,
-            )
-        )
+        super(AResourceRecordSet, self).__init__(*args, **kwargs)
 
     def is_alias_record_set(self):
         """
@@ -200,6 +257,8 @@ class AAAAResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'AAAA'
 
 
@@ -211,6 +270,8 @@ class CNAMEResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'CNAME'
 
 
@@ -222,6 +283,8 @@ class MXResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'MX'
 
 
@@ -233,6 +296,8 @@ class NSResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'NS'
 
 
@@ -244,6 +309,8 @@ class PTRResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'PTR'
 
 
@@ -254,6 +321,8 @@ class SOAResourceRecordSet(ResourceRecordSet):
     They can't be created.
     """
 
+    __slots__ = ()
+
     rrset_type = 'SOA'
 
     def delete(self):
@@ -272,6 +341,8 @@ class SPFResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'SPF'
 
 
@@ -283,6 +354,8 @@ class SRVResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'SRV'
 
 
@@ -294,4 +367,6 @@ class TXTResourceRecordSet(ResourceRecordSet):
     :py:meth:`HostedZone.record_sets <route53.hosted_zone.HostedZone.record_sets>`.
     """
 
+    __slots__ = ()
+
     rrset_type = 'TXT'
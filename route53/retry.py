@@ -0,0 +1,69 @@
+"""
+Retry policies, used by the transports to decide whether (and when) a
+failed request is sent again.
+"""
+
+import random
+
+class RetryPolicy(object):
+    """
+    Retries errors that are flagged as ``retryable`` (throttling, a prior
+    change still being applied, 5xx responses, and network trouble on GETs
+    or before a request went out) with exponential backoff and "full
+    jitter": the n-th retry waits a random amount of time between zero and
+    ``base_delay * 2 ** (n - 1)``, capped at ``max_delay``. The randomness keeps parallel workers that got
+    throttled at the same moment from retrying in lockstep.
+
+    Everything else (bad input, invalid change batches, missing zones) is
+    raised right away.
+    """
+
+    def __init__(self, max_attempts=5, deadline=None, base_delay=0.1,
+                 max_delay=10.0, random_func=random.uniform):
+        """
+        :keyword int max_attempts: The total number of times a request may
+            be sent, including the first one. ``1`` disables retries.
+        :keyword float deadline: If set, the number of seconds after the
+            first attempt past which no more retries are started.
+        :keyword float base_delay: The backoff ceiling for the first retry,
+            in seconds. It doubles on each retry after that.
+        :keyword float max_delay: The highest the backoff ceiling may go,
+            in seconds.
+        :keyword callable random_func: Called as ``random_func(low, high)``
+            to pick each delay. Mostly here for the unit tests.
+        """
+
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random_func = random_func
+
+    def get_delay(self, error, attempt, elapsed):
+        """
+        Decides what to do after a failed attempt.
+
+        :param Exception error: The exception raised by the attempt.
+        :param int attempt: The number of attempts made so far, starting
+            at 1.
+        :param float elapsed: The number of seconds since the first attempt
+            was started.
+        :rtype: float or None
+        :returns: The number of seconds to wait before trying again, or
+            ``None`` if the error should be raised.
+        """
+
+        if not getattr(error, 'retryable', False):
+            return None
+
+        if attempt >= self.max_attempts:
+            return None
+
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = self._random_func(0, ceiling)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            # We'd blow through the deadline while waiting.
+            return None
+
+        return delay
@@ -0,0 +1,318 @@
+"""
+Brings a hosted zone in line with a desired set of record sets, making as
+few changes as it takes. See
+:py:meth:`HostedZone.sync <route53.hosted_zone.HostedZone.sync>`.
+
+The desired record sets are sorted into the order the API lists them, and
+so are held in memory. The live record sets are streamed, and merged
+against the desired ones a name at a time, so of the live zone, only the
+differences are kept in memory.
+"""
+
+import itertools
+
+from route53.batch import ChangeBatch
+from route53.exceptions import Route53Error
+from route53.raw import RawResourceRecordSet
+from route53.util import normalize_record_name, record_name_sort_key
+from route53.xml_parsers.list_resource_record_sets_by_zone_id import RRSET_TYPE_TO_RSET_SUBCLASS_MAP
+
+# The fields that make a record set differ from another with the same name,
+# type and set identifier.
+_COMPARED_FIELDS = (
+    'ttl', 'records', 'weight', 'region', 'health_check',
+    'alias_hosted_zone_id', 'alias_dns_name',
+)
+
+def to_raw_record_set(record, zone_id):
+    """
+    Turns a desired record set into a normalized
+    :py:class:`RawResourceRecordSet <route53.raw.RawResourceRecordSet>`,
+    so that it compares equal to the live one it matches.
+
+    :param record: A ResourceRecordSet, a RawResourceRecordSet, or a dict
+        with ``name``, ``rrset_type`` and ``records`` keys, and optionally
+        ``ttl`` (defaults to 60, ``None`` for aliases) and any of the other
+        RawResourceRecordSet fields.
+    :param str zone_id: The ID of the zone being synced.
+    :rtype: RawResourceRecordSet
+    """
+
+    if isinstance(record, dict):
+        fields = dict((field, None) for field in RawResourceRecordSet._fields)
+        if not (record.get('alias_hosted_zone_id') or record.get('alias_dns_name')):
+            fields['ttl'] = 60
+        fields.update(record)
+    else:
+        fields = dict(
+            (field, getattr(record, field, None))
+            for field in RawResourceRecordSet._fields
+        )
+
+    unknown = set(fields) - set(RawResourceRecordSet._fields)
+    if unknown:
+        raise Route53Error("Unknown record set fields: %s" % ', '.join(sorted(unknown)))
+
+    fields['zone_id'] = zone_id
+    fields['name'] = normalize_record_name(fields['name'])
+    fields['rrset_type'] = fields['rrset_type'].upper()
+    fields['ttl'] = int(fields['ttl']) if fields['ttl'] is not None else None
+    fields['records'] = tuple(fields['records'] or ())
+    # The API hands weights back as strings.
+    if fields['weight'] is not None:
+        fields['weight'] = str(fields['weight'])
+    if fields['alias_dns_name']:
+        fields['alias_dns_name'] = normalize_record_name(fields['alias_dns_name'])
+    return RawResourceRecordSet(**fields)
+
+def _identity(rrset):
+    return rrset.rrset_type, rrset.set_identifier
+
+def _comparable(rrset):
+    values = [getattr(rrset, field) for field in _COMPARED_FIELDS]
+    # Value order doesn't matter to DNS.
+    values[1] = tuple(sorted(values[1]))
+    return values
+
+def _change_or_skip(action, live, desired):
+    rrset_type = (live or desired).rrset_type
+    if rrset_type not in RRSET_TYPE_TO_RSET_SUBCLASS_MAP:
+        return 'skip', live, desired
+    return action, live, desired
+
+def _iter_names(record_sets, side):
+    """
+    Groups record sets by name, checking they come in listing order.
+
+    :rtype: generator
+    :returns: A generator of ``(sort_key, record_sets)`` tuples.
+    """
+
+    last_key = None
+    for key, group in itertools.groupby(
+            record_sets, lambda rrset: record_name_sort_key(rrset.name)):
+        if last_key is not None and key <= last_key:
+            raise Route53Error(
+                "The %s record sets aren't in listing order, at %s." % (side, key))
+        last_key = key
+        yield key, list(group)
+
+def diff_record_sets(live, desired, zone_name):
+    """
+    Merges the live and the desired record sets of a zone, both in the
+    order the API lists them (see
+    :py:func:`record_name_sort_key <route53.util.record_name_sort_key>`),
+    and works out what needs changing. Record sets are matched by name,
+    type and set identifier.
+
+    The zone's SOA and apex NS record sets are never deleted, but are
+    modified if they're among the desired ones. Record sets of types that
+    can't be changed (those missing from
+    ``RRSET_TYPE_TO_RSET_SUBCLASS_MAP``, like CAA) are left be, and yielded
+    as ``'skip'`` if they'd otherwise have been changed.
+
+    :param live: An iterable of the zone's record sets, as listed.
+    :param desired: An iterable of normalized RawResourceRecordSets, in
+        listing order.
+    :param str zone_name: The zone's name.
+    :rtype: generator
+    :returns: A generator of ``(action, live_rrset, desired_rrset)``
+        tuples, where ``action`` is ``'create'``, ``'delete'``,
+        ``'modify'`` or ``'skip'``, and the record set that doesn't apply
+        is ``None``.
+    """
+
+    apex = normalize_record_name(zone_name)
+    sentinel = (None, None)
+    live_names = _iter_names(live, 'live')
+    desired_names = _iter_names(desired, 'desired')
+    live_key, live_group = next(live_names, sentinel)
+    desired_key, desired_group = next(desired_names, sentinel)
+
+    while live_key is not None or desired_key is not None:
+        if desired_key is None or (live_key is not None and live_key < desired_key):
+            current_live, current_desired = live_group, []
+            live_key, live_group = next(live_names, sentinel)
+        elif live_key is None or desired_key < live_key:
+            current_live, current_desired = [], desired_group
+            desired_key, desired_group = next(desired_names, sentinel)
+        else:
+            current_live, current_desired = live_group, desired_group
+            live_key, live_group = next(live_names, sentinel)
+            desired_key, desired_group = next(desired_names, sentinel)
+
+        wanted = {}
+        for rrset in current_desired:
+            if _identity(rrset) in wanted:
+                raise Route53Error(
+                    "%s %s is in the desired record sets more than once." % (
+                        rrset.name, rrset.rrset_type))
+            wanted[_identity(rrset)] = rrset
+
+        for rrset in current_live:
+            match = wanted.pop(_identity(rrset), None)
+            if match is None:
+                protected = rrset.rrset_type == 'SOA' or (
+                    rrset.rrset_type == 'NS' and normalize_record_name(rrset.name) == apex)
+                if not protected:
+                    yield _change_or_skip('delete', rrset, None)
+            elif _comparable(to_raw_record_set(rrset, match.zone_id)) != _comparable(match):
+                yield _change_or_skip('modify', rrset, match)
+
+        for rrset in current_desired:
+            if _identity(rrset) in wanted:
+                yield _change_or_skip('create', None, rrset)
+
+def build_record_set(rrset, connection):
+    """
+    :param RawResourceRecordSet rrset: The record set's fields.
+    :param Route53Connection connection: The connection it's changed through.
+    :rtype: ResourceRecordSet
+    :returns: An instance of the ResourceRecordSet sub-class for its type.
+    """
+
+    if rrset.rrset_type not in RRSET_TYPE_TO_RSET_SUBCLASS_MAP:
+        raise Route53Error("Can't change %s record sets." % rrset.rrset_type)
+
+    kwargs = {
+        'connection': connection,
+        'zone_id': rrset.zone_id,
+        'name': rrset.name,
+        'ttl': rrset.ttl,
+        'records': list(rrset.records),
+        'set_identifier': rrset.set_identifier,
+        'weight': rrset.weight,
+        'region': rrset.region,
+        'health_check': rrset.health_check,
+    }
+    if rrset.alias_hosted_zone_id or rrset.alias_dns_name:
+        kwargs['alias_hosted_zone_id'] = rrset.alias_hosted_zone_id
+        kwargs['alias_dns_name'] = rrset.alias_dns_name
+    return RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset.rrset_type](**kwargs)
+
+class SyncPlan(object):
+    """
+    The changes that bring a zone in line with the desired record sets, as
+    returned by :py:meth:`HostedZone.sync <route53.hosted_zone.HostedZone.sync>`.
+    Modifications are sent as UPSERTs, or as a DELETE plus a CREATE on API
+    versions without them.
+    """
+
+    def __init__(self, zone, comment=None, **limits):
+        """
+        :param HostedZone zone: The zone being synced.
+        :keyword str comment: An optional comment to go along with each
+            request.
+
+        See :py:class:`ChangeBatch <route53.batch.ChangeBatch>` for the
+        ``max_*`` limits.
+        """
+
+        self.zone = zone
+        self.comment = comment
+        self.limits = limits
+        self.creates = []
+        """The desired record sets missing from the zone."""
+        self.deletes = []
+        """The live record sets that aren't desired."""
+        self.modifies = []
+        """``(live, desired)`` pairs of record sets that differ."""
+        self.skipped = []
+        """
+        ``(live, desired)`` pairs of record sets of types that can't be
+        changed, which would otherwise have been created, modified or
+        deleted. Either may be ``None``. These are left be.
+        """
+        self.change_infos = []
+        """The change info dicts of the requests sent by :py:meth:`apply`."""
+
+    def __len__(self):
+        return len(self.creates) + len(self.deletes) + len(self.modifies)
+
+    def add(self, action, live, desired):
+        """
+        Adds a change, as yielded by :py:func:`diff_record_sets`.
+        """
+
+        if action == 'create':
+            self.creates.append(desired)
+        elif action == 'delete':
+            self.deletes.append(live)
+        elif action == 'skip':
+            self.skipped.append((live, desired))
+        else:
+            self.modifies.append((live, desired))
+
+    def build_batch(self):
+        """
+        :rtype: :py:class:`ChangeBatch <route53.batch.ChangeBatch>`
+        :returns: An uncommitted batch holding the plan's changes.
+        """
+
+        connection = self.zone.connection
+        batch = ChangeBatch(
+            connection, self.zone.id, comment=self.comment, **self.limits)
+
+        for rrset in self.deletes:
+            batch.delete(build_record_set(rrset, connection))
+        for live, desired in self.modifies:
+            if connection.supports_upsert:
+                batch.upsert(build_record_set(desired, connection))
+            else:
+                batch.delete(build_record_set(live, connection))
+                batch.create(build_record_set(desired, connection))
+        for rrset in self.creates:
+            batch.create(build_record_set(rrset, connection))
+        return batch
+
+    @property
+    def request_count(self):
+        """
+        The number of requests :py:meth:`apply` will send.
+        """
+
+        batch = self.build_batch()
+        return len(batch.change_set.split(**batch.limits))
+
+    def apply(self):
+        """
+        Sends the plan's changes, in as few requests as possible.
+
+        :rtype: list
+        :returns: A list of change info dicts, one per request sent.
+        """
+
+        change_infos = self.build_batch().commit()
+        self.change_infos.extend(change_infos)
+        return change_infos
+
+def plan_sync(zone, desired_records, comment=None, page_chunks=100, **limits):
+    """
+    Works out the changes that bring ``zone`` in line with
+    ``desired_records``, streaming its live record sets. The desired record
+    sets are read into memory and sorted into listing order, so they may
+    come in any order.
+
+    :param HostedZone zone: The zone to sync.
+    :param desired_records: An iterable of record sets, see
+        :py:func:`to_raw_record_set` for the forms they may take.
+    :keyword str comment: An optional comment to go along with each request.
+    :keyword int page_chunks: The page size of the live listing.
+    :rtype: SyncPlan
+    """
+
+    desired = sorted(
+        (to_raw_record_set(record, zone.id) for record in desired_records),
+        key=lambda rrset: record_name_sort_key(rrset.name)
+    )
+    live = zone.list_record_sets(raw=True, page_chunks=page_chunks)
+
+    plan = SyncPlan(zone, comment=comment, **limits)
+    try:
+        for action, live_rrset, desired_rrset in diff_record_sets(live, desired, zone.name):
+            plan.add(action, live_rrset, desired_rrset)
+    finally:
+        # Hands back a streamed response, if we bailed out part way.
+        if hasattr(live, 'close'):
+            live.close()
+    return plan
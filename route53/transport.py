@@ -8,7 +8,11 @@ import base64
 import hmac
 import hashlib
 import requests
-from route53.exceptions import Route53Error
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from concurrent.futures import ThreadPoolExecutor
+from route53.exceptions import Route53Error, TransportError
+from route53.xml_parsers.common_error import parse_error_body
 
 class BaseTransport(object):
     """
@@ -92,16 +96,81 @@ class BaseTransport(object):
         All outbound requests go through this method. It defers to the
         transport's various HTTP method-specific methods.
 
+        Requests that fail with a retryable error are sent again, as the
+        connection's retry policy allows. Each attempt draws from the
+        connection's rate limiter, if it has one.
+
         :param str path: The path to tack on to the endpoint URL for
             the query.
         :param data: The params to send along with the request.
         :type data: Either a dict or bytes, depending on the request type.
         :param str method: One of 'GET', 'POST', or 'DELETE'.
 
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
+        :raises: Route53APIError if the API answered with an error, or
+            TransportError if it couldn't be reached. See
+            :py:class:`TransportError <route53.exceptions.TransportError>`
+            for which of those are retried.
+        """
+
+        return self._send_with_retries(self._dispatch_request, path, data, method)
+
+    def send_streaming_request(self, path, data, method):
+        """
+        Like :py:meth:`send_request`, but hands the response body back in
+        chunks as it comes off the wire, so it can be parsed incrementally.
+
+        Retries only cover getting the response started. Once the body is
+        being streamed, any errors are raised to whoever is iterating.
+
+        See :py:meth:`send_request` for the arguments.
+
+        :rtype: iterable
+        :returns: An iterable of bytes chunks, making up the response body.
+        """
+
+        return self._send_with_retries(self._open_stream, path, data, method)
+
+    def _send_with_retries(self, send, path, data, method):
         """
+        Calls ``send(path, data, method)`` until it succeeds, or the
+        connection's retry policy gives up. Each attempt draws from the
+        connection's rate limiter, if it has one.
 
+        :param callable send: Sends a single attempt at the request.
+        :returns: Whatever ``send`` returns.
+        """
+
+        policy = self.connection._retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            limiter = self.connection._rate_limiter
+            if limiter is not None:
+                # Blocks until we're clear to send.
+                limiter.acquire()
+
+            try:
+                return send(path, data, method)
+            except Route53Error as exc:
+                delay = policy.get_delay(exc, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    def _dispatch_request(self, path, data, method):
+        """
+        Signs and sends a single attempt at a request, via the HTTP
+        method-specific methods.
+
+        See :py:meth:`send_request` for the arguments.
+        """
+
+        # Signed fresh for every attempt, since the signature covers the date.
         headers = self.get_request_headers()
 
         if method == 'GET':
@@ -113,6 +182,56 @@ class BaseTransport(object):
         else:
             raise Route53Error("Invalid request method: %s" % method)
 
+    def _open_stream(self, path, data, method):
+        """
+        Transport sub-classes may override this if they can stream response
+        bodies. By default, the whole body comes back as a single chunk.
+
+        See :py:meth:`send_request` for the arguments.
+
+        :rtype: iterable
+        :returns: An iterable of bytes chunks, making up the response body.
+        """
+
+        return [self._dispatch_request(path, data, method)]
+
+    def _check_response(self, status_code, body):
+        """
+        Transports call this with each response they get back. Error
+        responses are turned into the matching
+        :py:class:`Route53APIError <route53.exceptions.Route53APIError>`.
+
+        :param int status_code: The HTTP status code of the response.
+        :param body: The body of the response.
+        :type body: bytes or str
+        :raises: Route53APIError if ``status_code`` is 400 or above.
+        """
+
+        if status_code >= 400:
+            raise parse_error_body(body, status=status_code)
+
+    def prewarm(self, count):
+        """
+        Transport sub-classes may override this if they keep connections
+        around between requests.
+
+        Opens up to ``count`` connections to the Route53 endpoint ahead of
+        time, so the first real requests don't pay for the TCP and TLS
+        handshakes.
+
+        :param int count: The number of connections to open.
+        """
+
+        pass
+
+    def close(self):
+        """
+        Transport sub-classes may override this if they hold on to any
+        resources (sockets, pools) between requests.
+        """
+
+        pass
+
     def _send_get_request(self, path, params, headers):
         """
         Transport sub-classes need to override this.
@@ -123,7 +242,7 @@ class BaseTransport(object):
             the query.
         :param dict params: Key/value pairs to send.
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
@@ -140,7 +259,7 @@ class BaseTransport(object):
         :param data: Either a dict, or bytes.
         :type data: dict or bytes
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
@@ -155,7 +274,7 @@ class BaseTransport(object):
         :param str path: The path to tack on to the endpoint URL for
             the query.
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
@@ -167,9 +286,151 @@ class RequestsTransport(BaseTransport):
     A requests-based transport. More details may be found on the
     `requests webpage`_.
 
+    All requests go through a single :py:class:`requests.Session`, which
+    keeps a pool of keep-alive connections to the endpoint. The pool is
+    shared by every thread that uses the same
+    :py:class:`Route53Connection <route53.connection.Route53Connection>`,
+    so only the first request on each pooled connection pays for the TCP
+    and TLS handshakes.
+
     .. _requests webpage: http://docs.python-requests.org/en/latest/
     """
 
+    STREAM_CHUNK_SIZE = 16 * 1024
+    """The number of bytes read off the socket at a time when streaming."""
+
+    def __init__(self, connection):
+        """
+        :param Route53Connection connection: The connection being used with
+            the transport. The pool size and keep-alive settings are read
+            from it.
+        """
+
+        super(RequestsTransport, self).__init__(connection)
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            # We only ever talk to one host.
+            pool_connections=1,
+            pool_maxsize=connection._pool_size,
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        if not connection._keep_alive:
+            # Ask the endpoint to hang up after each response. The pool is
+            # still there, but every request ends up opening a new socket.
+            self._session.headers['Connection'] = 'close'
+
+    def prewarm(self, count):
+        """
+        Opens up to ``count`` pooled connections to the Route53 endpoint by
+        sending unsigned HEAD requests in parallel. The responses themselves
+        are thrown away, we only care about the sockets that are left in the
+        pool afterwards.
+
+        Failures are ignored, since this is only an optimization. Any real
+        problems will surface on the first real request.
+
+        :param int count: The number of connections to open. This is capped
+            at the connection's pool size.
+        """
+
+        count = min(count, self.connection._pool_size)
+        if count < 1:
+            return
+
+        def _open_connection(_):
+            try:
+                self._session.head(self.endpoint)
+            except requests.RequestException:
+                pass
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(_open_connection, range(count)))
+
+    def close(self):
+        """
+        Closes all pooled connections.
+        """
+
+        self._session.close()
+
+    def _request(self, method, path, **kwargs):
+        """
+        Sends a request through the pooled session, and checks the response
+        for errors.
+
+        :param str method: The HTTP method.
+        :param str path: The path to tack on to the endpoint URL for
+            the query.
+        :rtype: requests.Response
+        :returns: The (successful) response.
+        """
+
+        try:
+            r = self._session.request(method, self.endpoint + path, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise self._transport_error(exc, method)
+
+        if r.status_code >= 400:
+            # Only error bodies are read up front, so that streamed
+            # responses stay streamed.
+            self._check_response(r.status_code, r.content)
+        return r
+
+    def _transport_error(self, exc, method):
+        """
+        :param requests.RequestException exc: A connection error or timeout.
+        :param str method: The HTTP method of the failed request.
+        :rtype: TransportError
+        :returns: The error to raise, noting whether the request may have
+            gone out.
+        """
+
+        # A connection that couldn't be opened means nothing was sent.
+        # Anything later (resets, read timeouts) may have reached Route53.
+        reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+        sent = not (
+            isinstance(exc, requests.ConnectTimeout) or
+            isinstance(reason, NewConnectionError)
+        )
+        return TransportError(str(exc), method=method, sent=sent)
+
+    def _open_stream(self, path, data, method):
+        """
+        Streams GET responses off the socket in chunks of
+        ``STREAM_CHUNK_SIZE`` bytes. Other methods are sent as usual.
+
+        See :py:meth:`BaseTransport.send_request` for the arguments.
+
+        :rtype: generator
+        :returns: A generator of bytes chunks, making up the response body.
+        """
+
+        if method != 'GET':
+            return super(RequestsTransport, self)._open_stream(path, data, method)
+
+        headers = self.get_request_headers()
+        r = self._request('GET', path, params=data, headers=headers, stream=True)
+        return self._iter_response_chunks(r)
+
+    def _iter_response_chunks(self, r):
+        """
+        :param requests.Response r: A streamed response.
+        :rtype: generator
+        :returns: A generator of bytes chunks. The connection goes back to
+            the pool once the generator is exhausted or closed.
+        """
+
+        try:
+            for chunk in r.iter_content(self.STREAM_CHUNK_SIZE):
+                yield chunk
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise TransportError(str(exc), method='GET')
+        finally:
+            r.close()
+
     def _send_get_request(self, path, params, headers):
         """
         Sends the GET request to the Route53 endpoint.
@@ -178,13 +439,12 @@ class RequestsTransport(BaseTransport):
             the query.
         :param dict params: Key/value pairs to send.
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
-        r = requests.get(self.endpoint + path, params=params, headers=headers)
-        r.raise_for_status()
-        return r.text
+        r = self._request('GET', path, params=params, headers=headers)
+        return r.content
 
     def _send_post_request(self, path, data, headers):
         """
@@ -195,12 +455,12 @@ class RequestsTransport(BaseTransport):
         :param data: Either a dict, or bytes.
         :type data: dict or bytes
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
-        r = requests.post(self.endpoint + path, data=data, headers=headers)
-        return r.text
+        r = self._request('POST', path, data=data, headers=headers)
+        return r.content
 
     def _send_delete_request(self, path, headers):
         """
@@ -209,9 +469,9 @@ class RequestsTransport(BaseTransport):
         :param str path: The path to tack on to the endpoint URL for
             the query.
         :param dict headers: A dict of headers to send with the request.
-        :rtype: str
+        :rtype: bytes
         :returns: The body of the response.
         """
 
-        r = requests.delete(self.endpoint + path, headers=headers)
-        return r.text
+        r = self._request('DELETE', path, headers=headers)
+        return r.content
@@ -29,6 +29,63 @@ def parse_iso_8601_time_str(time_str):
     # Parse the string, and make it explicitly UTC.
     return submitted_at.replace(tzinfo=UTC_TIMEZONE)
 
+# Characters that Route53 hands back as-is in record names. Anything else
+# comes back as a three digit octal escape, like \052 for *.
+_PLAIN_NAME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-_.\\')
+
+def normalize_record_name(name):
+    """
+    Puts a record name into the form the Route53 API lists it in: lower
+    case, fully qualified with a trailing dot, and with special characters
+    octal-escaped. Handy for comparing user input against listed names.
+
+    :param str name: A record name, like ``'*.Example.com'``.
+    :rtype: str
+    :returns: The normalized name, like ``'\\052.example.com.'``.
+    """
+
+    name = name.lower()
+    if not name.endswith('.'):
+        name += '.'
+    # Already escaped sequences (and their backslashes) are left alone.
+    return ''.join(
+        char if char in _PLAIN_NAME_CHARS else '\\%03o' % ord(char)
+        for char in name
+    )
+
+def record_name_sort_key(name):
+    """
+    Route53 lists record sets in order of their names with the labels
+    reversed, trailing dot included, so that ``www.example.com.`` sorts as
+    ``com.example.www.``. That keeps every subtree of the zone together in
+    the listing.
+
+    :param str name: A normalized record name, as returned by
+        :py:func:`normalize_record_name`.
+    :rtype: str
+    :returns: The name as the API sorts it, like ``'com.example.www.'``.
+    """
+
+    labels = name.rstrip('.').split('.')
+    labels.reverse()
+    return '.'.join(labels) + '.'
+
+def request_key(path, params):
+    """
+    A hashable key for a request, for telling identical requests apart from
+    different ones. Params set to ``None`` aren't sent, so they're left out.
+
+    :param str path: The request path.
+    :param dict params: The request params.
+    :rtype: tuple
+    :returns: ``(path, params)``, with the params as sorted pairs.
+    """
+
+    return path, tuple(sorted(
+        (key, value) for key, value in (params or {}).items()
+        if value is not None
+    ))
+
 def prettyprint_xml(element):
     """
     A rough and dirty way to prettyprint an Element with indention.
@@ -1,12 +1,12 @@
-from io import BytesIO
 from lxml import etree
 #from route53.util import prettyprint_xml
 
 def get_change_values(change):
     """
     In the case of deletions, we pull the change values for the XML request
-    from the ResourceRecordSet._initial_vas dict, since we want the original
-    values. For creations, we pull from the attributes on ResourceRecordSet.
+    from the ResourceRecordSet._initial_vals dict, since we want the original
+    values. For creations and upserts, we pull from the attributes on
+    ResourceRecordSet.
 
     Since we're dealing with attributes vs. dict key/vals, we'll abstract
     this part away here and just always pass a dict to write_change.
@@ -18,11 +18,11 @@ def get_change_values(change):
 
     action, rrset = change
 
-    if action == 'CREATE':
-        # For creations, we want the current values, since they don't need to
-        # match an existing record set.
+    if action in ('CREATE', 'UPSERT'):
+        # For creations and upserts, we want the current values, since they
+        # don't need to match an existing record set.
         values = dict()
-        for key, val in rrset._initial_vals.items():
+        for key in rrset._tracked_fields:
             # Pull from the record set's attributes, which are the current
             # values.
             values[key] = getattr(rrset, key)
@@ -33,12 +33,16 @@ def get_change_values(change):
         # have to match against the values currently in Route53.
         return rrset._initial_vals
 
-def write_change(change):
+def write_change(change, evaluate_target_health=False):
     """
-    Creates an XML element for the change.
+    Creates an XML element for the change. The tags are written in the order
+    the API's schema asks for.
 
     :param tuple change: A change tuple from a ChangeSet. Comes in the form
         of ``(action, rrset)``.
+    :keyword bool evaluate_target_health: If ``True``, alias targets get an
+        EvaluateTargetHealth tag (set to false), which API versions from
+        2012-12-12 on require.
     :rtype: lxml.etree._Element
     :returns: A fully baked Change tag.
     """
@@ -68,25 +72,28 @@ def write_change(change):
         e_weight = etree.SubElement(e_rrset, "Weight")
         e_weight.text = change_vals['weight']
 
+    if change_vals.get('region'):
+        e_weight = etree.SubElement(e_rrset, "Region")
+        e_weight.text = change_vals['region']
+
     if change_vals.get('alias_hosted_zone_id') or change_vals.get('alias_dns_name'):
+        # A record sets in Alias mode have neither a TTL nor any resource
+        # records.
         e_alias_target = etree.SubElement(e_rrset, "AliasTarget")
 
         e_hosted_zone_id = etree.SubElement(e_alias_target, "HostedZoneId")
         e_hosted_zone_id.text = change_vals['alias_hosted_zone_id']
         e_dns_name = etree.SubElement(e_alias_target, "DNSName")
         e_dns_name.text = change_vals['alias_dns_name']
+        if evaluate_target_health:
+            e_evaluate = etree.SubElement(e_alias_target, "EvaluateTargetHealth")
+            e_evaluate.text = 'false'
 
-    if change_vals.get('region'):
-        e_weight = etree.SubElement(e_rrset, "Region")
-        e_weight.text = change_vals['region']
+        return e_change
 
     e_ttl = etree.SubElement(e_rrset, "TTL")
     e_ttl.text = str(change_vals['ttl'])
 
-    if rrset.is_alias_record_set():
-        # A record sets in Alias mode don't have any resource records.
-        return e_change
-
     e_resource_records = etree.SubElement(e_rrset, "ResourceRecords")
 
     for value in change_vals['records']:
@@ -103,7 +110,7 @@ def write_change(change):
 
 def change_resource_record_set_writer(connection, change_set, comment=None):
     """
-    Forms an XML string that we'll send to Route53 in order to change
+    Forms an XML document that we'll send to Route53 in order to change
     record sets.
 
     :param Route53Connection connection: The connection instance used to
@@ -111,6 +118,8 @@ def change_resource_record_set_writer(connection, change_set, comment=None):
     :param change_set.ChangeSet change_set: The ChangeSet object to create the
         XML doc from.
     :keyword str comment: An optional comment to go along with the request.
+    :rtype: bytes
+    :returns: The UTF-8 encoded request body.
     """
 
     e_root = etree.Element(
@@ -126,15 +135,14 @@ def change_resource_record_set_writer(connection, change_set, comment=None):
 
     e_changes = etree.SubElement(e_change_batch, "Changes")
 
-    # Deletions need to come first in the change sets.
-    for change in change_set.deletions + change_set.creations:
-        e_changes.append(write_change(change))
+    # Added in the 2012-12-12 API version, along with health checks.
+    evaluate_target_health = connection.endpoint_version >= '2012-12-12'
 
-    e_tree = etree.ElementTree(element=e_root)
-
-    #print(prettyprint_xml(e_root))
+    # Deletions need to come first in the change sets.
+    for change in change_set.changes:
+        e_changes.append(write_change(change, evaluate_target_health))
 
-    fobj = BytesIO()
-    # This writes bytes.
-    e_tree.write(fobj, xml_declaration=True, encoding='utf-8', method="xml")
-    return fobj.getvalue().decode('utf-8')
+    # Serialized straight to UTF-8 bytes, which is what goes over the wire.
+    return etree.tostring(
+        e_root, xml_declaration=True, encoding='utf-8', method="xml"
+    )
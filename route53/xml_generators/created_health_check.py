@@ -1,15 +1,16 @@
 import uuid
-from io import BytesIO
 from lxml import etree
 
 def create_health_check_writer(connection, caller_reference, ipaddress, port, type, resource_path, fqdn, search_string):
     """
-    Forms an XML string that we'll send to Route53 in order to create
+    Forms an XML document that we'll send to Route53 in order to create
     a new hosted zone.
 
     :param Route53Connection connection: The connection instance used to
         query the API.
     :param str name: The name of the hosted zone to create.
+    :rtype: bytes
+    :returns: The UTF-8 encoded request body.
     """
 
     if not caller_reference:
@@ -49,9 +50,7 @@ def create_health_check_writer(connection, caller_reference, ipaddress, port, ty
         e_search_string = etree.SubElement(e_config, "SearchString")
         e_search_string.text = search_string
 
-    e_tree = etree.ElementTree(element=e_root)
-
-    fobj = BytesIO()
-    # This writes bytes.
-    e_tree.write(fobj, xml_declaration=True, encoding='utf-8', method="xml")
-    return fobj.getvalue().decode('utf-8')
+    # Serialized straight to UTF-8 bytes, which is what goes over the wire.
+    return etree.tostring(
+        e_root, xml_declaration=True, encoding='utf-8', method="xml"
+    )
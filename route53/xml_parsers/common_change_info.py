@@ -3,15 +3,18 @@ A few calls return a ChangeInfo tag with some details about the changes
 that just happened.
 """
 
+from route53.change_info import ChangeInfo
 from route53.util import parse_iso_8601_time_str
 
-def parse_change_info(e_change_info):
+def parse_change_info(e_change_info, connection=None):
     """
     Parses a ChangeInfo tag. Seen in CreateHostedZone, DeleteHostedZone,
-    and ChangeResourceRecordSetsRequest.
+    ChangeResourceRecordSetsRequest and GetChange.
 
     :param lxml.etree._Element e_change_info: A ChangeInfo element.
-    :rtype: dict
+    :keyword Route53Connection connection: The connection the change was
+        made through, for following up on it.
+    :rtype: ChangeInfo
     :returns: A dict representation of the change info.
     """
 
@@ -20,8 +23,8 @@ def parse_change_info(e_change_info):
     submitted_at = e_change_info.find('./{*}SubmittedAt').text
     submitted_at = parse_iso_8601_time_str(submitted_at)
 
-    return {
+    return ChangeInfo(connection, {
         'request_id': id,
         'request_status': status,
         'request_submitted_at': submitted_at
-    }
\ No newline at end of file
+    })
@@ -0,0 +1,102 @@
+"""
+Tag dispatch tables, shared by the parsers. Rather than stripping the
+namespace off of every child tag and walking an if/elif chain, each parser
+declares a mapping of local tag names to handlers. That mapping is turned
+into a table keyed by fully qualified tag (``{namespace}Name``) the first
+time a given namespace is seen, so a child element is dispatched with a
+single dict lookup on its ``tag``.
+"""
+
+def set_text(kw_name):
+    """
+    Marks a tag whose text is simply stored under ``kw_name``. These are
+    handled inline by :py:meth:`TagDispatcher.dispatch`, which saves a
+    function call per element for the most common case.
+
+    :param str kw_name: The kwarg to store the text under.
+    :rtype: str
+    :returns: A handler, for use in a :py:class:`TagDispatcher`.
+    """
+
+    return kw_name
+
+class TagDispatcher(object):
+    """
+    Dispatches the children of an element to handlers, by tag.
+
+    Handlers are called as ``handler(e_field, kwargs)``, and are expected
+    to store whatever they pull out of ``e_field`` in the ``kwargs`` dict.
+    A handler may also be a kwarg name, as returned by :py:func:`set_text`,
+    in which case the element's text is stored under it. Children with no
+    handler are skipped.
+    """
+
+    def __init__(self, handlers):
+        """
+        :param dict handlers: Maps local (un-namespaced) tag names to
+            handlers.
+        """
+
+        self.handlers = handlers
+        # Qualified tag tables, keyed by the qualified tag of the parent
+        # element. In practice, there's one per API namespace.
+        self._tables = {}
+
+    def get_table(self, e_parent):
+        """
+        :param lxml.etree._Element e_parent: The element whose children are
+            to be dispatched.
+        :rtype: dict
+        :returns: A dict mapping the qualified tags of the children to
+            handlers.
+        """
+
+        table = self._tables.get(e_parent.tag)
+        if table is None:
+            table = self._build_table(e_parent.tag)
+            self._tables[e_parent.tag] = table
+        return table
+
+    def _build_table(self, parent_tag):
+        """
+        :param str parent_tag: The qualified tag of the parent element. The
+            children share its namespace.
+        :rtype: dict
+        :returns: A fresh dispatch table for that namespace.
+        """
+
+        if parent_tag.startswith('{'):
+            prefix = parent_tag[:parent_tag.index('}') + 1]
+        else:
+            prefix = ''
+
+        return dict(
+            (prefix + tag_name, handler)
+            for tag_name, handler in self.handlers.items()
+        )
+
+    def dispatch(self, e_parent, kwargs):
+        """
+        Runs each child of ``e_parent`` through its handler.
+
+        :param lxml.etree._Element e_parent: The element whose children are
+            to be dispatched.
+        :param dict kwargs: Handed to every handler, to be filled in.
+        :rtype: dict
+        :returns: ``kwargs``, as filled in by the handlers.
+        """
+
+        table = self._tables.get(e_parent.tag)
+        if table is None:
+            table = self.get_table(e_parent)
+
+        get_handler = table.get
+        for e_field in e_parent:
+            handler = get_handler(e_field.tag)
+            if handler is None:
+                continue
+            elif handler.__class__ is str:
+                kwargs[handler] = e_field.text
+            else:
+                handler(e_field, kwargs)
+        return kwargs
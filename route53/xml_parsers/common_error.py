@@ -0,0 +1,88 @@
+"""
+Parses the error responses that the API sends back along with 4xx and 5xx
+status codes, turning them into the appropriate exception.
+"""
+
+from lxml import etree
+from route53.exceptions import Route53APIError, ThrottlingError, \
+    PriorRequestNotCompleteError, ServiceError, InvalidChangeBatchError, \
+    NoSuchHostedZoneError, NoSuchHealthCheckError
+
+# Maps the Code tag of an error response to the exception to raise.
+ERROR_CODE_TO_EXCEPTION_MAP = {
+    'Throttling': ThrottlingError,
+    'PriorRequestNotComplete': PriorRequestNotCompleteError,
+    'ServiceUnavailable': ServiceError,
+    'InternalFailure': ServiceError,
+    'InvalidChangeBatch': InvalidChangeBatchError,
+    'NoSuchHostedZone': NoSuchHostedZoneError,
+    'NoSuchHealthCheck': NoSuchHealthCheckError,
+}
+
+def parse_error(root, status=None):
+    """
+    Parses an ErrorResponse (or InvalidChangeBatch) document.
+
+    :param lxml.etree._Element root: The root node of the etree parsed
+        response from the API.
+    :keyword int status: The HTTP status code the response came with.
+    :rtype: Route53APIError
+    :returns: An exception instance, ready to be raised.
+    """
+
+    request_id = root.findtext('./{*}RequestId')
+
+    # Cheesy way to strip off the namespace.
+    if root.tag.split('}')[-1] == 'InvalidChangeBatch':
+        # This one comes with a list of messages, rather than an Error tag.
+        code = 'InvalidChangeBatch'
+        message = '; '.join(
+            e_message.text for e_message in root.iterfind('./{*}Messages/{*}Message')
+        )
+    else:
+        e_error = root.find('./{*}Error')
+        if e_error is None:
+            e_error = root
+        code = e_error.findtext('./{*}Code')
+        message = e_error.findtext('./{*}Message')
+
+    exception_class = ERROR_CODE_TO_EXCEPTION_MAP.get(code)
+    if exception_class is None:
+        if status is not None and status >= 500:
+            exception_class = ServiceError
+        else:
+            exception_class = Route53APIError
+
+    return exception_class(
+        message or code or 'Unknown error',
+        code=code,
+        request_id=request_id,
+        status=status,
+    )
+
+def parse_error_body(body, status=None):
+    """
+    Like :py:func:`parse_error`, but for a raw response body that may or
+    may not be XML (load balancers in front of the API sometimes answer
+    with plain text or HTML).
+
+    :param body: The response body.
+    :type body: bytes or str
+    :keyword int status: The HTTP status code the response came with.
+    :rtype: Route53APIError
+    :returns: An exception instance, ready to be raised.
+    """
+
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+
+    try:
+        root = etree.fromstring(body)
+    except etree.XMLSyntaxError:
+        exception_class = ServiceError if status and status >= 500 else Route53APIError
+        return exception_class(
+            'HTTP %s: %s' % (status, body[:200].decode('utf-8', 'replace')),
+            status=status,
+        )
+
+    return parse_error(root, status=status)
@@ -4,6 +4,8 @@ XML responses (ListHostedZones and CreateHostedZone, for example).
 """
 
 from route53.health_check import HealthCheck
+from route53.raw import RawHealthCheck
+from route53.xml_parsers.common_dispatch import TagDispatcher, set_text
 
 # This dict maps tag names in the API response to a kwarg key used to
 # instantiate HostedZone instances.
@@ -14,59 +16,73 @@ HEALTH_CHECK_TAG_TO_KWARG_MAP = {
     'HealthCheckVersion': 'health_check_version',
 }
 
+# Maps the tags beneath HealthCheckConfig to HealthCheck kwargs.
+HEALTH_CHECK_CONFIG_TAG_TO_KWARG_MAP = {
+    'IPAddress': 'ipaddress',
+    'Port': 'port',
+    'Type': 'type',
+    'ResourcePath': 'resource_path',
+    'FullyQualifiedDomainName': 'fqdn',
+    'SearchString': 'search_string',
+}
+
+def _handle_health_check_config(e_field, kwargs):
+    # HealthCheckConfig has the IPAddress, Port, Type, ResourcePath,
+    # FullyQualifiedDomainName, SearchString tag beneath it, any of which
+    # may be missing.
+    for kw_name in HEALTH_CHECK_CONFIG_TAG_TO_KWARG_MAP.values():
+        kwargs[kw_name] = None
+    HEALTH_CHECK_CONFIG_DISPATCHER.dispatch(e_field, kwargs)
+
+# Handlers for the children of HealthCheckConfig tags.
+HEALTH_CHECK_CONFIG_DISPATCHER = TagDispatcher(dict(
+    (tag_name, set_text(kw_name))
+    for tag_name, kw_name in HEALTH_CHECK_CONFIG_TAG_TO_KWARG_MAP.items()
+))
+
+# Handlers for the children of HealthCheck tags.
+HEALTH_CHECK_DISPATCHER = TagDispatcher(dict(
+    [(tag_name, set_text(kw_name))
+     for tag_name, kw_name in HEALTH_CHECK_TAG_TO_KWARG_MAP.items()] +
+    [('HealthCheckConfig', _handle_health_check_config)]
+))
+
 def parse_health_check(e_healthcheck, connection):
     """
-    This a common parser that allows the passing of any valid HostedZone
-    tag. It will spit out the appropriate HostedZone object for the tag.
+    This a common parser that allows the passing of any valid HealthCheck
+    tag. It will spit out the appropriate HealthCheck object for the tag.
 
-    :param lxml.etree._Element e_zone: The root node of the etree parsed
-        response from the API.
+    :param lxml.etree._Element e_healthcheck: The root node of the etree
+        parsed response from the API.
     :param Route53Connection connection: The connection instance used to
         query the API.
-    :rtype: HostedZone
-    :returns: An instantiated HostedZone object.
+    :rtype: HealthCheck
+    :returns: An instantiated HealthCheck object.
     """
 
-    # This dict will be used to instantiate a HostedZone instance to yield.
-    kwargs = {}
-    # Within HostedZone tags are a number of sub-tags that include info
-    # about the instance.
-    for e_field in e_healthcheck:
-        # Cheesy way to strip off the namespace.
-        tag_name = e_field.tag.split('}')[1]
-        field_text = e_field.text
-
-        if tag_name == 'HealthCheckConfig':
-            # HealthCheckConfig has the IPAddress, Port, Type, ResourcePath,
-            # FullyQualifiedDomainName, SearchString tag beneath it, needing
-            # special handling.
-            e_ipaddress = e_field.find('./{*}IPAddress')
-            kwargs['ipaddress'] = e_ipaddress.text if e_ipaddress is not None else None
-
-            e_port = e_field.find('./{*}Port')
-            kwargs['port'] = e_port.text if e_port is not None else None
+    # This dict will be used to instantiate a HealthCheck instance to yield.
+    kwargs = HEALTH_CHECK_DISPATCHER.dispatch(e_healthcheck, {})
 
-            e_type = e_field.find('./{*}Type')
-            kwargs['type'] = e_type.text if e_type is not None else None
-
-            e_resource_path = e_field.find('./{*}ResourcePath')
-            kwargs['resource_path'] = e_resource_path.text if e_resource_path is not None else None
-
-            e_fqdn = e_field.find('./{*}FullyQualifiedDomainName')
-            kwargs['fqdn'] = e_fqdn.text if e_fqdn is not None else None
+    return HealthCheck(connection, **kwargs)
 
-            e_search_string = e_field.find('./{*}SearchString')
-            kwargs['search_string'] = e_search_string.text if e_search_string is not None else None
-            continue
-        elif tag_name == 'Id':
-            # This comes back with a path prepended. Yank that sillyness.
-            field_text = field_text
+def parse_raw_health_check(e_healthcheck, connection):
+    """
+    Like :py:func:`parse_health_check`, but spits out a plain
+    :py:class:`RawHealthCheck <route53.raw.RawHealthCheck>` tuple.
 
-        # Map the XML tag name to a kwarg name.
-        kw_name = HEALTH_CHECK_TAG_TO_KWARG_MAP[tag_name]
-        # This will be the key/val pair used to instantiate the
-        # HostedZone instance.
-        kwargs[kw_name] = field_text
+    :param lxml.etree._Element e_healthcheck: A HealthCheck element.
+    :param Route53Connection connection: Unused. Taken for the sake of a
+        common signature with :py:func:`parse_health_check`.
+    :rtype: RawHealthCheck
+    """
 
-    return HealthCheck(connection, **kwargs)
+    kwargs = HEALTH_CHECK_DISPATCHER.dispatch(e_healthcheck, {})
+    get = kwargs.get
+    # Calculated checks, among others, have no port.
+    port = get('port')
 
+    return RawHealthCheck(
+        get('id'), get('caller_reference'), get('ipaddress'),
+        int(port) if port is not None else None, get('type'), get('resource_path'), get('fqdn'),
+        get('search_string'), get('health_check_version'),
+    )
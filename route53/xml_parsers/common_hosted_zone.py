@@ -4,6 +4,8 @@ XML responses (ListHostedZones and CreateHostedZone, for example).
 """
 
 from route53.hosted_zone import HostedZone
+from route53.raw import RawHostedZone
+from route53.xml_parsers.common_dispatch import TagDispatcher, set_text
 
 # This dict maps tag names in the API response to a kwarg key used to
 # instantiate HostedZone instances.
@@ -14,6 +16,29 @@ HOSTED_ZONE_TAG_TO_KWARG_MAP = {
     'ResourceRecordSetCount': 'resource_record_set_count',
 }
 
+def _handle_id(e_field, kwargs):
+    # This comes back with a path prepended. Yank that sillyness.
+    kwargs['id'] = e_field.text.strip('/hostedzone/')
+
+def _handle_config(e_field, kwargs):
+    # Config has the Comment tag beneath it, needing special handling.
+    CONFIG_DISPATCHER.dispatch(e_field, kwargs)
+
+# Handlers for the children of Config tags.
+CONFIG_DISPATCHER = TagDispatcher({
+    'Comment': set_text('comment'),
+})
+
+# Handlers for the children of HostedZone tags.
+HOSTED_ZONE_DISPATCHER = TagDispatcher(dict(
+    [(tag_name, set_text(kw_name))
+     for tag_name, kw_name in HOSTED_ZONE_TAG_TO_KWARG_MAP.items()] +
+    [
+        ('Id', _handle_id),
+        ('Config', _handle_config),
+    ]
+))
+
 def parse_hosted_zone(e_zone, connection):
     """
     This a common parser that allows the passing of any valid HostedZone
@@ -28,32 +53,31 @@ def parse_hosted_zone(e_zone, connection):
     """
 
     # This dict will be used to instantiate a HostedZone instance to yield.
-    kwargs = {}
     # Within HostedZone tags are a number of sub-tags that include info
     # about the instance.
-    for e_field in e_zone:
-        # Cheesy way to strip off the namespace.
-        tag_name = e_field.tag.split('}')[1]
-        field_text = e_field.text
-
-        if tag_name == 'Config':
-            # Config has the Comment tag beneath it, needing
-            # special handling.
-            e_comment = e_field.find('./{*}Comment')
-            kwargs['comment'] = e_comment.text if e_comment is not None else None
-            continue
-        elif tag_name == 'Id':
-            # This comes back with a path prepended. Yank that sillyness.
-            field_text = field_text.strip('/hostedzone/')
-
-        # Map the XML tag name to a kwarg name.
-        kw_name = HOSTED_ZONE_TAG_TO_KWARG_MAP[tag_name]
-        # This will be the key/val pair used to instantiate the
-        # HostedZone instance.
-        kwargs[kw_name] = field_text
+    kwargs = HOSTED_ZONE_DISPATCHER.dispatch(e_zone, {'comment': None})
 
     return HostedZone(connection, **kwargs)
 
+def parse_raw_hosted_zone(e_zone, connection):
+    """
+    Like :py:func:`parse_hosted_zone`, but spits out a plain
+    :py:class:`RawHostedZone <route53.raw.RawHostedZone>` tuple.
+
+    :param lxml.etree._Element e_zone: A HostedZone element.
+    :param Route53Connection connection: Unused. Taken for the sake of a
+        common signature with :py:func:`parse_hosted_zone`.
+    :rtype: RawHostedZone
+    """
+
+    kwargs = HOSTED_ZONE_DISPATCHER.dispatch(e_zone, {})
+    get = kwargs.get
+
+    return RawHostedZone(
+        get('id'), get('name'), get('caller_reference'),
+        int(kwargs['resource_record_set_count']), get('comment'),
+    )
+
 def parse_delegation_set(zone, e_delegation_set):
     """
     Parses a DelegationSet tag. These often accompany HostedZone tags in
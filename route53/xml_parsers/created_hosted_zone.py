@@ -29,6 +29,6 @@ def created_hosted_zone_parser(root, connection):
     # just for the sake of completeness.
     e_change_info = root.find('./{*}ChangeInfo')
     # Translate the ChangeInfo values to a dict.
-    change_info = parse_change_info(e_change_info)
+    change_info = parse_change_info(e_change_info, connection=connection)
 
     return hosted_zone, change_info
@@ -16,4 +16,4 @@ def delete_hosted_zone_by_id_parser(root, connection):
 
     e_change_info = root.find('./{*}ChangeInfo')
 
-    return parse_change_info(e_change_info)
+    return parse_change_info(e_change_info, connection=connection)
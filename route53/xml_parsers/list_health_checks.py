@@ -1,6 +1,6 @@
-from route53.xml_parsers.common_health_check import parse_health_check
+from route53.xml_parsers.common_health_check import parse_health_check, parse_raw_health_check
 
-def list_health_checks_parser(root, connection):
+def list_health_checks_parser(root, connection, raw=False):
     """
     Parses the API responses for the
     :py:meth:`route53.connection.Route53Connection.list_health_checks` method.
@@ -9,6 +9,8 @@ def list_health_checks_parser(root, connection):
         response from the API.
     :param Route53Connection connection: The connection instance used to
         query the API.
+    :keyword bool raw: If ``True``, yield plain
+        :py:class:`RawHealthCheck <route53.raw.RawHealthCheck>` tuples.
     :rtype: HealthCheck
     :returns: A generator of fully formed HostedZone instances.
     """
@@ -18,5 +20,6 @@ def list_health_checks_parser(root, connection):
     # nested beneath it.
     health_checks = root.find('./{*}HealthChecks')
 
+    parse = parse_raw_health_check if raw else parse_health_check
     for health_check in health_checks:
-        yield parse_health_check(health_check, connection)
+        yield parse(health_check, connection)
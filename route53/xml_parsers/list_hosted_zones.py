@@ -1,6 +1,6 @@
-from route53.xml_parsers.common_hosted_zone import parse_hosted_zone
+from route53.xml_parsers.common_hosted_zone import parse_hosted_zone, parse_raw_hosted_zone
 
-def list_hosted_zones_parser(root, connection):
+def list_hosted_zones_parser(root, connection, raw=False):
     """
     Parses the API responses for the
     :py:meth:`route53.connection.Route53Connection.list_hosted_zones` method.
@@ -9,6 +9,8 @@ def list_hosted_zones_parser(root, connection):
         response from the API.
     :param Route53Connection connection: The connection instance used to
         query the API.
+    :keyword bool raw: If ``True``, yield plain
+        :py:class:`RawHostedZone <route53.raw.RawHostedZone>` tuples.
     :rtype: HostedZone
     :returns: A generator of fully formed HostedZone instances.
     """
@@ -18,5 +20,6 @@ def list_hosted_zones_parser(root, connection):
     # nested beneath it.
     zones = root.find('./{*}HostedZones')
 
+    parse = parse_raw_hosted_zone if raw else parse_hosted_zone
     for zone in zones:
-        yield parse_hosted_zone(zone, connection)
+        yield parse(zone, connection)
@@ -1,4 +1,7 @@
+from lxml import etree
 from route53.exceptions import Route53Error
+from route53.raw import RawResourceRecordSet
+from route53.xml_parsers.common_dispatch import TagDispatcher, set_text
 from route53.resource_record_set import AResourceRecordSet, AAAAResourceRecordSet, CNAMEResourceRecordSet, MXResourceRecordSet, NSResourceRecordSet, PTRResourceRecordSet, SOAResourceRecordSet, SPFResourceRecordSet, SRVResourceRecordSet, TXTResourceRecordSet
 
 # Maps ResourceRecordSet subtag names to kwargs in RRSet subclasses.
@@ -36,9 +39,8 @@ def parse_rrset_alias(e_alias):
     :returns: A tuple in the form of ``(alias_hosted_zone_id, alias_dns_name)``.
     """
 
-    alias_hosted_zone_id = e_alias.find('./{*}HostedZoneId').text
-    alias_dns_name = e_alias.find('./{*}DNSName').text
-    return alias_hosted_zone_id, alias_dns_name
+    kwargs = ALIAS_DISPATCHER.dispatch(e_alias, {})
+    return kwargs.get('alias_hosted_zone_id'), kwargs.get('alias_dns_name')
 
 def parse_rrset_record_values(e_resource_records):
     """
@@ -59,6 +61,40 @@ def parse_rrset_record_values(e_resource_records):
 
     return records
 
+def _handle_type(e_field, kwargs):
+    # Need to store this to determine which ResourceRecordSet
+    # subclass to instantiate. Popped off before that happens.
+    kwargs['rrset_type'] = e_field.text
+
+def _handle_alias_target(e_field, kwargs):
+    # A records have some special field values we need.
+    ALIAS_DISPATCHER.dispatch(e_field, kwargs)
+    # Alias A entries have no TTL.
+    kwargs['ttl'] = None
+
+def _handle_resource_records(e_field, kwargs):
+    # Same as parse_rrset_record_values(), minus a function call per rrset.
+    kwargs['records'] = [
+        e_value.text for e_record in e_field for e_value in e_record
+    ]
+
+# Handlers for the children of AliasTarget tags.
+ALIAS_DISPATCHER = TagDispatcher({
+    'HostedZoneId': set_text('alias_hosted_zone_id'),
+    'DNSName': set_text('alias_dns_name'),
+})
+
+# Handlers for the children of ResourceRecordSet tags.
+RRSET_DISPATCHER = TagDispatcher(dict(
+    [(tag_name, set_text(kw_name))
+     for tag_name, kw_name in RRSET_TAG_TO_KWARG_MAP.items()] +
+    [
+        ('Type', _handle_type),
+        ('AliasTarget', _handle_alias_target),
+        ('ResourceRecords', _handle_resource_records),
+    ]
+))
+
 def parse_rrset(e_rrset, connection, zone_id):
     """
     This a parser that allows the passing of any valid ResourceRecordSet
@@ -74,51 +110,185 @@ def parse_rrset(e_rrset, connection, zone_id):
     """
 
     # This dict will be used to instantiate a ResourceRecordSet instance to yield.
-    kwargs = {
+    kwargs = RRSET_DISPATCHER.dispatch(e_rrset, {
         'connection': connection,
         'zone_id': zone_id,
-    }
-    rrset_type = None
+        # Not all rrsets have records.
+        'records': [],
+    })
+
+    rrset_type = kwargs.pop('rrset_type', None)
+    if not rrset_type:
+        raise Route53Error("No Type tag found in ListResourceRecordSetsResponse.")
+
+    RRSetSubclass = RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset_type]
+    return RRSetSubclass(**kwargs)
+
+def parse_raw_rrset(e_rrset, connection, zone_id):
+    """
+    Like :py:func:`parse_rrset`, but spits out a plain
+    :py:class:`RawResourceRecordSet <route53.raw.RawResourceRecordSet>`
+    tuple instead of a ResourceRecordSet instance.
+
+    :param lxml.etree._Element e_rrset: A ResourceRecordSet element.
+    :param Route53Connection connection: Unused. Taken for the sake of a
+        common signature with the other rrset parsers.
+    :param str zone_id: The zone ID of the HostedZone these rrsets belong to.
+    :rtype: RawResourceRecordSet
+    """
+
+    kwargs = RRSET_DISPATCHER.dispatch(e_rrset, {})
+    get = kwargs.get
+
+    rrset_type = get('rrset_type')
+    if not rrset_type:
+        raise Route53Error("No Type tag found in ListResourceRecordSetsResponse.")
+
+    ttl = get('ttl')
+    return RawResourceRecordSet(
+        zone_id, get('name'), rrset_type, int(ttl) if ttl else None,
+        tuple(get('records', ())), get('set_identifier'), get('weight'),
+        get('region'), get('health_check'), get('failover'),
+        get('alias_hosted_zone_id'), get('alias_dns_name'),
+    )
+
+class LazyResourceRecordSetMixin(object):
+    """
+    Mixed into the lazy flavor of each ResourceRecordSet sub-class. Only the
+    name and type are parsed up front. The rest of the fields are left
+    unset, along with the initial value snapshot, and the raw element is
+    kept around. The first time any of them is read or assigned, the whole
+    element is parsed, and the instance turns into a plain instance of its
+    regular ResourceRecordSet sub-class.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        # Only called for attributes that aren't set, which are the
+        # deferred slots until the element has been parsed.
+        if name in self._deferred_fields:
+            self._materialize()
+            return getattr(self, name)
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (self.__class__.__name__, name)
+        )
+
+    def __setattr__(self, name, value):
+        # Parse first, so the assignment isn't clobbered by the parsed value,
+        # and shows up as a modification.
+        if name in self._deferred_fields:
+            self._materialize()
+        object.__setattr__(self, name, value)
+
+    def _materialize(self):
+        """
+        Parses the kept element through the regular ``__init__``, and drops
+        the element.
+        """
+
+        e_rrset = self._element
+        # Same slots, so this is allowed. It also gets the lazy
+        # __getattr__/__setattr__ out of the way from here on.
+        object.__setattr__(self, '__class__', self._rrset_class)
+        self._element = None
+
+        kwargs = RRSET_DISPATCHER.dispatch(e_rrset, {
+            'connection': self.connection,
+            'zone_id': self.zone_id,
+            'records': [],
+        })
+        del kwargs['rrset_type']
+        self.__init__(**kwargs)
+
+def _make_lazy_rrset_class(rrset_class):
+    """
+    :param class rrset_class: A ResourceRecordSet sub-class.
+    :rtype: class
+    :returns: A lazy sub-class of ``rrset_class``. Instances still pass
+        ``isinstance()`` checks against it, and use its methods.
+    """
+
+    return type('Lazy' + rrset_class.__name__,
+        (LazyResourceRecordSetMixin, rrset_class), {
+        '__slots__': (),
+        '__doc__': 'A lazily parsed :py:class:`%s`.' % rrset_class.__name__,
+        '__module__': __name__,
+        '_rrset_class': rrset_class,
+        '_deferred_fields': frozenset(rrset_class._tracked_fields) | frozenset(
+            ['_initial_snapshot']
+        ),
+    })
+
+_set_slot = object.__setattr__
 
+# The lazy flavors of the RRSet sub-classes, by type.
+RRSET_TYPE_TO_LAZY_RSET_SUBCLASS_MAP = dict(
+    (rrset_type, _make_lazy_rrset_class(rrset_class))
+    for rrset_type, rrset_class in RRSET_TYPE_TO_RSET_SUBCLASS_MAP.items()
+)
+
+# Handlers for the children of ResourceRecordSet tags, in lazy mode.
+LAZY_RRSET_DISPATCHER = TagDispatcher({
+    'Name': set_text('name'),
+    'Type': set_text('rrset_type'),
+})
+
+def parse_lazy_rrset(e_rrset, connection, zone_id):
+    """
+    Like :py:func:`parse_rrset`, but only the name and type are parsed
+    right away. The rest is parsed from ``e_rrset`` on first access.
+
+    .. note:: The element (and with it, the page it came from) is kept in
+        memory until then.
+
+    :param lxml.etree._Element e_rrset: A ResourceRecordSet element.
+    :param Route53Connection connection: The connection instance used to
+        query the API.
+    :param str zone_id: The zone ID of the HostedZone these rrsets belong to.
+    :rtype: ResourceRecordSet
+    :returns: A lazy instance of the appropriate ResourceRecordSet
+        sub-class.
+    """
+
+    table = LAZY_RRSET_DISPATCHER.get_table(e_rrset)
+    name = rrset_type = None
     for e_field in e_rrset:
-        # Cheesy way to strip off the namespace.
-        tag_name = e_field.tag.split('}')[1]
-        field_text = e_field.text
-
-        if tag_name == 'Type':
-            # Need to store this to determine which ResourceRecordSet
-            # subclass to instantiate.
-            rrset_type = field_text
-            continue
-        elif tag_name == 'AliasTarget':
-            # A records have some special field values we need.
-            alias_hosted_zone_id, alias_dns_name = parse_rrset_alias(e_field)
-            kwargs['alias_hosted_zone_id'] = alias_hosted_zone_id
-            kwargs['alias_dns_name'] = alias_dns_name
-            # Alias A entries have no TTL.
-            kwargs['ttl'] = None
+        kw_name = table.get(e_field.tag)
+        if kw_name == 'name':
+            name = e_field.text
+        elif kw_name == 'rrset_type':
+            rrset_type = e_field.text
+        else:
             continue
-        elif tag_name == 'ResourceRecords':
-            kwargs['records'] = parse_rrset_record_values(e_field)
-            continue
-
-        # Map the XML tag name to a kwarg name.
-        kw_name = RRSET_TAG_TO_KWARG_MAP[tag_name]
-        # This will be the key/val pair used to instantiate the
-        # ResourceRecordSet instance.
-        kwargs[kw_name] = field_text
+        # The API puts these two first, so we're usually done here.
+        if name is not None and rrset_type is not None:
+            break
 
     if not rrset_type:
         raise Route53Error("No Type tag found in ListResourceRecordSetsResponse.")
 
-    if 'records' not in kwargs:
-        # Not all rrsets have records.
-        kwargs['records'] = []
+    LazyRRSetSubclass = RRSET_TYPE_TO_LAZY_RSET_SUBCLASS_MAP[rrset_type]
+    rrset = LazyRRSetSubclass.__new__(LazyRRSetSubclass)
+    # Straight into the slots, skipping the materializing __setattr__.
+    _set_slot(rrset, '_element', e_rrset)
+    _set_slot(rrset, 'connection', connection)
+    _set_slot(rrset, 'zone_id', zone_id)
+    _set_slot(rrset, 'name', name)
+    return rrset
 
-    RRSetSubclass = RRSET_TYPE_TO_RSET_SUBCLASS_MAP[rrset_type]
-    return RRSetSubclass(**kwargs)
+def _get_rrset_parser(lazy, raw):
+    """
+    :rtype: function
+    :returns: The rrset parser for the given flags. ``raw`` wins over
+        ``lazy``.
+    """
+
+    if raw:
+        return parse_raw_rrset
+    return parse_lazy_rrset if lazy else parse_rrset
 
-def list_resource_record_sets_by_zone_id_parser(e_root, connection, zone_id):
+def list_resource_record_sets_by_zone_id_parser(e_root, connection, zone_id, lazy=False, raw=False):
     """
     Parses the API responses for the
     :py:meth:`route53.connection.Route53Connection.list_resource_record_sets_by_zone_id`
@@ -129,6 +299,10 @@ def list_resource_record_sets_by_zone_id_parser(e_root, connection, zone_id):
     :param Route53Connection connection: The connection instance used to
         query the API.
     :param str zone_id: The zone ID of the HostedZone these rrsets belong to.
+    :keyword bool lazy: If ``True``, yield lazy record sets, as returned by
+        :py:func:`parse_lazy_rrset`.
+    :keyword bool raw: If ``True``, yield plain tuples, as returned by
+        :py:func:`parse_raw_rrset`.
     :rtype: ResourceRecordSet
     :returns: A generator of fully formed ResourceRecordSet instances.
     """
@@ -138,5 +312,80 @@ def list_resource_record_sets_by_zone_id_parser(e_root, connection, zone_id):
     # ResourceRecordSet tags nested beneath it.
     e_rrsets = e_root.find('./{*}ResourceRecordSets')
 
+    parse = _get_rrset_parser(lazy, raw)
     for e_rrset in e_rrsets:
-        yield parse_rrset(e_rrset, connection, zone_id)
+        yield parse(e_rrset, connection, zone_id)
+
+
+class ResourceRecordSetStreamParser(object):
+    """
+    An incremental counterpart of
+    :py:func:`list_resource_record_sets_by_zone_id_parser`, for use with
+    streamed responses. Chunks of the response body are fed in as they
+    arrive, and each ResourceRecordSet is handed back as soon as its closing
+    tag has been seen, rather than after the whole page is parsed.
+
+    Record set elements are thrown away once they've been parsed, so memory
+    use doesn't grow with the page size. The rest of the document (the
+    pagination tags) is kept, and returned by :py:meth:`close`.
+    """
+
+    def __init__(self, connection, zone_id, lazy=False, raw=False):
+        """
+        :param Route53Connection connection: The connection instance used to
+            query the API.
+        :param str zone_id: The zone ID of the HostedZone these rrsets
+            belong to.
+        :keyword bool lazy: If ``True``, yield lazy record sets, as returned
+            by :py:func:`parse_lazy_rrset`. Each one keeps its own element
+            alive until it is parsed.
+        :keyword bool raw: If ``True``, yield plain tuples, as returned by
+            :py:func:`parse_raw_rrset`.
+        """
+
+        self.connection = connection
+        self.zone_id = zone_id
+        self.lazy = lazy and not raw
+        self.raw = raw
+        self._parser = etree.XMLPullParser(
+            events=('end',), tag='{*}ResourceRecordSet'
+        )
+
+    def feed(self, data):
+        """
+        Feeds the next chunk of the response body to the parser.
+
+        :param bytes data: The next chunk of the response body.
+        :rtype: generator
+        :returns: A generator of the ResourceRecordSet instances completed
+            by this chunk.
+        """
+
+        self._parser.feed(data)
+        return self._read_rrsets()
+
+    def close(self):
+        """
+        Finishes parsing, once the whole body has been fed in.
+
+        :rtype: lxml.etree._Element
+        :returns: The root of the response, minus the ResourceRecordSet
+            elements. Its pagination tags are intact.
+        """
+
+        return self._parser.close()
+
+    def _read_rrsets(self):
+        parse = _get_rrset_parser(self.lazy, self.raw)
+        for _, e_rrset in self._parser.read_events():
+            yield parse(e_rrset, self.connection, self.zone_id)
+
+            # Drop what we've already parsed. The current element is still
+            # referenced by the parser, so it is only emptied for now, and
+            # removed along with the next one. Lazy record sets still need
+            # theirs, which lives on for as long as they hold on to it.
+            if not self.lazy:
+                e_rrset.clear()
+            e_parent = e_rrset.getparent()
+            while e_rrset.getprevious() is not None:
+                del e_parent[0]
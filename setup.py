@@ -30,5 +30,8 @@ setup(
     long_description=LONG_DESCRIPTION,
     platforms=['any'],
     classifiers=CLASSIFIERS,
-    install_requires=['requests==0.14.1', 'lxml', 'pytz'],
+    install_requires=['requests>=1.0', 'lxml', 'pytz'],
+    extras_require={
+        'async': ['aiohttp'],
+    },
 )
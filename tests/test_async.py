@@ -0,0 +1,155 @@
+import asyncio
+import datetime
+import os
+import unittest
+import route53
+from route53.async_connection import AsyncRoute53Connection
+from route53.async_transport import AsyncBaseTransport
+
+
+class AsyncDummyTransport(AsyncBaseTransport):
+    """
+    An asyncio version of the DummyTransport in test_basic. Canned responses
+    are handed out in order, after yielding to the event loop once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncDummyTransport, self).__init__(*args, **kwargs)
+        self.response = []
+        self.requests = []
+
+    def set_response(self, response):
+        self.response.append(response)
+
+    def set_response_from_file(self, response_file, **kwargs):
+        response_path = os.path.join(os.path.dirname(__file__), 'responses', response_file)
+        self.response.append((open(response_path, 'r').read() % kwargs).encode('utf-8'))
+
+    async def _respond(self, method, path):
+        self.requests.append((method, path))
+        await asyncio.sleep(0)
+        return self.response.pop(0)
+
+    async def _send_get_request(self, path, params, headers):
+        return await self._respond('GET', path)
+
+    async def _send_post_request(self, path, params, headers):
+        return await self._respond('POST', path)
+
+    async def _send_delete_request(self, path, headers):
+        return await self._respond('DELETE', path)
+
+
+class AsyncConnectionTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the asyncio connection.
+    """
+
+    def setUp(self):
+        self.conn = route53.connect(
+            aws_access_key_id='BLAHBLAH',
+            aws_secret_access_key='wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY',
+            connectionClass=AsyncRoute53Connection,
+            transport_class=AsyncDummyTransport,
+        )
+        self.submitted_at = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    async def test_list_hosted_zones(self):
+        self.conn._transport.set_response_from_file('ListHostedZonesResponse.xml')
+        zones = [zone async for zone in self.conn.list_hosted_zones()]
+        self.assertEqual(len(zones), 1)
+        self.assertIsInstance(zones[0], route53.hosted_zone.HostedZone)
+
+    async def test_concurrent_gets_and_record_sets(self):
+        for _ in range(3):
+            self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        zones = await asyncio.gather(
+            *[self.conn.get_hosted_zone_by_id('Z%d' % i) for i in range(3)]
+        )
+        self.assertEqual(len(zones), 3)
+        self.assertNotEqual(zones[0].nameservers, [])
+
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        rrsets = [rrset async for rrset in zones[0].record_sets]
+        self.assertEqual(
+            [rrset.rrset_type for rrset in rrsets],
+            ['NS', 'SOA', 'A', 'A', 'CNAME']
+        )
+
+        self.conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submitted_at)
+        change_info = await rrsets[3].delete()
+        self.assertEqual(change_info['request_status'], 'PENDING')
+        self.assertEqual(self.conn._transport.requests[-1], ('POST', 'hostedzone/%s/rrset' % zones[0].id))
+
+    async def test_list_health_checks(self):
+        self.conn._transport.set_response_from_file('ListHealthChecksResponse.xml')
+        async for health_check in self.conn.list_health_checks():
+            self.assertEqual(health_check.id, 'Test Health Check ID')
+
+    async def test_prefetch(self):
+        page = (
+            '<ListHostedZonesResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<HostedZones><HostedZone><Id>/hostedzone/%s</Id><Name>%s</Name>'
+            '<CallerReference>0</CallerReference><Config><Comment>c</Comment></Config>'
+            '<ResourceRecordSetCount>2</ResourceRecordSetCount></HostedZone></HostedZones>'
+            '%s</ListHostedZonesResponse>'
+        )
+        self.conn._transport.set_response(page % ('A', 'a.com.', '<NextMarker>B</NextMarker>'))
+        self.conn._transport.set_response(page % ('B', 'b.com.', ''))
+
+        zones = self.conn.list_hosted_zones(prefetch=1)
+        first = await zones.__anext__()
+        self.assertEqual(first.name, 'a.com.')
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # The second page was fetched while we held on to the first.
+        self.assertEqual(self.conn._transport.response, [])
+        self.assertEqual([zone.name async for zone in zones], ['b.com.'])
+
+    async def test_harvest_record_sets(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        progress = []
+
+        pairs = [pair async for pair in self.conn.harvest_record_sets(
+            ['Z1', 'Z2'], max_workers=2,
+            on_progress=lambda *args: progress.append(args),
+        )]
+
+        self.assertEqual(sorted(set(zone for zone, _ in pairs)), ['Z1', 'Z2'])
+        self.assertEqual(len(pairs), 10)
+        self.assertEqual(sorted(args[:2] for args in progress), [('Z1', 5), ('Z2', 5)])
+
+    async def test_prefetch_nameservers(self):
+        route53.hosted_zone.clear_nameserver_cache()
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        zones = [
+            route53.hosted_zone.HostedZone(self.conn, zone_id, 'a.com.', 'ref', 2, None)
+            for zone_id in ('Z1', 'Z2')
+        ]
+
+        await self.conn.prefetch_nameservers(zones)
+
+        self.assertEqual(self.conn._transport.response, [])
+        # No blocking request behind the property any more.
+        for zone in zones:
+            self.assertEqual(len(zone.nameservers), 4)
+
+    async def test_concurrent_gets_share_one_request(self):
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        zones = await asyncio.gather(
+            *[self.conn.get_hosted_zone_by_id('Z1') for _ in range(3)]
+        )
+        self.assertEqual(len(zones), 3)
+        self.assertEqual(self.conn._transport.requests, [('GET', 'hostedzone/Z1')])
+        self.assertEqual(self.conn.single_flight_info(), {'sent': 1, 'saved': 2})
+
+    async def test_get_change(self):
+        self.conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submitted_at)
+        change_info = await self.conn.get_change('/change/C2682N5HXP0BZ4')
+        self.assertEqual(change_info['request_status'], 'PENDING')
+        self.assertEqual(self.conn._transport.requests, [('GET', 'change/C2682N5HXP0BZ4')])
+
+        # Waiting blocks, so it's refused rather than left hanging.
+        self.assertRaises(route53.exceptions.Route53Error, change_info.wait_until_insync)
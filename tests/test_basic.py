@@ -1,10 +1,26 @@
 import unittest
 import route53
-from route53.exceptions import AlreadyDeletedError
+from route53.cache import ResponseCache
+from route53.change_info import ChangeWaiter
+from route53.change_set import ChangeSet
+from route53.concurrency import parallel_chain
+from route53.exceptions import AlreadyDeletedError, ChangeTimeoutError, HarvestError, ThrottlingError, \
+    InvalidChangeBatchError, NoSuchHostedZoneError, ServiceError, TransportError
+from route53.raw import RawHealthCheck, RawHostedZone, RawResourceRecordSet
+from route53.rate_limit import TokenBucket, FileTokenBucket
+from route53.retry import RetryPolicy
+from route53.sync import SyncPlan, diff_record_sets, to_raw_record_set
 from route53.transport import BaseTransport
+from route53.util import record_name_sort_key
+from route53.xml_generators import change_resource_record_set_writer
+from route53.xml_parsers.common_error import parse_error_body
 from tests.utils import get_route53_connection
 import datetime
+import requests
+import threading
+import time
 import os
+import tempfile
 
 
 class BaseTestCase(unittest.TestCase):
@@ -19,21 +35,28 @@ class BaseTestCase(unittest.TestCase):
     def setUp(self):
         self.conn = get_route53_connection(**self.CONNECTION_OPTIONS)
         self.submittedAt = datetime.datetime.now()
+        route53.hosted_zone.clear_nameserver_cache()
 
 class DummyTransport(route53.transport.BaseTransport):
     def __init__(self, *args, **kwargs):
         super(DummyTransport, self).__init__(*args, **kwargs)
         self.response = []
+        # The (path, params) of each GET request, in order.
+        self.get_requests = []
 
     def set_response(self, response):
+        # Real transports hand back the raw response bytes.
+        if not isinstance(response, bytes):
+            response = response.encode('utf-8')
         self.response.append(response)
 
     def set_response_from_file(self, response_file, **kwargs):
         response_path = os.path.join(os.path.dirname(__file__), 'responses', response_file)
-        self.response.append(open(response_path, 'r').read() % kwargs)
+        self.set_response(open(response_path, 'r').read() % kwargs)
 
     def _send_get_request(self, path, params, headers):
         #print "\n-- GET Method --\n - path: %s\n - params: %s\n - headers: %s" % (path, params, headers)
+        self.get_requests.append((path, params))
         return self.response.pop(0)
 
     def _send_post_request(self, path, params, headers):
@@ -64,6 +87,24 @@ class BaseTransportTestCase(unittest.TestCase):
         signed = trans._hmac_sign_string('Thu, 14 Aug 2008 17:08:48 GMT')
         self.assertEquals(signed, 'PjAJ6buiV6l4WyzmmuwtKE59NJXVg5Dr3Sn4PCMZ0Yk=')
 
+    def test_requests_transport_pool(self):
+        """
+        The requests transport should hold a single pooled session, sized
+        from the connection's settings.
+        """
+
+        conn = route53.connect(
+            aws_access_key_id='BLAHBLAH',
+            aws_secret_access_key='wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY',
+            pool_size=4,
+            keep_alive=False,
+        )
+        session = conn._transport._session
+        adapter = session.get_adapter(conn._endpoint)
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(session.headers['Connection'], 'close')
+        conn.close()
+
 
 class HostedZoneTestCase(BaseTestCase):
     """
@@ -123,6 +164,40 @@ class HostedZoneTestCase(BaseTestCase):
         )
 
 
+class PrefetchNameserversTestCase(BaseTestCase):
+    """
+    Tests for looking up the nameservers of many zones at once.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def _zone(self, zone_id):
+        return route53.hosted_zone.HostedZone(
+            self.conn, zone_id, zone_id + '.com.', 'ref', 2, None
+        )
+
+    def test_prefetch(self):
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+
+        zones = [self._zone('Z1'), self._zone('Z2'), self._zone('Z1')]
+        self.assertEqual(self.conn.prefetch_nameservers(iter(zones)), zones)
+
+        # One request per zone ID.
+        self.assertEqual(
+            sorted(path for path, _ in self.conn._transport.get_requests),
+            ['hostedzone/Z1', 'hostedzone/Z2']
+        )
+        for zone in zones:
+            self.assertEqual(len(zone.nameservers), 4)
+
+        # Other copies of the zones are filled in from the cache.
+        zone = self._zone('Z2')
+        self.conn.prefetch_nameservers([zone])
+        self.assertEqual(zone.nameservers, zones[1].nameservers)
+        self.assertEqual(self._zone('Z1').nameservers, zones[0].nameservers)
+        self.assertEqual(len(self.conn._transport.get_requests), 2)
+
+
 class ResourceRecordSetTestCase(BaseTestCase):
     """
     Tests related to RRSets. Deletions are tested in the cleanUp() method,
@@ -191,6 +266,262 @@ class ResourceRecordSetTestCase(BaseTestCase):
         for key, val in new_record._initial_vals.items():
             self.assertEqual(getattr(new_record, key), val)
 
+    def test_is_modified(self):
+        """
+        Tests the change tracking on listed record sets.
+        """
+
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        rrsets = list(self.conn._list_resource_record_sets_by_zone_id('Z1'))
+        rrset = rrsets[3]
+        self.assertEqual(rrset.ttl, 300)
+        self.assertFalse(hasattr(rrset, '__dict__'))
+        self.assertFalse(rrset.is_modified())
+
+        rrset.values = ['10.0.0.3']
+        self.assertTrue(rrset.is_modified())
+        self.assertEqual(rrset._initial_vals['records'], ['10.0.0.1', '10.0.0.2'])
+
+
+class BatchTestCase(BaseTestCase):
+    """
+    Tests for batched record set changes.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def setUp(self):
+        super(BatchTestCase, self).setUp()
+        self.zone = route53.hosted_zone.HostedZone(
+            self.conn, 'Z1', self.test_zone_name, 'ref', 0, None
+        )
+
+    def _rrset(self, i, values=('10.0.0.1',)):
+        return route53.resource_record_set.AResourceRecordSet(
+            connection=self.conn, zone_id='Z1', name='host%d.%s' % (i, self.test_zone_name),
+            ttl=60, records=list(values),
+        )
+
+    def test_split(self):
+        change_set = ChangeSet(self.conn, 'Z1')
+        for i in range(5):
+            change_set.add_change('CREATE', self._rrset(i))
+            change_set.add_change('DELETE', self._rrset(i + 10))
+
+        change_sets = change_set.split(max_changes=4)
+        self.assertEqual(
+            [(len(cs.deletions), len(cs.creations)) for cs in change_sets],
+            [(4, 0), (1, 3), (0, 2)]
+        )
+
+        # Values count as well, however many changes they come in.
+        change_set = ChangeSet(self.conn, 'Z1')
+        for i in range(4):
+            change_set.add_change('CREATE', self._rrset(i, ['10.0.0.1', '10.0.0.2']))
+        self.assertEqual(
+            [len(cs) for cs in change_set.split(max_records=5)], [2, 2]
+        )
+        self.assertEqual(
+            [len(cs) for cs in change_set.split(max_value_chars=40)], [2, 2]
+        )
+        self.assertRaises(
+            route53.exceptions.Route53Error, change_set.split, max_records=1
+        )
+
+    def test_commit(self):
+        for _ in range(2):
+            self.conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submittedAt.strftime('%Y-%m-%dT%H:%M:%SZ'))
+
+        with self.zone.batch(comment='Bulk add.', max_changes=2) as batch:
+            for i in range(3):
+                batch.create_record('a', 'host%d.%s' % (i, self.test_zone_name), ['10.0.0.1'])
+            self.assertEqual(len(batch), 3)
+            self.assertRaises(
+                route53.exceptions.Route53Error, batch.create_record, 'SOA', self.test_zone_name, ['x']
+            )
+
+        self.assertEqual(len(batch.change_infos), 2)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(self.conn._transport.response, [])
+
+class UpsertTestCase(BaseTestCase):
+    """
+    Tests for the UPSERT change action.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def setUp(self):
+        super(UpsertTestCase, self).setUp()
+        self.sent = []
+        self.conn._change_resource_record_sets = lambda cset, comment=None: self.sent.append(cset)
+
+    def _rrset(self, conn=None, **kwargs):
+        rrset_kwargs = dict(
+            connection=conn or self.conn, zone_id='Z1', name='www.' + self.test_zone_name,
+            ttl=60, records=['10.0.0.1'],
+        )
+        rrset_kwargs.update(kwargs)
+        return route53.resource_record_set.AResourceRecordSet(**rrset_kwargs)
+
+    def test_save_upserts(self):
+        rrset = self._rrset()
+        rrset.ttl = 300
+        rrset.save()
+        self.assertEqual(
+            [action for action, _ in self.sent[0].changes], ['UPSERT']
+        )
+        body = change_resource_record_set_writer(self.conn, self.sent[0])
+        self.assertIn(b'<Action>UPSERT</Action>', body)
+        self.assertIn(b'<TTL>300</TTL>', body)
+
+        # An UPSERT wouldn't remove the record set under the old name.
+        rrset.name = 'www2.' + self.test_zone_name
+        rrset.save()
+        self.assertEqual(
+            [(action, vals.name) for action, vals in self.sent[1].changes],
+            [('DELETE', rrset.name), ('CREATE', rrset.name)]
+        )
+
+    def test_older_api_version(self):
+        conn = get_route53_connection(transport_class=DummyTransport, endpoint_version='2012-02-29')
+        self.assertFalse(conn.supports_upsert)
+        conn._change_resource_record_sets = lambda cset, comment=None: self.sent.append(cset)
+
+        rrset = self._rrset(conn)
+        rrset.ttl = 300
+        rrset.save()
+        self.assertEqual(
+            [action for action, _ in self.sent[0].changes], ['DELETE', 'CREATE']
+        )
+        self.assertRaises(
+            route53.exceptions.Route53Error, ChangeSet(conn, 'Z1').add_change, 'UPSERT', rrset
+        )
+
+    def test_split_counts_upsert_values_twice(self):
+        change_set = ChangeSet(self.conn, 'Z1')
+        for i in range(3):
+            change_set.add_change('UPSERT', self._rrset(name='host%d.%s' % (i, self.test_zone_name)))
+        self.assertEqual([len(cs) for cs in change_set.split(max_records=4)], [2, 1])
+
+    def test_alias_target(self):
+        change_set = ChangeSet(self.conn, 'Z1')
+        change_set.add_change('CREATE', self._rrset(
+            ttl=None, records=[], alias_hosted_zone_id='Z2', alias_dns_name='elb.amazonaws.com.'
+        ))
+        body = change_resource_record_set_writer(self.conn, change_set)
+        self.assertIn(b'<EvaluateTargetHealth>false</EvaluateTargetHealth>', body)
+        self.assertNotIn(b'<TTL>', body)
+
+class ChangeBufferTestCase(BaseTestCase):
+    """
+    Tests for the write-behind change buffer.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def setUp(self):
+        super(ChangeBufferTestCase, self).setUp()
+        self.zone = route53.hosted_zone.HostedZone(
+            self.conn, 'Z1', self.test_zone_name, 'ref', 0, None
+        )
+
+    def _rrset(self, i, values=('10.0.0.1',)):
+        return route53.resource_record_set.AResourceRecordSet(
+            connection=self.conn, zone_id='Z1', name='host%d.%s' % (i, self.test_zone_name),
+            ttl=60, records=list(values),
+        )
+
+    def _set_change_response(self):
+        self.conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submittedAt.strftime('%Y-%m-%dT%H:%M:%SZ'))
+
+    def test_flush_on_size(self):
+        self._set_change_response()
+        with self.zone.change_buffer(max_changes=3, max_delay=60) as buf:
+            futures = []
+            threads = [
+                threading.Thread(target=lambda i=i: futures.append(buf.create(self._rrset(i))))
+                for i in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            change_infos = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(change_infos[0]['request_status'], 'PENDING')
+        self.assertTrue(all(info is change_infos[0] for info in change_infos))
+        self.assertEqual(buf.requests_sent, 1)
+
+    def test_flush_on_delay_and_cancel_out(self):
+        self._set_change_response()
+        buf = self.zone.change_buffer(max_delay=0.05)
+        created = buf.create(self._rrset(1))
+        deleted = buf.delete(self._rrset(1))
+        self.assertIsNone(created.result(timeout=0))
+        self.assertIsNone(deleted.result(timeout=0))
+        self.assertEqual(buf.changes_cancelled, 2)
+
+        kept = buf.create(self._rrset(2))
+        self.assertIsInstance(kept.result(timeout=5), dict)
+        self.assertEqual(self.conn._transport.response, [])
+        buf.close()
+        self.assertRaises(route53.exceptions.Route53Error, buf.create, self._rrset(3))
+
+    def _record_requests(self):
+        sent = []
+        send = self.conn._change_resource_record_sets
+
+        def record(change_set, comment=None):
+            sent.append([(action, rrset.records) for action, rrset in change_set.changes])
+            return send(change_set, comment=comment)
+
+        self.conn._change_resource_record_sets = record
+        return sent
+
+    def test_changes_to_one_record_keep_their_order(self):
+        sent = self._record_requests()
+        for _ in range(3):
+            self._set_change_response()
+
+        buf = self.zone.change_buffer(max_delay=60)
+        # Deleted, then created again: sent as one upsert.
+        deleted = buf.delete(self._rrset(2))
+        created = buf.create(self._rrset(2))
+        buf.flush()
+        self.assertEqual(sent[0], [('UPSERT', ['10.0.0.1'])])
+        self.assertIs(deleted.result(0), created.result(0))
+        self.assertEqual(buf.changes_merged, 1)
+
+        # A second creation can't be combined, so the first goes out first.
+        again = self._rrset(3)
+        again.records = ['10.0.0.2']
+        buf.create(self._rrset(3))
+        buf.create(again)
+        self.assertEqual(sent[1], [('CREATE', ['10.0.0.1'])])
+        buf.close()
+        self.assertEqual(sent[2], [('CREATE', ['10.0.0.2'])])
+
+    def test_upsert_then_delete(self):
+        sent = self._record_requests()
+        for _ in range(2):
+            self._set_change_response()
+
+        changed = self._rrset(1, values=['10.0.0.2'])
+        buf = self.zone.change_buffer(max_delay=60)
+        upserted = buf.upsert(changed)
+        # The deletion has to match the upserted values, so the upsert goes
+        # out on its own first.
+        deleted = buf.delete(changed)
+        self.assertEqual(sent, [[('UPSERT', ['10.0.0.2'])]])
+        buf.close()
+        self.assertEqual(sent[1], [('DELETE', ['10.0.0.2'])])
+        self.assertIsNot(upserted.result(0), deleted.result(0))
+        self.assertEqual(buf.changes_merged, 0)
+
+    def test_failure_goes_to_futures(self):
+        # No canned response, so the request fails.
+        buf = self.zone.change_buffer()
+        future = buf.create(self._rrset(1))
+        buf.close()
+        self.assertRaises(IndexError, future.result, 0)
 
 class HealthTestTestCase(BaseTestCase):
     """
@@ -233,3 +564,1057 @@ class HealthTestTestCase(BaseTestCase):
         self.assertIsInstance(new_health_check, route53.health_check.HealthCheck)
         new_health_check.delete()
         self.assertRaises(AlreadyDeletedError, new_health_check.delete)
+
+
+class PaginationTestCase(BaseTestCase):
+    """
+    Tests for the auto-paginating listings.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def _set_hosted_zones_page(self, zone_names, next_marker=None):
+        zones = ''.join(
+            '<HostedZone><Id>/hostedzone/%s</Id><Name>%s</Name>'
+            '<CallerReference>0</CallerReference><Config><Comment>c</Comment></Config>'
+            '<ResourceRecordSetCount>2</ResourceRecordSetCount></HostedZone>' % (name, name)
+            for name in zone_names
+        )
+        marker = '<NextMarker>%s</NextMarker>' % next_marker if next_marker else ''
+        self.conn._transport.set_response(
+            '<ListHostedZonesResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<HostedZones>%s</HostedZones>%s</ListHostedZonesResponse>' % (zones, marker)
+        )
+
+    def _wait_for_responses_to_drain(self):
+        deadline = time.time() + 2
+        while self.conn._transport.response and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_no_prefetch(self):
+        self._set_hosted_zones_page(['a.com.', 'b.com.'], next_marker='c.com.')
+        self._set_hosted_zones_page(['c.com.'])
+
+        zones = self.conn.list_hosted_zones()
+        self.assertEqual(next(zones).name, 'a.com.')
+        # The second page is only requested once the first is used up.
+        self.assertEqual(len(self.conn._transport.response), 1)
+        self.assertEqual([zone.name for zone in zones], ['b.com.', 'c.com.'])
+
+    def test_prefetch(self):
+        self._set_hosted_zones_page(['a.com.', 'b.com.'], next_marker='c.com.')
+        self._set_hosted_zones_page(['c.com.'], next_marker='d.com.')
+        self._set_hosted_zones_page(['d.com.'])
+
+        zones = self.conn.list_hosted_zones(prefetch=2)
+        self.assertEqual(next(zones).name, 'a.com.')
+        # Both remaining pages are fetched while we sit on the first one.
+        self._wait_for_responses_to_drain()
+        self.assertEqual(len(self.conn._transport.response), 0)
+        self.assertEqual(
+            [zone.name for zone in zones],
+            ['b.com.', 'c.com.', 'd.com.']
+        )
+
+
+
+class ChunkedTransport(DummyTransport):
+    """
+    Streams the canned responses back a few bytes at a time, and keeps
+    track of how many chunks have been read.
+    """
+
+    def __init__(self, connection):
+        super(ChunkedTransport, self).__init__(connection)
+        self.chunks_read = 0
+
+    def _open_stream(self, path, data, method):
+        body = self._dispatch_request(path, data, method)
+
+        def _chunks():
+            for i in range(0, len(body), 64):
+                self.chunks_read += 1
+                yield body[i:i + 64]
+
+        return _chunks()
+
+
+class StreamingTestCase(BaseTestCase):
+    """
+    Tests for the streaming record set listings.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ChunkedTransport}
+
+    def test_matches_buffered_parser(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+
+        buffered = list(self.conn._list_resource_record_sets_by_zone_id('Z1'))
+        streamed = list(self.conn._list_resource_record_sets_by_zone_id('Z1', stream=True))
+
+        self.assertEqual(
+            [(r.name, r.rrset_type, r.ttl, r.records) for r in streamed],
+            [(r.name, r.rrset_type, r.ttl, r.records) for r in buffered]
+        )
+
+    def test_yields_before_page_is_complete(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+
+        rrsets = self.conn._list_resource_record_sets_by_zone_id('Z1', stream=True)
+        self.assertEqual(next(rrsets).rrset_type, 'NS')
+        # Only the first few chunks were needed for the first record set.
+        self.assertLess(self.conn._transport.chunks_read, 10)
+        self.assertEqual(len(list(rrsets)), 4)
+
+    def test_pagination(self):
+        page = (
+            '<ListResourceRecordSetsResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<ResourceRecordSets><ResourceRecordSet><Name>%s</Name><Type>A</Type>'
+            '<TTL>60</TTL><ResourceRecords><ResourceRecord><Value>10.0.0.1</Value>'
+            '</ResourceRecord></ResourceRecords></ResourceRecordSet></ResourceRecordSets>'
+            '%s</ListResourceRecordSetsResponse>'
+        )
+        self.conn._transport.set_response(page % (
+            'a.example.com.',
+            '<IsTruncated>true</IsTruncated><NextRecordName>b.example.com.</NextRecordName>'
+            '<NextRecordType>A</NextRecordType>'
+        ))
+        self.conn._transport.set_response(page % ('b.example.com.', ''))
+
+        rrsets = self.conn._list_resource_record_sets_by_zone_id('Z1', stream=True)
+        self.assertEqual(
+            [rrset.name for rrset in rrsets],
+            ['a.example.com.', 'b.example.com.']
+        )
+
+
+class LazyRecordSetTestCase(BaseTestCase):
+    """
+    Tests for the lazily parsed record sets.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ChunkedTransport}
+
+    def _fields(self, rrset):
+        return [getattr(rrset, key) for key in rrset._tracked_fields]
+
+    def test_matches_eager_parser(self):
+        for stream in (False, True):
+            self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+            self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+
+            eager = list(self.conn._list_resource_record_sets_by_zone_id('Z1'))
+            lazy = list(self.conn._list_resource_record_sets_by_zone_id(
+                'Z1', stream=stream, lazy=True
+            ))
+
+            self.assertEqual(
+                [(type(r).__bases__[1], r.rrset_type) for r in lazy],
+                [(type(r), r.rrset_type) for r in eager]
+            )
+            self.assertEqual(
+                [self._fields(r) for r in lazy],
+                [self._fields(r) for r in eager]
+            )
+
+    def test_fields_parsed_on_first_access(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        rrset = list(self.conn._list_resource_record_sets_by_zone_id('Z1', lazy=True))[2]
+
+        self.assertIsInstance(rrset, route53.resource_record_set.AResourceRecordSet)
+        self.assertEqual(rrset.name, 'alias.route53-unittest-zone.com.')
+        self.assertIsNotNone(rrset._element)
+
+        self.assertTrue(rrset.is_alias_record_set())
+        self.assertIsNone(rrset._element)
+        self.assertIs(type(rrset), route53.resource_record_set.AResourceRecordSet)
+        self.assertFalse(rrset.is_modified())
+
+    def test_assigned_before_access(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        rrset = list(self.conn._list_resource_record_sets_by_zone_id('Z1', lazy=True))[3]
+
+        rrset.ttl = 60
+        self.assertTrue(rrset.is_modified())
+        self.assertEqual(rrset.ttl, 60)
+        self.assertEqual(rrset._initial_vals['ttl'], 300)
+        self.assertEqual(rrset.records, ['10.0.0.1', '10.0.0.2'])
+
+
+class RawModeTestCase(BaseTestCase):
+    """
+    Tests for the raw tuple output of the listing methods.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ChunkedTransport}
+
+    def _fields(self, rrset):
+        return [getattr(rrset, key) for key in rrset._tracked_fields]
+
+    def test_record_sets(self):
+        for stream in (False, True):
+            self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+            self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+
+            eager = list(self.conn._list_resource_record_sets_by_zone_id('Z1'))
+            raw = list(self.conn._list_resource_record_sets_by_zone_id(
+                'Z1', stream=stream, raw=True
+            ))
+
+            self.assertEqual(len(raw), len(eager))
+            for raw_rrset, rrset in zip(raw, eager):
+                self.assertIsInstance(raw_rrset, RawResourceRecordSet)
+                self.assertEqual(raw_rrset.rrset_type, rrset.rrset_type)
+                self.assertEqual(
+                    [getattr(raw_rrset, key) for key in rrset._tracked_fields],
+                    [tuple(value) if key == 'records' else value
+                     for key, value in zip(rrset._tracked_fields, self._fields(rrset))]
+                )
+
+            alias = raw[2]
+            self.assertIsNone(alias.ttl)
+            self.assertEqual(alias.records, ())
+            self.assertEqual(alias.alias_dns_name, eager[2].alias_dns_name)
+
+    def test_hosted_zones_and_health_checks(self):
+        self.conn._transport.set_response_from_file('ListHostedZonesResponse.xml')
+        self.conn._transport.set_response_from_file('ListHostedZonesResponse.xml')
+        zones = list(self.conn.list_hosted_zones())
+        raw_zones = list(self.conn.list_hosted_zones(raw=True))
+        self.assertEqual(
+            [tuple(getattr(zone, key) for key in RawHostedZone._fields)
+             for zone in zones],
+            raw_zones
+        )
+
+        self.conn._transport.set_response_from_file('ListHealthChecksResponse.xml')
+        self.conn._transport.set_response_from_file('ListHealthChecksResponse.xml')
+        checks = list(self.conn.list_health_checks())
+        raw_checks = list(self.conn.list_health_checks(raw=True))
+        fields = RawHealthCheck._fields[:-1]
+        self.assertEqual(
+            [tuple(getattr(check, key) for key in fields) for check in checks],
+            [raw_check[:-1] for raw_check in raw_checks]
+        )
+
+        # Calculated checks have no port.
+        self.conn._transport.set_response_from_file('ListHealthChecksNoPortResponse.xml')
+        self.conn._transport.set_response_from_file('ListHealthChecksNoPortResponse.xml')
+        check = list(self.conn.list_health_checks())[0]
+        raw_check = list(self.conn.list_health_checks(raw=True))[0]
+        self.assertIsNone(check.port)
+        self.assertIsNone(raw_check.port)
+        self.assertEqual(raw_check.type, 'CALCULATED')
+
+
+class RecordTableTestCase(BaseTestCase):
+    """
+    Tests for the columnar record set snapshot.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def setUp(self):
+        super(RecordTableTestCase, self).setUp()
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        zone = self.conn.get_hosted_zone_by_id('Z1')
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        self.table = zone.record_table()
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(list(self.table.ttls), [172800, 900, -1, 300, 60])
+        self.assertEqual(self.table.values[3:5], ['10.0.0.1', '10.0.0.2'])
+        self.assertEqual(list(self.table.value_offsets), [0, 2, 3, 3, 5, 6])
+
+    def test_filter(self):
+        table = self.table
+        self.assertEqual(list(table.filter(rrset_type='A')), [2, 3])
+        self.assertEqual(list(table.filter(rrset_type='A', min_ttl=1)), [3])
+        self.assertEqual(list(table.filter(max_ttl=300)), [3, 4])
+        self.assertEqual(list(table.filter(network='10.0.0.0/8')), [3])
+        self.assertEqual(list(table.filter(network='192.168.0.0/16')), [])
+        self.assertEqual(list(table.filter(value='primary.example.com.')), [4])
+        self.assertEqual(
+            list(table.filter(name_suffix='route53-unittest-zone.com')),
+            [0, 1, 2, 3, 4]
+        )
+        self.assertEqual(list(table.filter(name_suffix='test.route53-unittest-zone.com.')), [3])
+
+        rows = table.filter(rrset_type='CNAME')
+        self.assertEqual(list(table.filter(rows, min_ttl=60)), [4])
+
+    def test_to_record_sets(self):
+        self.conn._transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        listed = list(self.conn._list_resource_record_sets_by_zone_id(self.table.zone_id))
+
+        for original, rebuilt in zip(listed, self.table.to_record_sets()):
+            self.assertIs(type(rebuilt), type(original))
+            self.assertEqual(rebuilt._initial_vals, original._initial_vals)
+
+    def test_zero_ttl(self):
+        self.table.add('zero.route53-unittest-zone.com.', 'A', ttl=0, records=['10.0.0.1'])
+        rrset = self.table.to_record_sets([5])[0]
+        self.assertEqual(rrset.ttl, 0)
+
+        change_set = ChangeSet(self.conn, rrset.zone_id)
+        change_set.add_change('DELETE', rrset)
+        body = change_resource_record_set_writer(self.conn, change_set)
+        self.assertIn(b'<TTL>0</TTL>', body)
+
+    def test_unsupported_types(self):
+        table = self.table
+        self.assertEqual(list(table.filter(rrset_type='CAA')), [])
+        table.add('caa.route53-unittest-zone.com.', 'CAA', ttl=0,
+                  records=['0 issue "amazon.com"'])
+        table.add('ds.route53-unittest-zone.com.', 'DS', ttl=3600, records=['1 2 3 ABCD'])
+
+        self.assertEqual(list(table.filter(rrset_type='CAA')), [5])
+        self.assertEqual(list(table.filter(rrset_type='DS')), [6])
+        # A TTL of 0 isn't missing.
+        self.assertEqual(list(table.filter(max_ttl=0)), [5])
+        self.assertRaises(route53.exceptions.Route53Error, table.to_record_sets, [5])
+
+class GetRecordSetTestCase(BaseTestCase):
+    """
+    Tests for the point lookups of single record sets, and listings of one
+    subtree, or one name and type, of a zone.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport}
+
+    def setUp(self):
+        super(GetRecordSetTestCase, self).setUp()
+        self.conn._transport.set_response_from_file('GetHostedZoneResponse.xml')
+        self.zone = self.conn.get_hosted_zone_by_id('Z1')
+
+    def _set_rrsets_page(self, rrsets, next_record=None):
+        body = ''.join(
+            '<ResourceRecordSet><Name>%s</Name><Type>%s</Type>%s<TTL>60</TTL>'
+            '<ResourceRecords><ResourceRecord><Value>10.0.0.1</Value>'
+            '</ResourceRecord></ResourceRecords></ResourceRecordSet>' % (
+                name, rrset_type,
+                '<SetIdentifier>%s</SetIdentifier><Weight>1</Weight>' % identifier
+                if identifier else '')
+            for name, rrset_type, identifier in rrsets
+        )
+        marker = ''
+        if next_record:
+            name, rrset_type, identifier = next_record
+            marker = '<NextRecordName>%s</NextRecordName><NextRecordType>%s</NextRecordType>' % (
+                name, rrset_type)
+            if identifier:
+                marker += '<NextRecordIdentifier>%s</NextRecordIdentifier>' % identifier
+        self.conn._transport.set_response(
+            '<ListResourceRecordSetsResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<ResourceRecordSets>%s</ResourceRecordSets>%s</ListResourceRecordSetsResponse>' % (
+                body, marker)
+        )
+
+    def test_found(self):
+        self._set_rrsets_page(
+            [('test.example.com.', 'A', None)],
+            next_record=('www.example.com.', 'A', None)
+        )
+        rrset = self.zone.get_record_set('Test.example.com', 'a')
+
+        self.assertEqual(rrset.name, 'test.example.com.')
+        self.assertEqual(rrset.rrset_type, 'A')
+        # Straight to it, in one request.
+        self.assertEqual(self.conn._transport.get_requests[-1], (
+            'hostedzone/%s/rrset' % self.zone.id,
+            {'name': 'test.example.com.', 'type': 'A', 'identifier': None, 'maxitems': 1},
+        ))
+        self.assertEqual(len(self.conn._transport.response), 0)
+
+    def test_missing(self):
+        self._set_rrsets_page(
+            [('www.example.com.', 'A', None)],
+            next_record=('www.example.com.', 'AAAA', None)
+        )
+        self.assertIsNone(self.zone.get_record_set('test.example.com.', 'A'))
+
+        self._set_rrsets_page([])
+        self.assertIsNone(self.zone.get_record_set('zzz.example.com.', 'A'))
+
+    def test_set_identifier(self):
+        self._set_rrsets_page(
+            [('w.example.com.', 'A', 'two')],
+            next_record=('w.example.com.', 'A', 'three')
+        )
+        rrset = self.zone.get_record_set('w.example.com.', 'A', set_identifier='two')
+
+        self.assertEqual(rrset.set_identifier, 'two')
+        self.assertEqual(self.conn._transport.get_requests[-1][1]['identifier'], 'two')
+
+        # The listing started past it, so it doesn't exist. The rest of the
+        # weighted set isn't paged through.
+        self._set_rrsets_page(
+            [('w.example.com.', 'A', 'three')],
+            next_record=('w.example.com.', 'A', 'four')
+        )
+        self._set_rrsets_page([('w.example.com.', 'A', 'four')])
+        self.assertIsNone(
+            self.zone.get_record_set('w.example.com.', 'A', set_identifier='two'))
+        self.assertEqual(len(self.conn._transport.get_requests), 3)
+        self.assertEqual(len(self.conn._transport.response), 1)
+
+    def test_subtree(self):
+        self._set_rrsets_page(
+            [('eu.example.com.', 'NS', None),
+             ('\\052.eu.example.com.', 'A', None),
+             ('www.eu.example.com.', 'A', None),
+             ('www.eu.example.com.', 'TXT', None),
+             ('feu.example.com.', 'A', None)],
+            next_record=('www.example.com.', 'A', None)
+        )
+        self._set_rrsets_page([('www.example.com.', 'A', None)])
+
+        rrsets = list(self.zone.list_record_sets(
+            name='*.EU.example.com', subtree=True, rrset_type='A'
+        ))
+        self.assertEqual(
+            [rrset.name for rrset in rrsets],
+            ['\\052.eu.example.com.', 'www.eu.example.com.']
+        )
+        # Started at the top of the subtree, and stopped at its end, rather
+        # than going on to the next page.
+        self.assertEqual(self.conn._transport.get_requests[-1][1]['name'], 'eu.example.com.')
+        self.assertEqual(self.conn._transport.get_requests[-1][1]['type'], None)
+        self.assertEqual(len(self.conn._transport.response), 1)
+
+    def test_name_and_type(self):
+        self._set_rrsets_page(
+            [('w.example.com.', 'A', 'one'),
+             ('w.example.com.', 'A', 'two'),
+             ('w.example.com.', 'AAAA', None)],
+            next_record=('x.example.com.', 'A', None)
+        )
+        rrsets = list(self.zone.list_record_sets(name='w.example.com', rrset_type='a'))
+
+        self.assertEqual([rrset.set_identifier for rrset in rrsets], ['one', 'two'])
+        params = self.conn._transport.get_requests[-1][1]
+        self.assertEqual((params['name'], params['type']), ('w.example.com.', 'A'))
+        self.assertEqual(len(self.conn._transport.response), 0)
+
+
+class ZoneTransport(DummyTransport):
+    """
+    Serves record set listings out of a made up zone, from wherever the
+    ``name`` param says, the way the API does. Safe to share between
+    threads.
+    """
+
+    def __init__(self, connection):
+        super(ZoneTransport, self).__init__(connection)
+        self.names = sorted(
+            ['example.com.'] +
+            ['%s%d.example.com.' % (prefix, i) for prefix in 'agmqz' for i in range(5)] +
+            ['www.m2.example.com.', '\\052.example.com.', '9.example.com.'],
+            key=record_name_sort_key
+        )
+
+    def _send_get_request(self, path, params, headers):
+        self.get_requests.append((path, params))
+        if 'ZBAD' in path:
+            raise NoSuchHostedZoneError('No hosted zone found with ID: ZBAD', code='NoSuchHostedZone')
+        start = 0
+        if params.get('name'):
+            key = record_name_sort_key(params['name'])
+            while start < len(self.names) and record_name_sort_key(self.names[start]) < key:
+                start += 1
+        end = start + params['maxitems']
+
+        body = ''.join(
+            '<ResourceRecordSet><Name>%s</Name><Type>A</Type><TTL>60</TTL>'
+            '<ResourceRecords><ResourceRecord><Value>10.0.0.1</Value>'
+            '</ResourceRecord></ResourceRecords></ResourceRecordSet>' % name
+            for name in self.names[start:end]
+        )
+        marker = ''
+        if end < len(self.names):
+            marker = '<NextRecordName>%s</NextRecordName><NextRecordType>A</NextRecordType>' % (
+                self.names[end])
+        return (
+            '<ListResourceRecordSetsResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<ResourceRecordSets>%s</ResourceRecordSets>%s</ListResourceRecordSetsResponse>' % (
+                body, marker)
+        ).encode('utf-8')
+
+
+class ScanRecordSetsTestCase(BaseTestCase):
+    """
+    Tests for listing a zone several spans at a time.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ZoneTransport}
+
+    def setUp(self):
+        super(ScanRecordSetsTestCase, self).setUp()
+        self.zone = route53.hosted_zone.HostedZone(
+            self.conn, 'Z1', 'example.com.', 'ref', 0, None
+        )
+
+    def test_ordered(self):
+        for partitions in (1, 3, 8, 30):
+            rrsets = list(self.zone.scan_record_sets(
+                partitions=partitions, page_chunks=2
+            ))
+            self.assertEqual([rrset.name for rrset in rrsets], self.conn._transport.names)
+
+    def test_unordered(self):
+        rrsets = self.zone.scan_record_sets(
+            split_names=['m.example.com', 'g.example.com'], ordered=False, raw=True,
+            page_chunks=2,
+        )
+        self.assertEqual(
+            sorted(rrset.name for rrset in rrsets),
+            sorted(self.conn._transport.names)
+        )
+        # Each span started at its own split point.
+        starts = [params.get('name') for _, params in self.conn._transport.get_requests]
+        for start in (None, 'g.example.com.', 'm.example.com.'):
+            self.assertIn(start, starts)
+
+    def test_backpressure(self):
+        release = threading.Event()
+        pulled = []
+
+        def first():
+            release.wait(5)
+            yield 'first'
+
+        def second():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        items = parallel_chain([first(), second()], 2, buffer_size=5)
+        # Peeks, so the workers get going.
+        time.sleep(0.3)
+        # The second span waits for its turn, rather than piling up.
+        self.assertLessEqual(len(pulled), 6)
+        release.set()
+        self.assertEqual(list(items), ['first'] + list(range(100)))
+
+    def test_error_starting_iteration(self):
+        class Unlistable(object):
+            def __iter__(self):
+                raise ValueError('nope')
+
+        items = parallel_chain([['a'], Unlistable()], 2)
+        self.assertEqual(next(items), 'a')
+        self.assertRaises(ValueError, next, items)
+
+
+class SyncTestCase(BaseTestCase):
+    """
+    Tests for syncing a zone to a desired set of record sets.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ZoneTransport}
+
+    def setUp(self):
+        super(SyncTestCase, self).setUp()
+        self.zone = route53.hosted_zone.HostedZone(
+            self.conn, 'Z1', 'example.com.', 'ref', 0, None
+        )
+        names = self.conn._transport.names
+        self.desired = [
+            {'name': name, 'rrset_type': 'A', 'records': ['10.0.0.1']}
+            for name in reversed(names) if name not in ('a0.example.com.', 'z4.example.com.')
+        ]
+        self.desired[3]['records'] = ['10.0.0.2']
+        self.desired.append({'name': 'NEW.example.com', 'rrset_type': 'a', 'records': ['10.0.0.3']})
+        self.desired.append({'name': 'm2.example.com.', 'rrset_type': 'TXT', 'records': ['"hi"'], 'ttl': 300})
+
+    def test_dry_run(self):
+        plan = self.zone.sync(self.desired, dry_run=True, max_changes=2, page_chunks=7)
+        self.assertEqual(
+            sorted(rrset.name for rrset in plan.deletes),
+            ['a0.example.com.', 'z4.example.com.']
+        )
+        self.assertEqual([desired.name for live, desired in plan.modifies], [self.desired[3]['name']])
+        self.assertEqual(
+            sorted((rrset.name, rrset.rrset_type) for rrset in plan.creates),
+            [('m2.example.com.', 'TXT'), ('new.example.com.', 'A')]
+        )
+        self.assertEqual(plan.request_count, 3)
+        self.assertEqual(plan.change_infos, [])
+
+    def test_apply(self):
+        for _ in range(3):
+            self.conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submittedAt.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        plan = self.zone.sync(self.desired, max_changes=2)
+        self.assertEqual(len(plan), 5)
+        self.assertEqual(len(plan.change_infos), 3)
+        self.assertEqual(self.conn._transport.response, [])
+
+    def test_protected_and_unchanged(self):
+        live = [
+            RawResourceRecordSet('Z1', 'example.com.', 'NS', 172800, ('ns1.',), None, None, None, None, None, None, None),
+            RawResourceRecordSet('Z1', 'example.com.', 'SOA', 900, ('ns1. x. 1 2 3 4 5',), None, None, None, None, None, None, None),
+            RawResourceRecordSet('Z1', 'www.example.com.', 'A', 60, ('10.0.0.2', '10.0.0.1'), None, '10', None, None, None, None, None),
+        ]
+        desired = [to_raw_record_set(
+            {'name': 'WWW.example.com', 'rrset_type': 'A', 'records': ['10.0.0.1', '10.0.0.2'], 'weight': 10}, 'Z1'
+        )]
+        self.assertEqual(list(diff_record_sets(live, desired, 'example.com.')), [])
+
+    def test_zero_ttl(self):
+        live = [
+            RawResourceRecordSet('Z1', 'a.example.com.', 'A', 60, ('10.0.0.1',), None, None, None, None, None, None, None),
+            RawResourceRecordSet('Z1', 'b.example.com.', 'A', 0, ('10.0.0.1',), None, None, None, None, None, None, None),
+        ]
+        desired = to_raw_record_set(
+            {'name': 'a.example.com.', 'rrset_type': 'A', 'records': ['10.0.0.1'], 'ttl': 0}, 'Z1')
+        self.assertEqual(desired.ttl, 0)
+
+        plan = SyncPlan(self.zone)
+        for change in diff_record_sets(live, [desired], 'example.com.'):
+            plan.add(*change)
+        self.assertEqual(plan.modifies, [(live[0], desired)])
+        self.assertEqual(plan.deletes, [live[1]])
+
+        body = change_resource_record_set_writer(self.conn, plan.build_batch().change_set)
+        self.assertEqual(body.count(b'<TTL>0</TTL>'), 2)
+        self.assertNotIn(b'<TTL>None</TTL>', body)
+
+    def test_unsupported_types_are_skipped(self):
+        caa = RawResourceRecordSet('Z1', 'example.com.', 'CAA', 300, ('0 issue "amazon.com"',), None, None, None, None, None, None, None)
+        ds = to_raw_record_set({'name': 'sub.example.com.', 'rrset_type': 'DS', 'records': ['1 2 3 ABCD']}, 'Z1')
+        plan = SyncPlan(self.zone)
+        for change in diff_record_sets([caa], [ds], 'example.com.'):
+            plan.add(*change)
+
+        self.assertEqual(len(plan), 0)
+        self.assertEqual(plan.skipped, [(caa, None), (None, ds)])
+        self.assertEqual(len(plan.build_batch()), 0)
+
+class HarvestRecordSetsTestCase(BaseTestCase):
+    """
+    Tests for listing many zones at once.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ZoneTransport}
+
+    def test_harvest(self):
+        progress = []
+        errors = []
+        pairs = list(self.conn.harvest_record_sets(
+            ['Z1', 'ZBAD', 'Z2'], max_workers=2, page_chunks=4,
+            on_progress=lambda *args: progress.append(args),
+            on_error=lambda zone, exc: errors.append((zone, type(exc))),
+        ))
+
+        names = self.conn._transport.names
+        for zone_id in ('Z1', 'Z2'):
+            self.assertEqual(
+                [rrset.name for zone, rrset in pairs if zone == zone_id], names
+            )
+        self.assertEqual(errors, [('ZBAD', NoSuchHostedZoneError)])
+        self.assertEqual(
+            sorted(progress, key=lambda args: args[2])[-1][2:], (3, 3)
+        )
+        self.assertEqual(
+            sorted((zone, count) for zone, count, _, _ in progress),
+            [('Z1', len(names)), ('Z2', len(names)), ('ZBAD', None)]
+        )
+
+    def test_failures_raised_at_end(self):
+        pairs = []
+        try:
+            for pair in self.conn.harvest_record_sets(['ZBAD', 'Z1']):
+                pairs.append(pair)
+        except HarvestError as exc:
+            self.assertEqual([zone for zone, _ in exc.failures], ['ZBAD'])
+        else:
+            self.fail('HarvestError not raised')
+        # The healthy zone was still listed in full.
+        self.assertEqual(len(pairs), len(self.conn._transport.names))
+
+
+class ResponseCacheTestCase(BaseTestCase):
+    """
+    Tests for the opt-in response cache.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport, 'cache_ttl':60}
+
+    def test_ttl_and_lru(self):
+        now = [100.0]
+        cache = ResponseCache(ttl=10, max_entries=2, clock=lambda: now[0])
+        first = cache.make_key('hostedzone/Z1', {})
+        second = cache.make_key('hostedzone/Z2', {})
+        third = cache.make_key('hostedzone/Z3', {})
+        self.assertIsNone(cache.make_key('change/C1', {}))
+
+        cache.put(first, 'one', cache.generation)
+        cache.put(second, 'two', cache.generation)
+        # Touching the first makes the second the least recently used.
+        self.assertEqual(cache.get(first), 'one')
+        cache.put(third, 'three', cache.generation)
+        self.assertIsNone(cache.get(second))
+
+        now[0] += 11
+        self.assertIsNone(cache.get(first))
+        self.assertEqual(cache.stats(), {
+            'hits': 1, 'misses': 2, 'evictions': 1, 'invalidations': 0,
+            'entries': 1,
+        })
+
+        # Responses to requests sent before a write aren't stored.
+        generation = cache.generation
+        cache.invalidate('hostedzone/Z1/rrset')
+        cache.put(first, 'stale', generation)
+        self.assertIsNone(cache.get(first))
+
+    def test_invalidate(self):
+        cache = ResponseCache(ttl=10)
+        for path in ('hostedzone', 'hostedzone/Z1', 'hostedzone/Z1/rrset',
+                     'hostedzone/Z10', 'healthcheck/H1'):
+            cache.put(cache.make_key(path, {}), path, cache.generation)
+
+        cache.invalidate('hostedzone/Z1/rrset')
+        self.assertEqual(
+            sorted(key[0] for key in cache._entries),
+            ['healthcheck/H1', 'hostedzone/Z10']
+        )
+
+    def test_reads_cached_until_write(self):
+        transport = self.conn._transport
+        transport.set_response_from_file('GetHostedZoneResponse.xml')
+        transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        for _ in range(2):
+            self.conn.get_hosted_zone_by_id('Z1')
+            records = list(self.conn._list_resource_record_sets_by_zone_id('Z1'))
+        self.assertEqual(len(transport.get_requests), 2)
+        self.assertEqual(self.conn.cache_info()['hits'], 2)
+
+        zone = route53.hosted_zone.HostedZone(
+            self.conn, 'Z1', self.test_zone_name, 'ref', len(records), None
+        )
+        transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submittedAt.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        zone.create_a_record(name='test.' + self.test_zone_name, values=['8.8.8.8'])
+
+        transport.set_response_from_file('ListResourceRecordSetsResponse.xml')
+        self.assertEqual(
+            len(list(self.conn._list_resource_record_sets_by_zone_id('Z1'))),
+            len(records)
+        )
+        self.assertEqual(len(transport.get_requests), 3)
+
+        self.conn.clear_cache()
+        self.assertEqual(self.conn.cache_info()['entries'], 0)
+
+class BlockingTransport(DummyTransport):
+    """
+    Holds GET requests until ``release`` is set.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(BlockingTransport, self).__init__(*args, **kwargs)
+        self.release = threading.Event()
+
+    def _send_get_request(self, path, params, headers):
+        self.release.wait(5)
+        return super(BlockingTransport, self)._send_get_request(path, params, headers)
+
+
+class SingleFlightTestCase(BaseTestCase):
+    """
+    Tests for sharing identical GET requests that are in flight together.
+    """
+    CONNECTION_OPTIONS = {'transport_class':BlockingTransport}
+
+    def test_concurrent_gets_share_one_request(self):
+        transport = self.conn._transport
+        transport.set_response_from_file('GetHostedZoneResponse.xml')
+        zones = []
+        threads = [
+            threading.Thread(
+                target=lambda: zones.append(self.conn.get_hosted_zone_by_id('Z1'))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Let the request through once the others are waiting on it.
+        deadline = time.time() + 5
+        while self.conn.single_flight_info()['saved'] < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        transport.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(zones), 4)
+        self.assertEqual(len(transport.get_requests), 1)
+        self.assertEqual(self.conn.single_flight_info(), {'sent': 1, 'saved': 3})
+
+        # Once done, the next request goes out on its own.
+        transport.set_response_from_file('GetHostedZoneResponse.xml')
+        self.conn.get_hosted_zone_by_id('Z1')
+        self.assertEqual(len(transport.get_requests), 2)
+
+    def test_disabled(self):
+        conn = get_route53_connection(
+            transport_class=DummyTransport, coalesce_requests=False
+        )
+        self.assertIsNone(conn.single_flight_info())
+
+class ChangeStatusTransport(DummyTransport):
+    """
+    Answers GetChange requests from a list of statuses per change ID, the
+    last of which sticks.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ChangeStatusTransport, self).__init__(*args, **kwargs)
+        self.statuses = {}
+
+    def _send_get_request(self, path, params, headers):
+        self.get_requests.append((path, params))
+        change_id = path.rsplit('/', 1)[-1]
+        statuses = self.statuses[change_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        body = (
+            '<GetChangeResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<ChangeInfo><Id>/change/%s</Id><Status>%s</Status>'
+            '<SubmittedAt>2013-01-01T00:00:00Z</SubmittedAt></ChangeInfo>'
+            '</GetChangeResponse>' % (change_id, status)
+        )
+        return body.encode('utf-8')
+
+
+class ChangeInfoTestCase(BaseTestCase):
+    """
+    Tests for looking up changes, and waiting for them to be applied.
+    """
+    CONNECTION_OPTIONS = {'transport_class':ChangeStatusTransport}
+
+    def setUp(self):
+        super(ChangeInfoTestCase, self).setUp()
+        self.conn._change_waiter = ChangeWaiter(
+            self.conn, base_delay=0.01, max_delay=0.04)
+
+    def test_get_change(self):
+        conn = get_route53_connection(transport_class=DummyTransport)
+        conn._transport.set_response_from_file('GetChangeResponse.xml', SubmittedAt=self.submittedAt.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        change_info = conn.get_change('/change/C2682N5HXP0BZ4')
+        self.assertEqual(conn._transport.get_requests[0][0], 'change/C2682N5HXP0BZ4')
+        self.assertEqual(change_info['request_status'], 'PENDING')
+        self.assertFalse(change_info.is_insync)
+        self.assertIs(change_info.connection, conn)
+
+    def test_wait_until_insync(self):
+        transport = self.conn._transport
+        transport.statuses['C1'] = ['PENDING', 'PENDING', 'INSYNC']
+        change_info = self.conn.get_change('C1')
+
+        self.assertIs(change_info.wait_until_insync(timeout=5), change_info)
+        self.assertTrue(change_info.is_insync)
+        self.assertEqual(len(transport.get_requests), 3)
+
+        # Nothing left to poll once it's in sync.
+        change_info.wait_until_insync()
+        self.assertEqual(len(transport.get_requests), 3)
+
+    def test_many_changes_share_one_waiter(self):
+        transport = self.conn._transport
+        for i in range(50):
+            transport.statuses['C%d' % i] = ['PENDING'] * (i % 4) + ['INSYNC']
+        waiter = self.conn.change_waiter
+        futures = [waiter.watch('/change/C%d' % i) for i in range(50)]
+        # The same change isn't watched twice.
+        self.assertIs(waiter.watch('C0'), futures[0])
+
+        for i, future in enumerate(futures):
+            self.assertEqual(future.result(5)['request_id'], '/change/C%d' % i)
+        self.assertEqual(waiter.pending(), 0)
+        self.assertEqual(waiter.polls, sum(i % 4 + 1 for i in range(50)))
+
+    def test_poll_failure_goes_to_future(self):
+        # No statuses for this change, so polling it fails.
+        future = self.conn.change_waiter.watch('C404')
+        self.assertRaises(KeyError, future.result, 5)
+        self.assertEqual(self.conn.change_waiter.pending(), 0)
+
+    def test_timeout(self):
+        self.conn._transport.statuses['C1'] = ['PENDING']
+        change_info = self.conn.get_change('C1')
+        self.assertRaises(ChangeTimeoutError, change_info.wait_until_insync, timeout=0.05)
+        self.assertEqual(change_info['request_status'], 'PENDING')
+
+
+class RateLimitTestCase(BaseTestCase):
+    """
+    Tests for the client-side rate limiter.
+    """
+    CONNECTION_OPTIONS = {'transport_class':DummyTransport, 'rate_limit':5}
+
+    def test_token_bucket(self):
+        now = [100.0]
+        bucket = TokenBucket(rate=5, burst=2, clock=lambda: now[0])
+
+        # The burst goes out right away.
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        # After that, each caller waits for its own token, in order.
+        self.assertAlmostEqual(bucket.reserve(), 0.2)
+        self.assertAlmostEqual(bucket.reserve(), 0.4)
+
+        # A quiet second refills the bucket, but only up to the burst size.
+        now[0] += 1.4
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+    def test_file_token_bucket_is_shared(self):
+        now = [100.0]
+        path = os.path.join(tempfile.mkdtemp(), 'bucket')
+        # Two handles on the same file, like two worker processes.
+        first = FileTokenBucket(path, rate=5, burst=2, clock=lambda: now[0])
+        second = FileTokenBucket(path, rate=5, burst=2, clock=lambda: now[0])
+
+        self.assertEqual(first.reserve(), 0)
+        self.assertEqual(second.reserve(), 0)
+        # The burst is used up between the two of them.
+        self.assertAlmostEqual(first.reserve(), 0.2)
+        self.assertAlmostEqual(second.reserve(), 0.4)
+
+        now[0] += 1
+        self.assertAlmostEqual(second.reserve(), 0)
+
+    def test_custom_rate_limiter(self):
+        limiter = TokenBucket(rate=1)
+        conn = get_route53_connection(rate_limiter=limiter, rate_limit=10)
+        self.assertIs(conn._rate_limiter, limiter)
+
+    def test_requests_draw_from_limiter(self):
+        taken = []
+
+        class CountingLimiter(object):
+            def acquire(self, tokens=1):
+                taken.append(tokens)
+
+        self.assertIsInstance(self.conn._rate_limiter, TokenBucket)
+        self.conn._rate_limiter = CountingLimiter()
+        self.conn._transport.set_response('<Response/>')
+        self.conn._transport.set_response('<Response/>')
+        self.conn._transport.send_request('hostedzone', {}, 'GET')
+        self.conn._transport.send_request('hostedzone/Z1', {}, 'DELETE')
+        self.assertEqual(taken, [1, 1])
+
+
+class ErrorTransport(DummyTransport):
+    """
+    Hands out ``(status, body)`` pairs, running them through the same error
+    checks as the real transports.
+    """
+
+    def set_error(self, status, body):
+        self.response.append((status, body))
+
+    def _pop(self):
+        response = self.response.pop(0)
+        if isinstance(response, tuple):
+            self._check_response(*response)
+        return response
+
+    def _send_get_request(self, path, params, headers):
+        return self._pop()
+
+    def _send_post_request(self, path, params, headers):
+        return self._pop()
+
+    def _send_delete_request(self, path, headers):
+        return self._pop()
+
+
+class RetryTestCase(BaseTestCase):
+    """
+    Tests for typed API errors and retries.
+    """
+    CONNECTION_OPTIONS = {
+        'transport_class':ErrorTransport,
+        'retry_policy':RetryPolicy(max_attempts=3, random_func=lambda low, high: 0),
+    }
+
+    THROTTLED = (
+        '<ErrorResponse xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+        '<Error><Type>Sender</Type><Code>Throttling</Code>'
+        '<Message>Rate exceeded</Message></Error>'
+        '<RequestId>req-1</RequestId></ErrorResponse>'
+    )
+
+    def test_retries_throttling(self):
+        self.conn._transport.set_error(400, self.THROTTLED)
+        self.conn._transport.set_error(400, self.THROTTLED)
+        self.conn._transport.set_response('<Response/>')
+        self.assertEqual(
+            self.conn._transport.send_request('hostedzone', {}, 'GET'),
+            b'<Response/>'
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        for _ in range(3):
+            self.conn._transport.set_error(400, self.THROTTLED)
+        try:
+            self.conn._transport.send_request('hostedzone', {}, 'GET')
+        except ThrottlingError as exc:
+            self.assertEqual(exc.code, 'Throttling')
+            self.assertEqual(exc.request_id, 'req-1')
+            self.assertEqual(exc.status, 400)
+            self.assertTrue(exc.retryable)
+        else:
+            self.fail('ThrottlingError not raised')
+        self.assertEqual(self.conn._transport.response, [])
+
+    def test_no_retry_for_invalid_change_batch(self):
+        self.conn._transport.set_error(
+            400,
+            '<InvalidChangeBatch xmlns="https://route53.amazonaws.com/doc/2013-04-01/">'
+            '<Messages><Message>Tried to create a resource record set that already exists</Message></Messages>'
+            '</InvalidChangeBatch>'
+        )
+        self.conn._transport.set_response('<Response/>')
+        self.assertRaises(
+            InvalidChangeBatchError,
+            self.conn._transport.send_request, 'hostedzone/Z1/rrset', b'', 'POST'
+        )
+        # Nothing was retried.
+        self.assertEqual(len(self.conn._transport.response), 1)
+
+    def test_unknown_5xx_is_retryable(self):
+        error = parse_error_body('<html>Bad Gateway</html>', status=502)
+        self.assertIsInstance(error, ServiceError)
+        self.assertTrue(error.retryable)
+
+    def test_transport_errors(self):
+        class FailingSession(object):
+            calls = 0
+            def request(self, method, url, **kwargs):
+                self.calls += 1
+                raise self.error
+
+        conn = get_route53_connection(
+            retry_policy=RetryPolicy(max_attempts=3, random_func=lambda low, high: 0)
+        )
+        session = conn._transport._session = FailingSession()
+
+        # The POST may have reached Route53, so it isn't sent again.
+        session.error = requests.ReadTimeout('Read timed out.')
+        self.assertRaises(
+            TransportError,
+            conn._transport.send_request, 'hostedzone/Z1/rrset', b'', 'POST'
+        )
+        self.assertEqual(session.calls, 1)
+
+        # Unless it never went out.
+        session.calls = 0
+        session.error = requests.ConnectTimeout('Connect timed out.')
+        self.assertRaises(
+            TransportError,
+            conn._transport.send_request, 'hostedzone/Z1/rrset', b'', 'POST'
+        )
+        self.assertEqual(session.calls, 3)
+
+        # GETs are always safe to send again.
+        session.calls = 0
+        session.error = requests.ReadTimeout('Read timed out.')
+        self.assertRaises(
+            TransportError, conn._transport.send_request, 'hostedzone', {}, 'GET'
+        )
+        self.assertEqual(session.calls, 3)
@@ -31,3 +31,40 @@ class UtilTestCase(unittest.TestCase):
         self.assertEqual(parse_iso_8601_time_str('2013-07-28T01:00:01.001Z'),
             datetime.datetime(2013, 7, 28, 1, 0, 1, 1000, \
             tzinfo=UTC()))
+
+    def test_normalize_record_name(self):
+        """
+        Names are put into the form the API lists them in.
+        """
+        from route53.util import normalize_record_name
+        self.assertEqual(normalize_record_name('WWW.Example.com'), 'www.example.com.')
+        self.assertEqual(normalize_record_name('*.example.com.'), '\\052.example.com.')
+        self.assertEqual(normalize_record_name('\\052.example.com.'), '\\052.example.com.')
+
+    def test_record_name_sort_key(self):
+        """
+        Subtrees sort together, as they do in record set listings.
+        """
+        from route53.util import record_name_sort_key
+        self.assertEqual(record_name_sort_key('www.example.com.'), 'com.example.www.')
+        names = ['feu.example.com.', 'www.eu.example.com.', 'eu.example.com.',
+                 'example.com.', 'eu-west.example.com.']
+        self.assertEqual(
+            sorted(names, key=record_name_sort_key),
+            ['example.com.', 'eu-west.example.com.', 'eu.example.com.',
+             'www.eu.example.com.', 'feu.example.com.']
+        )
+
+    def test_request_key(self):
+        """
+        Param order and unset params don't make for different requests.
+        """
+        from route53.util import request_key
+        self.assertEqual(
+            request_key('hostedzone/Z1/rrset', {'name': 'a.com.', 'type': None, 'maxitems': 100}),
+            request_key('hostedzone/Z1/rrset', {'maxitems': 100, 'name': 'a.com.'})
+        )
+        self.assertNotEqual(
+            request_key('hostedzone/Z1/rrset', {'maxitems': 100}),
+            request_key('hostedzone/Z2/rrset', {'maxitems': 100})
+        )